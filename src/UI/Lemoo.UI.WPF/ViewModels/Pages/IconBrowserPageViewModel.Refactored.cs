@@ -268,7 +268,8 @@ namespace Lemoo.UI.WPF.ViewModels.Pages
                 query = query.Where(icon =>
                     icon.Name.ToLower().Contains(searchLower) ||
                     icon.Category.ToLower().Contains(searchLower) ||
-                    icon.IconInfo.KeywordsLower.Any(k => k.Contains(searchLower)));
+                    icon.IconInfo.KeywordsLower.Any(k => k.Contains(searchLower)) ||
+                    icon.IconInfo.MatchesCodePoint(searchLower));
             }
 
             // 批量更新集合
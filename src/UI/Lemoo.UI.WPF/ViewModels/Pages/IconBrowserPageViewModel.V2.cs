@@ -221,7 +221,8 @@ namespace Lemoo.UI.WPF.ViewModels.Pages
                 query = query.Where(icon =>
                     icon.NameLower.Contains(searchLower) ||
                     icon.CategoryLower.Contains(searchLower) ||
-                    icon.KeywordsLower.Any(k => k.Contains(searchLower)));
+                    icon.KeywordsLower.Any(k => k.Contains(searchLower)) ||
+                    icon.MatchesCodePoint(searchLower));
             }
 
             // 批量更新集合（复用现有集合，减少内存分配）
@@ -7,6 +7,8 @@ namespace Lemoo.UI.Models.Icons
     /// </summary>
     public class IconInfo
     {
+        private string _glyph = "\u0000";
+        private string _codePointLower = "0000";
         private string _name = string.Empty;
         private string _category = "Uncategorized";
         private string[] _keywords = Array.Empty<string>();
@@ -22,7 +24,22 @@ namespace Lemoo.UI.Models.Icons
         /// <summary>
         /// 获取或设置图标的 Unicode 字符
         /// </summary>
-        public string Glyph { get; set; } = "\u0000";
+        public string Glyph
+        {
+            get => _glyph;
+            set
+            {
+                _glyph = value ?? "\u0000";
+                _codePointLower = _glyph.Length > 0
+                    ? char.ConvertToUtf32(_glyph, 0).ToString("x4")
+                    : string.Empty;
+            }
+        }
+
+        /// <summary>
+        /// 获取图标码点的十六进制表示（小写，如 "e72b"）
+        /// </summary>
+        public string CodePointLower => _codePointLower;
 
         /// <summary>
         /// 获取或设置图标的名称
@@ -80,6 +97,30 @@ namespace Lemoo.UI.Models.Icons
         /// 获取搜索关键字（小写，用于搜索）
         /// </summary>
         public string[] KeywordsLower => _keywordsLower;
+
+        /// <summary>
+        /// 判断搜索词是否正好是本图标的码点（e72b、ue72b、u+e72b、\ue72b、0xe72b）
+        /// </summary>
+        /// <remarks>
+        /// 码点不再作为关键词存储，只做精确匹配，避免 "e7" 之类的输入匹配到大量图标。
+        /// </remarks>
+        /// <param name="searchLower">小写的搜索词</param>
+        public bool MatchesCodePoint(string searchLower)
+        {
+            var code = searchLower.Trim();
+            if (code.StartsWith("0x", StringComparison.Ordinal)
+                || code.StartsWith("u+", StringComparison.Ordinal)
+                || code.StartsWith("\\u", StringComparison.Ordinal))
+            {
+                code = code.Substring(2);
+            }
+            else if (code.StartsWith("u", StringComparison.Ordinal))
+            {
+                code = code.Substring(1);
+            }
+
+            return code == _codePointLower;
+        }
     }
 
     /// <summary>
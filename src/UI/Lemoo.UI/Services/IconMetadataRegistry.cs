@@ -355,7 +355,8 @@ namespace Lemoo.UI.Services
                 .Where(x => x.KeywordsLower.Any(k => k.Contains(term)) ||
                            x.NameLower.Contains(term) ||
                            x.CategoryLower.Contains(term) ||
-                           x.Kind.ToString().ToLower().Contains(term))
+                           x.Kind.ToString().ToLower().Contains(term) ||
+                           x.MatchesCodePoint(term))
                 .OrderBy(x => x.Name);
         }
 
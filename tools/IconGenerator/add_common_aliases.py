@@ -5,6 +5,8 @@
 import json
 import sys
 
+from json_output import write_json
+
 # 常用简化名称到完整名称的映射
 COMMON_ALIASES = {
     "Back": "ChromeBack",
@@ -314,8 +316,7 @@ def add_aliases_to_metadata(metadata_path, output_path):
                 print(f"Added alias: {simple_name} -> {full_name}")
 
     # 保存更新后的元数据
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json(output_path, data)
 
     print(f"\nAdded {added_count} aliases")
     print(f"Total icons: {len(data['icons'])}")
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark font_reader.py against fontTools on the bundled font.
+
+Cold-start numbers run each path in a fresh interpreter, so they include
+the import cost that every generator run pays. Warm numbers repeat the
+parse in-process with imports already cached.
+
+Usage:
+    python benchmark_font_reader.py [--runs N] [--font PATH]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+
+# Both snippets do what the generators need: cmap, glyph order, name, head
+COLD_START_SNIPPETS = {
+    "font_reader": (
+        "from font_reader import RawFontReader\n"
+        "f = RawFontReader(FONT)\n"
+        "f.get_best_cmap(); f.get_glyph_order(); f.get_best_full_name(); f.font_revision\n"
+        "f.close()\n"
+    ),
+    "fontTools": (
+        "from fontTools.ttLib import TTFont\n"
+        "f = TTFont(FONT)\n"
+        "f['cmap'].getBestCmap(); f.getGlyphOrder(); f['name'].getBestFullName(); f['head'].fontRevision\n"
+        "f.close()\n"
+    ),
+}
+
+
+def time_cold_start(snippet: str, font_path: Path, runs: int) -> list:
+    """
+    Time a snippet in fresh interpreters.
+
+    Args:
+        snippet: Python code to run; FONT is bound to the font path
+        font_path: Path to the font file
+        runs: Number of interpreter launches
+
+    Returns:
+        List of wall times in milliseconds
+    """
+    code = f"FONT = {str(font_path)!r}\n{snippet}"
+    tools_dir = str(Path(__file__).parent)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=tools_dir, check=True)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def time_warm(snippet: str, font_path: Path, runs: int) -> list:
+    """
+    Time a snippet in this process after a warm-up run.
+
+    Args:
+        snippet: Python code to run; FONT is bound to the font path
+        font_path: Path to the font file
+        runs: Number of repetitions
+
+    Returns:
+        List of wall times in milliseconds
+    """
+    compiled = compile(snippet, "<benchmark>", "exec")
+    namespace = {"FONT": str(font_path)}
+    exec(compiled, namespace)
+
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        exec(compiled, namespace)
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    default_font = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+
+    parser = argparse.ArgumentParser(description="Benchmark font_reader.py against fontTools")
+    parser.add_argument("--runs", type=int, default=10, help="Repetitions per measurement")
+    parser.add_argument("--font", type=Path, default=default_font, help="Font file to read")
+    args = parser.parse_args()
+
+    sys.path.insert(0, str(Path(__file__).parent))
+
+    print("=" * 60)
+    print("Font Reader Benchmark")
+    print("=" * 60)
+    print(f"Font: {args.font}")
+    print(f"Runs: {args.runs}")
+    print("-" * 60)
+    print(f"{'Path':<14} {'Mode':<12} {'Median ms':>10} {'Min ms':>10}")
+    print("-" * 60)
+
+    results = {}
+    for label, snippet in COLD_START_SNIPPETS.items():
+        for mode, timer in (("cold start", time_cold_start), ("warm", time_warm)):
+            try:
+                timings = timer(snippet, args.font, args.runs)
+            except (ImportError, subprocess.CalledProcessError) as e:
+                print(f"{label:<14} {mode:<12} {'skipped':>10}  ({e})")
+                continue
+            results[(label, mode)] = statistics.median(timings)
+            print(f"{label:<14} {mode:<12} {statistics.median(timings):>10.2f} {min(timings):>10.2f}")
+
+    print("-" * 60)
+    for mode in ("cold start", "warm"):
+        raw = results.get(("font_reader", mode))
+        ft = results.get(("fontTools", mode))
+        if raw and ft:
+            print(f"{mode:<12} speedup: {ft / raw:.1f}x")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark the n-gram search index against a linear Contains() scan.
+
+Replays typing: every query is entered one keystroke at a time and each
+prefix is searched twice, once with the index (search_index.py) and once
+by scanning every icon the way the icon browser does, testing each
+normalized search string with a substring check (plus an exact code point
+comparison). Both must return the same icons; the timings are per keystroke.
+
+Usage:
+    python benchmark_search.py [--metadata PATH] [--index PATH] [--runs N] [QUERY ...]
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from cjk_text import normalize_text
+from keywords import codepoint_query
+from metadata_stream import iter_icons
+from search_index import SearchIndex, icon_search_texts
+
+
+# Typical searches: English names and keywords, a category, Chinese names
+DEFAULT_QUERIES = [
+    "arrow", "chevron", "settings", "delete", "calendar", "mail",
+    "volume", "keyboard", "navigation", "设置", "箭头", "0xe72b",
+]
+
+
+def linear_search(icon_texts: List[List[str]], icon_codes: List[str], query: str) -> List[int]:
+    """
+    Find matching icons by scanning all of them.
+
+    Args:
+        icon_texts: Normalized search strings per icon, precomputed like KeywordsLower
+        icon_codes: Code point ("unicode") per icon
+        query: Search text
+
+    Returns:
+        Matching positions in metadata order
+    """
+    code = codepoint_query(query)
+    query = normalize_text(query).strip()
+    if not query:
+        return []
+    return [doc_id for doc_id, texts in enumerate(icon_texts)
+            if any(query in text for text in texts) or icon_codes[doc_id] == code]
+
+
+def time_keystrokes(search, queries: List[str], runs: int) -> Dict[str, float]:
+    """
+    Time a search function on every prefix of every query.
+
+    Args:
+        search: Function taking a query string
+        queries: Queries to type
+        runs: Repetitions per prefix; the fastest is kept
+
+    Returns:
+        Prefix -> milliseconds
+    """
+    timings = {}
+    for query in queries:
+        for end in range(1, len(query) + 1):
+            prefix = query[:end]
+            best = None
+            for _ in range(runs):
+                start = time.perf_counter()
+                search(prefix)
+                elapsed = (time.perf_counter() - start) * 1000
+                best = elapsed if best is None else min(best, elapsed)
+            timings[prefix] = best
+    return timings
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    default_metadata = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons" / "IconMetadata.json"
+
+    parser = argparse.ArgumentParser(description="Benchmark the search index against a linear scan")
+    parser.add_argument("queries", nargs="*", default=DEFAULT_QUERIES, help="Queries to type")
+    parser.add_argument("--metadata", type=Path, default=default_metadata, help="IconMetadata.json")
+    parser.add_argument("--index", type=Path, default=None,
+                        help="Index file (default: IconMetadata.search.json next to the metadata)")
+    parser.add_argument("--runs", type=int, default=20, help="Repetitions per keystroke")
+    args = parser.parse_args()
+
+    index_path = args.index or args.metadata.with_suffix(".search.json")
+
+    print("=" * 60)
+    print("Icon Search Benchmark")
+    print("=" * 60)
+
+    icons = list(iter_icons(args.metadata))
+    icon_texts = [icon_search_texts(icon) for icon in icons]
+    icon_codes = [icon["unicode"] for icon in icons]
+    start = time.perf_counter()
+    if index_path.exists():
+        index = SearchIndex.load(index_path)
+        print(f"Index: {index_path} ({index_path.stat().st_size} bytes)")
+    else:
+        index = SearchIndex.from_metadata(args.metadata)
+        print("Index: built in memory (no sidecar file)")
+    print(f"Index load: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"Icons: {len(icon_texts)}, terms: {len(index.terms)}, n-grams: {len(index.grams)}")
+
+    mismatches = [prefix for query in args.queries for prefix in (query[:n] for n in range(1, len(query) + 1))
+                  if index.search(prefix) != linear_search(icon_texts, icon_codes, prefix)]
+    if mismatches:
+        print(f"✗ Index and linear scan disagree on: {', '.join(mismatches)}")
+        return 1
+    print("✓ Index and linear scan return the same icons for every keystroke")
+
+    linear = time_keystrokes(lambda q: linear_search(icon_texts, icon_codes, q), args.queries, args.runs)
+    indexed = time_keystrokes(index.search, args.queries, args.runs)
+
+    print("-" * 60)
+    print(f"{'Keystroke':<14} {'Matches':>8} {'Linear ms':>10} {'Index ms':>10} {'Speedup':>8}")
+    print("-" * 60)
+    for prefix in linear:
+        speedup = linear[prefix] / indexed[prefix] if indexed[prefix] else float("inf")
+        print(f"{prefix:<14} {len(index.search(prefix)):>8} {linear[prefix]:>10.3f} {indexed[prefix]:>10.3f} {speedup:>7.1f}x")
+    print("-" * 60)
+    for label, timings in (("Linear scan", linear), ("Index", indexed)):
+        values = list(timings.values())
+        print(f"{label:<14} median {statistics.median(values):.3f} ms, max {max(values):.3f} ms per keystroke")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,403 @@
+#!/usr/bin/env python3
+"""
+Packed Binary Icon Catalog
+
+A versioned binary form of IconMetadata.json (IconMetadata.bin) that can be
+opened with mmap and queried without parsing: fixed-size icon records,
+a shared de-duplicated string table and integer arrays for keywords.
+Looking up a few code points or names touches only a handful of pages,
+so tools that need five icons no longer decode 900 KB of JSON, and the
+C# side can read the same file.
+
+Layout (little-endian; every section starts at a multiple of 8):
+
+    header      64 bytes
+        magic 'LMIC', u16 version, u16 record size,
+        u32 icon count, u32 category count, u32 string count, u32 keyword count,
+        u32 offsets of: string index, string data, categories, records,
+            keywords, name index;
+        16-byte source digest: first 16 bytes of the SHA-256 of the JSON
+            file the catalog was built from (zero if unknown)
+    string index    u32[string count + 1]   start of string i in string data
+    string data     UTF-8, strings i = data[index[i]:index[i + 1]]
+    categories      16 bytes each: u32 key, u32 name, u32 name_zh (string IDs), i32 priority
+    records         40 bytes each, sorted by code point:
+        u32 code point, u32 name, u32 en, u32 zh, u32 glyph, u32 alias_of,
+        u32 first keyword, u32 keyword count, u16 category index, u16 flags,
+        u32 namespace
+        (string IDs; 0xFFFFFFFF = none; flags: 1 = verified, 2 = alias record)
+    keywords        u32[keyword count]      string IDs, each record's run is contiguous
+    name index      u32[icon count]         record indices sorted by name
+
+Usage:
+    from binary_catalog import load_catalog
+
+    with load_catalog(metadata_path) as catalog:       # .bin next to the JSON if built from it, or the JSON itself
+        catalog.find_by_unicode("E72B")[0].name        # 'Back'
+        catalog.find_by_name("Home").category          # 'navigation'
+
+    python binary_catalog.py --metadata IconMetadata.json --output IconMetadata.bin
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Union
+
+from json_output import write_bytes
+
+
+MAGIC = b"LMIC"
+
+# Bump when the layout changes
+CATALOG_FORMAT_VERSION = 2
+
+HEADER = struct.Struct('<4sHHIIII6I16s')
+CATEGORY = struct.Struct('<IIIi')
+RECORD = struct.Struct('<8IHHI')
+U32 = struct.Struct('<I')
+
+NO_STRING = 0xFFFFFFFF
+
+NO_SOURCE = bytes(16)
+
+FLAG_VERIFIED = 1
+FLAG_ALIAS = 2
+
+
+class IconRecord(NamedTuple):
+    """One icon as stored in the binary catalog."""
+    unicode: str
+    name: str
+    category: str
+    keywords: List[str]
+    en: Optional[str]
+    zh: Optional[str]
+    glyph: Optional[str]
+    alias_of: Optional[str]
+    namespace: Optional[str]
+    verified: bool
+
+
+def _align(buffer: bytearray) -> int:
+    buffer.extend(b"\0" * (-len(buffer) % 8))
+    return len(buffer)
+
+
+def source_digest(path: Path) -> bytes:
+    """
+    Digest of the JSON file a catalog is built from (stored in the header).
+
+    Args:
+        path: IconMetadata.json
+
+    Returns:
+        First 16 bytes of the file's SHA-256
+    """
+    return hashlib.sha256(Path(path).read_bytes()).digest()[:16]
+
+
+def build_catalog_bytes(metadata: Dict[str, Any], source: bytes = NO_SOURCE) -> bytes:
+    """
+    Encode a metadata document as a binary catalog.
+
+    Args:
+        metadata: IconMetadata.json document
+        source: Source digest of the JSON file the document was read from or written to
+
+    Returns:
+        Catalog bytes
+    """
+    strings: Dict[str, int] = {}
+
+    def string_id(text: Optional[str]) -> int:
+        if text is None:
+            return NO_STRING
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+
+    categories = list(metadata.get("categories", []))
+    category_index = {category["key"]: index for index, category in enumerate(categories)}
+    for icon in metadata["icons"]:
+        if icon["category"] not in category_index:
+            category_index[icon["category"]] = len(categories)
+            categories.append({"key": icon["category"], "name": icon["category"], "name_zh": "", "priority": 999})
+
+    category_rows = [CATEGORY.pack(string_id(c["key"]), string_id(c["name"]), string_id(c.get("name_zh")),
+                                   c.get("priority", 999)) for c in categories]
+
+    icons = sorted(metadata["icons"], key=lambda icon: int(icon["unicode"], 16))
+    records = []
+    keyword_ids: List[int] = []
+    for icon in icons:
+        keywords = icon.get("keywords", [])
+        i18n = icon.get("i18n", {})
+        flags = (FLAG_VERIFIED if icon.get("verified") else 0) | (FLAG_ALIAS if icon.get("alias_of") else 0)
+        records.append(RECORD.pack(
+            int(icon["unicode"], 16), string_id(icon["name"]), string_id(i18n.get("en")), string_id(i18n.get("zh")),
+            string_id(icon.get("glyph")), string_id(icon.get("alias_of")), len(keyword_ids), len(keywords),
+            category_index[icon["category"]], flags, string_id(icon.get("namespace"))))
+        keyword_ids.extend(string_id(keyword) for keyword in keywords)
+
+    name_index = sorted(range(len(icons)), key=lambda index: icons[index]["name"])
+
+    encoded = [text.encode('utf-8') for text in strings]
+    string_offsets = [0]
+    for data in encoded:
+        string_offsets.append(string_offsets[-1] + len(data))
+
+    body = bytearray(HEADER.size)
+    offsets = []
+    offsets.append(_align(body))
+    body += struct.pack(f'<{len(string_offsets)}I', *string_offsets)
+    offsets.append(_align(body))
+    body += b"".join(encoded)
+    offsets.append(_align(body))
+    body += b"".join(category_rows)
+    offsets.append(_align(body))
+    body += b"".join(records)
+    offsets.append(_align(body))
+    body += struct.pack(f'<{len(keyword_ids)}I', *keyword_ids)
+    offsets.append(_align(body))
+    body += struct.pack(f'<{len(name_index)}I', *name_index)
+    _align(body)
+
+    HEADER.pack_into(body, 0, MAGIC, CATALOG_FORMAT_VERSION, RECORD.size, len(icons), len(categories),
+                     len(strings), len(keyword_ids), *offsets, source)
+    return bytes(body)
+
+
+def write_catalog(path: Path, metadata: Dict[str, Any], source: Optional[Path] = None) -> bool:
+    """
+    Write a binary catalog unless the file already has exactly these bytes.
+
+    Args:
+        path: Output file
+        metadata: IconMetadata.json document
+        source: The JSON file holding the same document; its digest lets
+            load_catalog() tell whether the catalog is still current
+
+    Returns:
+        True if the file was written
+    """
+    return write_bytes(path, build_catalog_bytes(metadata, source_digest(source) if source else NO_SOURCE))
+
+
+class IconCatalog:
+    """Read-only view of a binary catalog; nothing is decoded until asked for."""
+
+    def __init__(self, buffer: Union[bytes, mmap.mmap]):
+        """
+        Initialize the view.
+
+        Args:
+            buffer: Catalog bytes or an mmap of a catalog file
+        """
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        (magic, version, record_size, self.icon_count, self.category_count, self.string_count,
+         self.keyword_count, self._strings_index, self._strings_data, self._categories, self._records,
+         self._keywords, self._name_index, self.source_digest) = HEADER.unpack_from(self._view, 0)
+        if magic != MAGIC:
+            raise ValueError("Not an icon catalog")
+        if version != CATALOG_FORMAT_VERSION or record_size != RECORD.size:
+            raise ValueError(f"Unsupported icon catalog version {version}")
+
+    @classmethod
+    def open(cls, path: Path) -> "IconCatalog":
+        """
+        Map a catalog file into memory.
+
+        Args:
+            path: Catalog file
+
+        Returns:
+            IconCatalog
+        """
+        with open(path, 'rb') as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    @classmethod
+    def from_metadata(cls, metadata: Dict[str, Any]) -> "IconCatalog":
+        """Encode a metadata document in memory and open it."""
+        return cls(build_catalog_bytes(metadata))
+
+    def close(self) -> None:
+        """Release the mapping."""
+        self._view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def __enter__(self) -> "IconCatalog":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.icon_count
+
+    def string(self, string_id: int) -> Optional[str]:
+        """Decode one string of the string table (None for NO_STRING)."""
+        if string_id == NO_STRING:
+            return None
+        start, end = struct.unpack_from('<2I', self._view, self._strings_index + 4 * string_id)
+        return str(self._view[self._strings_data + start:self._strings_data + end], 'utf-8')
+
+    @property
+    def categories(self) -> List[Dict[str, Any]]:
+        """Category definitions in file order."""
+        result = []
+        for key, name, name_zh, priority in CATEGORY.iter_unpack(
+                self._view[self._categories:self._categories + CATEGORY.size * self.category_count]):
+            result.append({"key": self.string(key), "name": self.string(name),
+                           "name_zh": self.string(name_zh), "priority": priority})
+        return result
+
+    def _category_key(self, index: int) -> str:
+        (key,) = U32.unpack_from(self._view, self._categories + CATEGORY.size * index)
+        return self.string(key)
+
+    def code_point(self, index: int) -> int:
+        """Code point of a record, without decoding the rest of it."""
+        return U32.unpack_from(self._view, self._records + RECORD.size * index)[0]
+
+    def icon(self, index: int) -> IconRecord:
+        """
+        Decode one record.
+
+        Args:
+            index: Record index (records are sorted by code point)
+
+        Returns:
+            IconRecord
+        """
+        (code, name, en, zh, glyph, alias_of, first_keyword, keyword_count, category, flags,
+         namespace) = RECORD.unpack_from(self._view, self._records + RECORD.size * index)
+        keyword_ids = struct.unpack_from(f'<{keyword_count}I', self._view, self._keywords + 4 * first_keyword)
+        return IconRecord(
+            unicode=f"{code:04X}", name=self.string(name), category=self._category_key(category),
+            keywords=[self.string(keyword) for keyword in keyword_ids], en=self.string(en), zh=self.string(zh),
+            glyph=self.string(glyph), alias_of=self.string(alias_of), namespace=self.string(namespace),
+            verified=bool(flags & FLAG_VERIFIED))
+
+    def __iter__(self) -> Iterator[IconRecord]:
+        for index in range(self.icon_count):
+            yield self.icon(index)
+
+    def find_by_unicode(self, code: Union[int, str]) -> List[IconRecord]:
+        """
+        Find the records of a code point (binary search).
+
+        Args:
+            code: Code point as int or hex string ('E72B')
+
+        Returns:
+            Matching records (several for alias records or multi-font catalogs)
+        """
+        if isinstance(code, str):
+            code = int(code, 16)
+        lo = bisect.bisect_left(_Keys(self.icon_count, self.code_point), code)
+        result = []
+        while lo < self.icon_count and self.code_point(lo) == code:
+            result.append(self.icon(lo))
+            lo += 1
+        return result
+
+    def _name_at(self, position: int) -> str:
+        (index,) = U32.unpack_from(self._view, self._name_index + 4 * position)
+        (name,) = U32.unpack_from(self._view, self._records + RECORD.size * index + 4)
+        return self.string(name)
+
+    def find_by_name(self, name: str) -> Optional[IconRecord]:
+        """
+        Find a record by icon name (binary search over the name index).
+
+        Args:
+            name: Icon name (case-sensitive)
+
+        Returns:
+            The record, or None
+        """
+        position = bisect.bisect_left(_Keys(self.icon_count, self._name_at), name)
+        if position < self.icon_count and self._name_at(position) == name:
+            (index,) = U32.unpack_from(self._view, self._name_index + 4 * position)
+            return self.icon(index)
+        return None
+
+    def category_counts(self) -> Dict[str, int]:
+        """Icons per category key, counted from the record array alone."""
+        counts = [0] * self.category_count
+        records = self._view[self._records:self._records + RECORD.size * self.icon_count]
+        for row in RECORD.iter_unpack(records):
+            counts[row[8]] += 1
+        return {self._category_key(index): count for index, count in enumerate(counts)}
+
+
+class _Keys:
+    """Sequence adapter so bisect can search a computed key without materializing it."""
+
+    def __init__(self, length: int, key):
+        self._length = length
+        self._key = key
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int):
+        return self._key(index)
+
+
+def load_catalog(metadata_path: Path) -> IconCatalog:
+    """
+    Open the catalog of a metadata file.
+
+    Uses the .bin next to the JSON when it was built from the JSON as it is
+    now (its source digest matches the file; hashing is far cheaper than
+    parsing), otherwise encodes the JSON in memory. Modification times are
+    not used: unchanged outputs are not rewritten, so a current .bin may be
+    older than its JSON.
+
+    Args:
+        metadata_path: IconMetadata.json
+
+    Returns:
+        IconCatalog
+    """
+    metadata_path = Path(metadata_path)
+    binary_path = metadata_path.with_suffix(".bin")
+    if binary_path.exists():
+        catalog = IconCatalog.open(binary_path)
+        if not metadata_path.exists() or catalog.source_digest == source_digest(metadata_path):
+            return catalog
+        catalog.close()
+    with open(metadata_path, 'r', encoding='utf-8') as f:
+        return IconCatalog.from_metadata(json.load(f))
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Convert IconMetadata.json to a packed binary catalog")
+    parser.add_argument("--metadata", type=Path, required=True, help="IconMetadata.json")
+    parser.add_argument("--output", type=Path, default=None, help="Catalog file (default: .bin next to the JSON)")
+    args = parser.parse_args()
+
+    output = args.output or args.metadata.with_suffix(".bin")
+    with open(args.metadata, 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+    written = write_catalog(output, metadata, source=args.metadata)
+
+    with IconCatalog.open(output) as catalog:
+        print(f"{'✓ Wrote' if written else '✓ Unchanged'}: {output} ({output.stat().st_size} bytes)")
+        print(f"  {len(catalog)} icons, {catalog.category_count} categories, "
+              f"{catalog.string_count} strings, {catalog.keyword_count} keyword references")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,396 @@
+#!/usr/bin/env python3
+"""
+Multi-DPI Icon Sprite Atlas Generator
+
+Renders every icon in IconMetadata.json into packed PNG sprite atlases at
+16/24/32/48 px x 100/150/200% scale and writes an atlas index JSON with the
+pixel and UV rectangle of each icon, so list and grid views can draw icons
+from one bitmap instead of shaping a text glyph per cell.
+
+Rasterization is CPU-only: outlines are flattened to edge lists once per
+glyph, coverage is accumulated for all scanlines at once with NumPy
+(exact horizontally, supersampled vertically), and glyph batches are spread
+across a process pool.
+
+Pixel sizes shared by several size/scale pairs (e.g. 16px@150% and
+24px@100%) are rendered once: each entry in "atlases" points at a
+"pixel_sizes" entry holding the pages and per-icon rectangles. Icons with
+identical outlines (see find_duplicates.py) are also rendered once and
+share a rectangle.
+
+Requirements:
+    pip install numpy
+
+Usage:
+    python build_atlas.py [--sizes 16 24 32 48] [--scales 100 150 200]
+                          [--supersample 4] [--workers N] [--output-dir DIR]
+"""
+
+import argparse
+import math
+import os
+import struct
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from font_reader import Contour, open_font
+from glyph_outlines import contours_to_polygons, outline_hash
+from json_output import write_json
+from metadata_stream import iter_icons
+
+
+DEFAULT_SIZES = [16, 24, 32, 48]
+DEFAULT_SCALES = [100, 150, 200]
+
+# Transparent gap between cells so bilinear sampling never bleeds
+PADDING = 1
+
+MAX_ATLAS_DIMENSION = 4096
+
+
+def glyph_edges(contours: List[Contour], units_per_em: int, ascender: int, max_pixel_size: int) -> np.ndarray:
+    """
+    Flatten a glyph into a non-horizontal edge list in em units (y down).
+
+    The outline is flattened once, finely enough for the largest pixel size,
+    and reused for every smaller size.
+
+    Args:
+        contours: Decoded contours in font units
+        units_per_em: Font units per em
+        ascender: Font ascender in font units (maps to y=0)
+        max_pixel_size: Largest pixel size the edges will be rendered at
+
+    Returns:
+        float64 array of shape (edges, 4): x0, y0, x1, y1
+    """
+    # Flatten to within a tenth of a pixel at the largest size
+    polygons = contours_to_polygons(contours, tolerance=0.1 * units_per_em / max_pixel_size)
+    if not polygons:
+        return np.zeros((0, 4), dtype=np.float64)
+
+    starts = np.concatenate([np.asarray(p, dtype=np.float64) for p in polygons])
+    ends = np.concatenate([np.roll(np.asarray(p, dtype=np.float64), -1, axis=0) for p in polygons])
+    edges = np.empty((len(starts), 4), dtype=np.float64)
+    edges[:, 0] = starts[:, 0] / units_per_em
+    edges[:, 1] = (ascender - starts[:, 1]) / units_per_em
+    edges[:, 2] = ends[:, 0] / units_per_em
+    edges[:, 3] = (ascender - ends[:, 1]) / units_per_em
+    return edges[edges[:, 1] != edges[:, 3]]
+
+
+def rasterize_edges(edge_lists: List[np.ndarray], pixel_size: int, supersample: int = 4) -> np.ndarray:
+    """
+    Render a batch of edge lists into 8-bit coverage masks.
+
+    Each pixel row is sampled by `supersample` scanlines. Along a scanline,
+    coverage is exact: every edge crossing adds its winding direction split
+    between the pixel it falls in and the next one, so a running sum gives
+    the covered fraction of each pixel (nonzero rule, clamped to [0, 1]).
+    The whole batch is processed with one set of array operations.
+
+    Args:
+        edge_lists: Edge lists from glyph_edges()
+        pixel_size: Output width and height in pixels
+        supersample: Scanlines per pixel row
+
+    Returns:
+        uint8 array of shape (glyphs, pixel_size, pixel_size), 255 = fully covered
+    """
+    glyph_count = len(edge_lists)
+    scanlines = pixel_size * supersample
+    width = pixel_size + 2
+    if glyph_count == 0 or sum(len(e) for e in edge_lists) == 0:
+        return np.zeros((glyph_count, pixel_size, pixel_size), dtype=np.uint8)
+
+    edges = np.concatenate(edge_lists) * pixel_size
+    owner = np.repeat(np.arange(glyph_count), [len(e) for e in edge_lists])
+    x0, y0, x1, y1 = edges[:, 0], edges[:, 1], edges[:, 2], edges[:, 3]
+    direction = np.where(y1 > y0, 1.0, -1.0)
+
+    # Scanlines sit at (row + 0.5) / supersample; an edge crosses those with
+    # min(y) <= y < max(y). Expand each edge to its run of scanline rows.
+    low = np.minimum(y0, y1) * supersample
+    high = np.maximum(y0, y1) * supersample
+    first = np.clip(np.ceil(low - 0.5), 0, scanlines).astype(np.int64)
+    counts = np.clip(np.ceil(high - 0.5), 0, scanlines).astype(np.int64) - first
+    hit = np.repeat(np.arange(len(counts)), counts)
+    run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    rows = np.repeat(first, counts) + (np.arange(len(hit)) - run_starts)
+
+    scan_y = (rows + 0.5) / supersample
+    t = (scan_y - y0[hit]) / (y1[hit] - y0[hit])
+    x_at = np.clip(x0[hit] + t * (x1[hit] - x0[hit]), 0, pixel_size)
+
+    # Split each crossing between its pixel and the next one
+    column = np.floor(x_at)
+    fraction = x_at - column
+    flat = (owner[hit] * scanlines + rows) * width + column.astype(np.int64)
+    weights = direction[hit]
+    size = glyph_count * scanlines * width
+    accumulated = np.bincount(flat, weights * (1 - fraction), minlength=size)
+    accumulated += np.bincount(flat + 1, weights * fraction, minlength=size)
+
+    winding = np.cumsum(accumulated.reshape(glyph_count * scanlines, width), axis=1)[:, :pixel_size]
+    coverage = np.minimum(np.abs(winding), 1.0).reshape(glyph_count, pixel_size, supersample, pixel_size).mean(axis=2)
+    return np.round(coverage * 255).astype(np.uint8)
+
+
+def rasterize_glyph(contours: List[Contour], pixel_size: int, units_per_em: int,
+                    ascender: int, supersample: int = 4) -> np.ndarray:
+    """
+    Render a glyph's em box into an 8-bit coverage mask.
+
+    Args:
+        contours: Decoded contours in font units
+        pixel_size: Output width and height in pixels
+        units_per_em: Font units per em
+        ascender: Font ascender in font units (maps to the top row)
+        supersample: Scanlines per pixel row
+
+    Returns:
+        uint8 array of shape (pixel_size, pixel_size), 255 = fully covered
+    """
+    return rasterize_edges([glyph_edges(contours, units_per_em, ascender, pixel_size)], pixel_size, supersample)[0]
+
+
+def rasterize_batch(batch: List[Tuple[str, List[Contour]]], pixel_sizes: List[int], units_per_em: int,
+                    ascender: int, supersample: int) -> Dict[int, List[Tuple[str, np.ndarray]]]:
+    """
+    Rasterize a batch of glyphs at every pixel size (process pool worker).
+
+    Args:
+        batch: (unicode hex, contours) pairs
+        pixel_sizes: Pixel sizes to render
+        units_per_em: Font units per em
+        ascender: Font ascender in font units
+        supersample: Scanlines per pixel row
+
+    Returns:
+        Pixel size -> list of (unicode hex, mask)
+    """
+    largest = max(pixel_sizes)
+    codes = [unicode_hex for unicode_hex, _ in batch]
+    edge_lists = [glyph_edges(contours, units_per_em, ascender, largest) for _, contours in batch]
+
+    results: Dict[int, List[Tuple[str, np.ndarray]]] = {}
+    for size in pixel_sizes:
+        masks = rasterize_edges(edge_lists, size, supersample)
+        results[size] = list(zip(codes, masks))
+    return results
+
+
+def write_png(path: Path, alpha: np.ndarray) -> None:
+    """
+    Write a coverage mask as a grayscale+alpha PNG (black ink, alpha = coverage).
+
+    Args:
+        path: Output file
+        alpha: uint8 array of shape (height, width)
+    """
+    height, width = alpha.shape
+    pixels = np.zeros((height, width, 2), dtype=np.uint8)
+    pixels[:, :, 1] = alpha
+    # Filter type 0 (None) in front of every scanline
+    raw = np.concatenate([np.zeros((height, 1), dtype=np.uint8), pixels.reshape(height, width * 2)], axis=1)
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data) & 0xFFFFFFFF)
+
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(chunk(b'IHDR', struct.pack('>IIBBBBB', width, height, 8, 4, 0, 0, 0)))
+        f.write(chunk(b'IDAT', zlib.compress(raw.tobytes(), 6)))
+        f.write(chunk(b'IEND', b''))
+
+
+def pack_grid(count: int, cell: int) -> Tuple[int, int, int]:
+    """
+    Choose a near-square grid for equally sized cells.
+
+    Args:
+        count: Number of cells
+        cell: Cell size in pixels including padding
+
+    Returns:
+        (columns, rows per page, number of pages)
+    """
+    max_cells = max(1, MAX_ATLAS_DIMENSION // cell)
+    columns = min(max_cells, max(1, math.ceil(math.sqrt(count))))
+    rows = min(max_cells, math.ceil(count / columns))
+    pages = math.ceil(count / (columns * rows))
+    return columns, rows, pages
+
+
+def build_pages(masks: List[Tuple[str, np.ndarray]], pixel_size: int, output_dir: Path,
+                file_prefix: str) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Pack same-sized masks into atlas pages and write them as PNG.
+
+    Args:
+        masks: (unicode hex, mask) pairs
+        pixel_size: Mask size in pixels
+        output_dir: Directory for PNG files
+        file_prefix: Page file name prefix
+
+    Returns:
+        (page descriptors, unicode hex -> rect entry)
+    """
+    cell = pixel_size + PADDING * 2
+    columns, rows, page_count = pack_grid(len(masks), cell)
+    per_page = columns * rows
+
+    pages = []
+    rects: Dict[str, Dict[str, Any]] = {}
+    for page_index in range(page_count):
+        page_masks = masks[page_index * per_page:(page_index + 1) * per_page]
+        used_rows = math.ceil(len(page_masks) / columns)
+        width, height = columns * cell, used_rows * cell
+        atlas = np.zeros((height, width), dtype=np.uint8)
+
+        for slot, (unicode_hex, mask) in enumerate(page_masks):
+            x = (slot % columns) * cell + PADDING
+            y = (slot // columns) * cell + PADDING
+            atlas[y:y + pixel_size, x:x + pixel_size] = mask
+            rects[unicode_hex] = {
+                "page": page_index,
+                "rect": [x, y, pixel_size, pixel_size],
+                "uv": [round(x / width, 6), round(y / height, 6),
+                       round((x + pixel_size) / width, 6), round((y + pixel_size) / height, 6)],
+            }
+
+        file_name = f"{file_prefix}-{pixel_size}px-{page_index}.png"
+        write_png(output_dir / file_name, atlas)
+        pages.append({"file": file_name, "width": width, "height": height})
+
+    return pages, rects
+
+
+def load_icons(metadata_path: Path) -> Tuple[List[str], Dict[str, str]]:
+    """
+    Read the icons to render from IconMetadata.json.
+
+    Args:
+        metadata_path: Path to IconMetadata.json
+
+    Returns:
+        (unique unicode hex values in file order, icon name -> unicode hex)
+    """
+    codes: List[str] = []
+    seen = set()
+    names: Dict[str, str] = {}
+    for icon in iter_icons(metadata_path):
+        unicode_hex = icon['unicode'].upper()
+        names[icon['name']] = unicode_hex
+        if unicode_hex not in seen:
+            seen.add(unicode_hex)
+            codes.append(unicode_hex)
+    return codes, names
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    default_font = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+    default_metadata = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons" / "IconMetadata.json"
+
+    parser = argparse.ArgumentParser(description="Render icons into multi-DPI PNG sprite atlases")
+    parser.add_argument("--font", type=Path, default=default_font, help="Source font file")
+    parser.add_argument("--metadata", type=Path, default=default_metadata, help="IconMetadata.json")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Logical icon sizes in px")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="DPI scales in percent")
+    parser.add_argument("--supersample", type=int, default=4, help="Scanlines per pixel row")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes")
+    parser.add_argument("--output-dir", type=Path, default=Path(__file__).parent / "build" / "atlas",
+                        help="Output directory")
+    parser.add_argument("--prefix", default="icons", help="Atlas file name prefix")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Icon Sprite Atlas Generator")
+    print("=" * 60)
+    started = time.perf_counter()
+
+    codes, names = load_icons(args.metadata)
+    variants = [(size, scale, round(size * scale / 100)) for size in args.sizes for scale in args.scales]
+    pixel_sizes = sorted({pixel_size for _, _, pixel_size in variants})
+
+    with open_font(str(args.font)) as font:
+        cmap = font.get_best_cmap()
+        units_per_em, ascender = font.units_per_em, font.ascender
+        glyphs = []
+        rendered_as: Dict[str, str] = {}  # unicode hex -> unicode hex of the identical glyph rendered
+        first_by_hash: Dict[str, str] = {}
+        for unicode_hex in codes:
+            glyph_name = cmap.get(int(unicode_hex, 16))
+            if glyph_name is None:
+                print(f"Warning: U+{unicode_hex} not found in font, skipped")
+                continue
+            contours = font.get_glyph_contours(glyph_name)
+            representative = first_by_hash.setdefault(outline_hash(contours), unicode_hex)
+            rendered_as[unicode_hex] = representative
+            if representative == unicode_hex:
+                glyphs.append((unicode_hex, contours))
+        font_info = {"name": font.get_best_full_name(), "version": str(font.font_revision)}
+
+    print(f"Icons: {len(rendered_as)} ({len(glyphs)} unique outlines)")
+    print(f"Pixel sizes: {', '.join(str(s) for s in pixel_sizes)}")
+    print(f"Workers: {args.workers}")
+
+    # Several batches per worker keep the pool busy while results stream back
+    batch_size = max(1, math.ceil(len(glyphs) / (max(1, args.workers) * 4)))
+    batches = [glyphs[i:i + batch_size] for i in range(0, len(glyphs), batch_size)]
+
+    masks: Dict[int, Dict[str, np.ndarray]] = {size: {} for size in pixel_sizes}
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        futures = [pool.submit(rasterize_batch, batch, pixel_sizes, units_per_em, ascender, args.supersample)
+                   for batch in batches]
+        for future in futures:
+            for size, rendered in future.result().items():
+                masks[size].update(rendered)
+
+    args.output_dir.mkdir(parents=True, exist_ok=True)
+    pages_by_size = {}
+    rects_by_size = {}
+    for size in pixel_sizes:
+        ordered = [(unicode_hex, masks[size][unicode_hex]) for unicode_hex, _ in glyphs]
+        pages_by_size[size], rects = build_pages(ordered, size, args.output_dir, args.prefix)
+        rects_by_size[size] = {unicode_hex: rects[representative] for unicode_hex, representative in rendered_as.items()}
+
+    index = {
+        "font": font_info,
+        "padding": PADDING,
+        "atlases": [
+            {"key": f"{size}@{scale}", "size": size, "scale": scale / 100, "pixel_size": pixel_size}
+            for size, scale, pixel_size in variants
+        ],
+        "pixel_sizes": {
+            str(size): {"pages": pages_by_size[size], "icons": rects_by_size[size]}
+            for size in pixel_sizes
+        },
+        "names": {name: unicode_hex for name, unicode_hex in sorted(names.items()) if unicode_hex in rects_by_size[pixel_sizes[0]]},
+    }
+
+    index_path = args.output_dir / f"{args.prefix}-atlas.json"
+    write_json(index_path, index, compact=True)
+
+    elapsed = time.perf_counter() - started
+    print("\n" + "-" * 60)
+    for size in pixel_sizes:
+        total = sum((args.output_dir / page["file"]).stat().st_size for page in pages_by_size[size])
+        print(f"  {size:3d}px: {len(pages_by_size[size])} page(s), {total:>9} bytes")
+    print("-" * 60)
+    print(f"Index: {index_path}")
+    print(f"Done in {elapsed:.2f}s")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Multi-font Icon Catalog Builder
+
+Builds icon metadata for several fonts in one run (e.g. Segoe Fluent Icons,
+Segoe MDL2 Assets and in-house icon fonts) and merges it into a single
+catalog. Every font is processed in its own worker process, so total wall
+time stays close to that of the slowest font.
+
+Each font gets a namespace: its icons are tagged with it, and the catalog's
+"fonts" list records where every namespace came from (file, SHA-256, font
+name and version, generator, icon count).
+
+Fonts are processed with create_official_metadata.py when they are Segoe
+Fluent Icons (the documentation table only describes that font) and with
+parse_font.py otherwise, unless --generator forces one.
+
+Usage:
+    python build_catalog.py "path/to/Segoe Fluent Icons.ttf" "MDL2=path/to/segmdl2.ttf"
+    python build_catalog.py Fluent=fonts/fluent.ttf Brand=fonts/brand.ttf --output build/IconCatalog.json
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from binary_catalog import write_catalog
+from create_official_metadata import OfficialIconMetadataGenerator
+from font_cache import FontCache, file_sha256
+from metadata_shards import write_shards
+from metadata_stream import write_metadata_stream
+from parse_font import IconMetadataExtractor
+
+
+GENERATORS = ("auto", "official", "parse")
+
+# Full name of the font described by the official documentation table
+OFFICIAL_FONT_NAME = "Segoe Fluent Icons"
+
+
+def parse_font_spec(spec: str) -> Tuple[str, Path]:
+    """
+    Split a "[NAMESPACE=]PATH" command-line value.
+
+    Without an explicit namespace, one is derived from the file name
+    ('Segoe Fluent Icons.ttf' -> 'SegoeFluentIcons').
+
+    Args:
+        spec: Command-line value
+
+    Returns:
+        (namespace, font path)
+    """
+    namespace, sep, path = spec.partition("=")
+    if not sep:
+        namespace, path = "", spec
+    if not namespace:
+        namespace = "".join(word[:1].upper() + word[1:] for word in re.split(r'[^0-9A-Za-z]+', Path(path).stem))
+    if not re.fullmatch(r'[A-Za-z_][0-9A-Za-z_]*', namespace):
+        raise ValueError(f"Invalid namespace '{namespace}' (use a C# identifier)")
+    return namespace, Path(path)
+
+
+def build_font_catalog(namespace: str, font_path: Path, generator: str, use_cache: bool) -> Dict[str, Any]:
+    """
+    Generate metadata for one font (process pool worker).
+
+    Console output of the generator is captured and returned so parallel
+    builds do not interleave their logs.
+
+    Args:
+        namespace: Namespace for the font's icons
+        font_path: Font file
+        generator: 'auto', 'official' or 'parse'
+        use_cache: Reuse decoded font data from the font cache
+
+    Returns:
+        Dictionary with "source" (provenance), "categories", "icons",
+        "log" and "elapsed"
+    """
+    started = time.perf_counter()
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        if generator == "auto":
+            extractor = IconMetadataExtractor(str(font_path), use_cache=use_cache)
+            try:
+                extractor.load_font()
+                font_name = extractor.font.get_best_full_name()
+            finally:
+                extractor.close()
+            generator = "official" if font_name == OFFICIAL_FONT_NAME else "parse"
+
+        if generator == "official":
+            builder = OfficialIconMetadataGenerator(str(font_path), use_cache=use_cache)
+            try:
+                builder.parse_documentation()
+                builder.get_font_glyphs()
+                icons = builder.generate_metadata()
+                metadata = builder.build_metadata(icons)
+            finally:
+                builder.close()
+        else:
+            builder = IconMetadataExtractor(str(font_path), use_cache=use_cache)
+            try:
+                icons = builder.extract_all_icons()
+                metadata = builder.build_metadata(icons)
+            finally:
+                builder.close()
+
+    source = {
+        "namespace": namespace,
+        "name": metadata["font"]["name"],
+        "version": metadata["font"]["version"],
+        "file": font_path.name,
+        "sha256": FontCache().font_hash(font_path) if use_cache else file_sha256(font_path),
+        "generator": "create_official_metadata.py" if generator == "official" else "parse_font.py",
+        "icon_count": len(icons),
+    }
+
+    return {
+        "source": source,
+        "categories": metadata["categories"],
+        "icons": icons,
+        "log": log.getvalue(),
+        "elapsed": time.perf_counter() - started,
+    }
+
+
+def merge_catalogs(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Merge per-font results into one catalog.
+
+    Icons keep their fields and gain a "namespace"; categories are merged
+    by key (first definition wins) and sorted by priority.
+
+    Args:
+        results: Outputs of build_font_catalog, in command-line order
+
+    Returns:
+        Catalog document
+    """
+    categories: Dict[str, Dict[str, Any]] = {}
+    icons: List[Dict[str, Any]] = []
+    for result in results:
+        namespace = result["source"]["namespace"]
+        for category in result["categories"]:
+            categories.setdefault(category["key"], category)
+        for icon in result["icons"]:
+            icons.append({"namespace": namespace, **icon})
+
+    return {
+        "$schema": "./IconMetadata.schema.json",
+        "font": {
+            "name": ", ".join(result["source"]["name"] or result["source"]["namespace"] for result in results),
+            "version": "1.0",
+            "generated_by": "build_catalog.py"
+        },
+        "fonts": [result["source"] for result in results],
+        "categories": sorted(categories.values(), key=lambda c: c["priority"]),
+        "icons": icons
+    }
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build one icon catalog from several fonts in parallel")
+    parser.add_argument("fonts", nargs="+", help="Font files as [NAMESPACE=]PATH")
+    parser.add_argument("--output", type=Path, default=Path(__file__).parent / "build" / "IconCatalog.json",
+                        help="Output catalog file")
+    parser.add_argument("--generator", choices=GENERATORS, default="auto",
+                        help="Metadata generator for every font (default: detect per font)")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per font)")
+    parser.add_argument("--no-cache", action="store_true", help="Always parse the fonts, bypassing the font cache")
+    parser.add_argument("--binary", type=Path, default=None,
+                        help="Also write the catalog as a packed binary file (see binary_catalog.py)")
+    parser.add_argument("--shards", type=Path, default=None,
+                        help="Also write the catalog as shards (core/keywords/i18n) to this directory")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Multi-font Icon Catalog Builder")
+    print("=" * 60)
+
+    try:
+        specs = [parse_font_spec(spec) for spec in args.fonts]
+    except ValueError as e:
+        print(f"✗ Error: {e}")
+        return 1
+
+    namespaces = [namespace for namespace, _ in specs]
+    duplicates = sorted({namespace for namespace in namespaces if namespaces.count(namespace) > 1})
+    if duplicates:
+        print(f"✗ Error: duplicate namespaces: {', '.join(duplicates)}")
+        return 1
+    missing = [str(path) for _, path in specs if not path.exists()]
+    if missing:
+        print(f"✗ Error: font file not found: {', '.join(missing)}")
+        return 1
+
+    for namespace, path in specs:
+        print(f"  {namespace:20s} {path}")
+
+    started = time.perf_counter()
+    workers = args.workers or min(len(specs), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(build_font_catalog, namespace, path, args.generator, not args.no_cache)
+                   for namespace, path in specs]
+        results = []
+        for (namespace, _), future in zip(specs, futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                print(f"\n✗ Error in {namespace}: {e}")
+                return 1
+
+    catalog = merge_catalogs(results)
+    write_metadata_stream(args.output, {key: value for key, value in catalog.items() if key != "icons"},
+                          catalog["icons"])
+    if args.binary:
+        write_catalog(args.binary, catalog, source=args.output)
+    if args.shards:
+        write_shards(args.shards, catalog, prefix=args.output.stem)
+    elapsed = time.perf_counter() - started
+
+    print("\n" + "-" * 60)
+    for result in results:
+        source = result["source"]
+        print(f"  {source['namespace']:20s} {source['icon_count']:5d} icons  "
+              f"{result['elapsed']:6.2f}s  ({source['generator']})")
+        for line in result["log"].splitlines():
+            print(f"      {line}" if line.strip() else "")
+    print("-" * 60)
+    print(f"✓ Total icons: {len(catalog['icons'])}")
+    print(f"✓ Wall time: {elapsed:.2f}s (slowest font: {max(r['elapsed'] for r in results):.2f}s)")
+    print(f"✓ Output: {args.output}")
+    if args.binary:
+        print(f"✓ Binary catalog: {args.binary}")
+    if args.shards:
+        print(f"✓ Shards: {args.shards}")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Icon Visual-Similarity Index
+
+Rasterizes every icon in IconMetadata.json to a small bitmap, derives a
+64-bit perceptual hash (DCT) and a downsampled, normalized pixel vector per
+icon, and stores the top-k most similar icons for each one in an
+IconSimilarity.json sidecar next to IconMetadata.json. The IconBrowser page
+can then show "similar icons" with a dictionary lookup instead of comparing
+bitmaps at runtime.
+
+All pairwise comparisons are done at once with matrix products: cosine
+similarity of the pixel vectors and Hamming distance of the hashes, blended
+into one score.
+
+Requirements:
+    pip install numpy
+
+Usage:
+    python build_similarity.py [--top-k 12] [--output IconSimilarity.json]
+"""
+
+import argparse
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+from build_atlas import glyph_edges, rasterize_edges
+from font_reader import open_font
+from json_output import write_json
+from metadata_stream import iter_icons
+
+
+# Bitmap size the features are computed from
+RASTER_SIZE = 32
+
+# Side of the downsampled pixel vector (VECTOR_SIZE x VECTOR_SIZE values)
+VECTOR_SIZE = 16
+
+# Side of the low-frequency DCT block the perceptual hash is taken from
+HASH_SIZE = 8
+
+# Weight of the pixel-vector cosine in the blended score; the rest is hash agreement
+VECTOR_WEIGHT = 0.75
+
+
+def dct_matrix(size: int) -> np.ndarray:
+    """Orthonormal DCT-II basis as a (size, size) matrix."""
+    n = np.arange(size)
+    basis = np.cos(np.pi * (2 * n[None, :] + 1) * n[:, None] / (2 * size)) * np.sqrt(2 / size)
+    basis[0] /= np.sqrt(2)
+    return basis
+
+
+def perceptual_hashes(bitmaps: np.ndarray) -> np.ndarray:
+    """
+    Compute DCT perceptual hashes for a batch of bitmaps.
+
+    The lowest HASH_SIZE x HASH_SIZE DCT coefficients are compared with
+    their median (the DC term excluded), one bit per coefficient.
+
+    Args:
+        bitmaps: float array of shape (icons, RASTER_SIZE, RASTER_SIZE)
+
+    Returns:
+        bool array of shape (icons, HASH_SIZE * HASH_SIZE)
+    """
+    basis = dct_matrix(bitmaps.shape[1])
+    coefficients = basis @ bitmaps @ basis.T
+    low = coefficients[:, :HASH_SIZE, :HASH_SIZE].reshape(len(bitmaps), -1)
+    median = np.median(low[:, 1:], axis=1, keepdims=True)
+    return low > median
+
+
+def pixel_vectors(bitmaps: np.ndarray) -> np.ndarray:
+    """
+    Downsample bitmaps to VECTOR_SIZE x VECTOR_SIZE and normalize them.
+
+    Vectors are mean-centered and scaled to unit length, so their dot
+    product is the cosine similarity of the (blurred) shapes.
+
+    Args:
+        bitmaps: float array of shape (icons, RASTER_SIZE, RASTER_SIZE)
+
+    Returns:
+        float32 array of shape (icons, VECTOR_SIZE * VECTOR_SIZE)
+    """
+    factor = bitmaps.shape[1] // VECTOR_SIZE
+    small = bitmaps.reshape(len(bitmaps), VECTOR_SIZE, factor, VECTOR_SIZE, factor).mean(axis=(2, 4))
+    vectors = small.reshape(len(bitmaps), -1)
+    vectors = vectors - vectors.mean(axis=1, keepdims=True)
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return (vectors / np.maximum(norms, 1e-9)).astype(np.float32)
+
+
+def similarity_matrix(vectors: np.ndarray, hashes: np.ndarray) -> np.ndarray:
+    """
+    Score every pair of icons.
+
+    Args:
+        vectors: Output of pixel_vectors
+        hashes: Output of perceptual_hashes
+
+    Returns:
+        float32 array of shape (icons, icons), 1.0 = identical
+    """
+    cosine = vectors @ vectors.T
+
+    # Hamming distance for all pairs: bits set in a but not b, plus the reverse
+    bits = hashes.astype(np.float32)
+    hamming = bits @ (1 - bits).T + (1 - bits) @ bits.T
+    agreement = 1 - hamming / hashes.shape[1]
+
+    return VECTOR_WEIGHT * cosine + (1 - VECTOR_WEIGHT) * agreement
+
+
+def top_k_neighbours(scores: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Select the k best-scoring other icons for every icon.
+
+    Args:
+        scores: Output of similarity_matrix
+        k: Neighbours per icon
+
+    Returns:
+        (indices, scores), both of shape (icons, k), best first
+    """
+    scores = scores.copy()
+    np.fill_diagonal(scores, -np.inf)
+    k = min(k, len(scores) - 1)
+
+    candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+    order = np.argsort(-candidate_scores, axis=1, kind='stable')
+    return np.take_along_axis(candidates, order, axis=1), np.take_along_axis(candidate_scores, order, axis=1)
+
+
+def load_icons(metadata_path: Path) -> List[Tuple[str, str]]:
+    """
+    Read the icons to index from IconMetadata.json.
+
+    Args:
+        metadata_path: Path to IconMetadata.json
+
+    Returns:
+        (name, unicode hex) pairs in file order, alias records skipped
+    """
+    return [(icon['name'], icon['unicode'].upper()) for icon in iter_icons(metadata_path) if not icon.get('alias_of')]
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    icons_dir = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons"
+    default_font = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+
+    parser = argparse.ArgumentParser(description="Build the icon visual-similarity index")
+    parser.add_argument("--font", type=Path, default=default_font, help="Source font file")
+    parser.add_argument("--metadata", type=Path, default=icons_dir / "IconMetadata.json", help="IconMetadata.json")
+    parser.add_argument("--output", type=Path, default=icons_dir / "IconSimilarity.json", help="Output sidecar file")
+    parser.add_argument("--top-k", type=int, default=12, help="Similar icons stored per icon")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Icon Visual-Similarity Index")
+    print("=" * 60)
+
+    icons = load_icons(args.metadata)
+
+    started = time.perf_counter()
+    with open_font(str(args.font)) as font:
+        cmap = font.get_best_cmap()
+        units_per_em, ascender = font.units_per_em, font.ascender
+        names: List[str] = []
+        edge_lists = []
+        for name, unicode_hex in icons:
+            glyph_name = cmap.get(int(unicode_hex, 16))
+            if glyph_name is None:
+                print(f"Warning: {name} (U+{unicode_hex}) not found in font, skipped")
+                continue
+            names.append(name)
+            edge_lists.append(glyph_edges(font.get_glyph_contours(glyph_name), units_per_em, ascender, RASTER_SIZE))
+
+    bitmaps = rasterize_edges(edge_lists, RASTER_SIZE).astype(np.float32) / 255
+    hashes = perceptual_hashes(bitmaps)
+    vectors = pixel_vectors(bitmaps)
+    rendered = time.perf_counter()
+
+    scores = similarity_matrix(vectors, hashes)
+    neighbour_indices, neighbour_scores = top_k_neighbours(scores, args.top_k)
+    compared = time.perf_counter()
+
+    similar: Dict[str, Any] = {}
+    for row, name in enumerate(names):
+        similar[name] = [
+            {"name": names[index], "score": round(float(score), 4)}
+            for index, score in zip(neighbour_indices[row], neighbour_scores[row])
+        ]
+
+    sidecar = {
+        "raster_size": RASTER_SIZE,
+        "top_k": int(neighbour_indices.shape[1]),
+        "hashes": {name: f"{int(np.packbits(bits).view('>u8')[0]):016x}" for name, bits in zip(names, hashes)},
+        "similar": similar,
+    }
+
+    write_json(args.output, sidecar, compact=True)
+
+    print(f"Icons: {len(names)}")
+    print(f"Rasterize + features: {rendered - started:.2f}s")
+    print(f"{len(names)}x{len(names)} comparison + top-{args.top_k}: {compared - rendered:.3f}s")
+    for name in ("Back", "Search", "Home"):
+        if name in similar:
+            print(f"  {name}: {', '.join(entry['name'] for entry in similar[name][:5])}")
+    print(f"Output: {args.output} ({args.output.stat().st_size} bytes)")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Icon Categorization Rules
+
+Assigns IconMetadata.json categories from a rules file in data/categories/
+instead of hard-coded if/elif chains, so every generator script uses the
+same category set and the same code point ranges.
+
+A rules file has four kinds of tab-separated lines (see
+data/categories/segoe-fluent-icons.tsv):
+
+    category  KEY  Name  名称  PRIORITY   a category
+    range     E700-E7FF  KEY            default category of a code point range
+    name      E800-E8FF  Battery, VPN  KEY
+                                        override when the name contains one of
+                                        the words/phrases (whole tokens)
+    default   KEY                       category outside every range
+
+On load, the range and rule boundaries are cut into sorted, non-overlapping
+intervals; each interval stores its default category and a token trie of the
+name rules that apply to it. Categorizing a code point is then a bisect over
+the interval starts plus one trie walk over the name's tokens.
+
+Usage:
+    from categories import Categorizer
+
+    categorizer = Categorizer.load()
+    categorizer.categorize(0xE72B, "Back")                          # 'navigation'
+    categorizer.categorize_all([0xE850, 0xE904], ["Battery0", "ZeroBars"])
+"""
+
+import bisect
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from icon_text import TokenTrie, split_name
+
+
+CATEGORIES_DIR = Path(__file__).parent / "data" / "categories"
+
+DEFAULT_RULES = "segoe-fluent-icons"
+
+# (first code point, last code point, category key)
+CodeRange = Tuple[int, int, str]
+
+# (first code point, last code point, words or phrases, category key)
+NameRule = Tuple[int, int, List[str], str]
+
+
+def parse_code_range(text: str) -> Tuple[int, int]:
+    """
+    Parse an inclusive 'START-END' hex range ('E700-E7FF'); a single code point is allowed.
+
+    Args:
+        text: Range text
+
+    Returns:
+        (first, last) code points
+    """
+    first, sep, last = text.partition('-')
+    start = int(first, 16)
+    end = int(last, 16) if sep else start
+    if end < start:
+        raise ValueError(f"empty range '{text}'")
+    return start, end
+
+
+class Categorizer:
+    """Compiled interval table of categorization rules."""
+
+    def __init__(self, categories: List[Dict[str, Any]], ranges: Sequence[CodeRange] = (),
+                 name_rules: Sequence[NameRule] = (), default: str = "uncategorized"):
+        """
+        Initialize the categorizer.
+
+        Args:
+            categories: Category definitions (key, name, name_zh, priority)
+            ranges: Non-overlapping code point ranges with their default category
+            name_rules: Name overrides, earlier rules win
+            default: Category of code points outside every range
+        """
+        self.categories = sorted(categories, key=lambda category: category["priority"])
+        known = {category["key"] for category in self.categories}
+        for key in [default] + [r[-1] for r in ranges] + [r[-1] for r in name_rules]:
+            if key not in known:
+                raise ValueError(f"Unknown category '{key}'")
+
+        ordered = sorted(ranges)
+        for previous, current in zip(ordered, ordered[1:]):
+            if current[0] <= previous[1]:
+                raise ValueError(f"Overlapping ranges {previous[0]:04X}-{previous[1]:04X} "
+                                 f"and {current[0]:04X}-{current[1]:04X}")
+
+        self.default = default
+
+        # Cut the code point axis at every range/rule boundary
+        boundaries = sorted({start for start, _, _ in ordered} | {end + 1 for _, end, _ in ordered}
+                            | {rule[0] for rule in name_rules} | {rule[1] + 1 for rule in name_rules})
+        self._starts: List[int] = boundaries
+        self._defaults: List[str] = []
+        self._tries: List[Optional[TokenTrie]] = []
+        tries: Dict[Tuple[int, ...], TokenTrie] = {}
+        for start in boundaries:
+            index = bisect.bisect_right(ordered, (start, float("inf"))) - 1
+            covering = ordered[index] if index >= 0 and ordered[index][1] >= start else None
+            self._defaults.append(covering[2] if covering else default)
+
+            active = tuple(i for i, rule in enumerate(name_rules) if rule[0] <= start <= rule[1])
+            if active and active not in tries:
+                trie = TokenTrie()
+                # Add later rules first so earlier rules win on identical phrases
+                for i in reversed(active):
+                    for phrase in name_rules[i][2]:
+                        trie.add(split_name(phrase), (i, name_rules[i][3]))
+                tries[active] = trie
+            self._tries.append(tries.get(active))
+
+    @classmethod
+    def load(cls, rules: str = DEFAULT_RULES) -> "Categorizer":
+        """
+        Load a rules file.
+
+        Args:
+            rules: File stem in data/categories/ or a path to a TSV file
+
+        Returns:
+            Categorizer
+        """
+        path = Path(rules)
+        if path.suffix != ".tsv":
+            path = CATEGORIES_DIR / f"{rules}.tsv"
+        if not path.exists():
+            raise FileNotFoundError(f"Category rules not found: {path}")
+
+        categories: List[Dict[str, Any]] = []
+        ranges: List[CodeRange] = []
+        name_rules: List[NameRule] = []
+        default = "uncategorized"
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.rstrip('\n')
+                if not line.strip() or line.startswith('#'):
+                    continue
+                fields = [field.strip() for field in line.split('\t')]
+                try:
+                    kind = fields[0]
+                    if kind == "category" and len(fields) == 5:
+                        categories.append({"key": fields[1], "name": fields[2], "name_zh": fields[3],
+                                           "priority": int(fields[4])})
+                    elif kind == "range" and len(fields) == 3:
+                        ranges.append((*parse_code_range(fields[1]), fields[2]))
+                    elif kind == "name" and len(fields) == 4:
+                        phrases = [phrase.strip() for phrase in fields[2].split(',') if phrase.strip()]
+                        name_rules.append((*parse_code_range(fields[1]), phrases, fields[3]))
+                    elif kind == "default" and len(fields) == 2:
+                        default = fields[1]
+                    else:
+                        raise ValueError(f"unexpected line '{line}'")
+                except ValueError as e:
+                    raise ValueError(f"{path}:{line_number}: {e}") from None
+
+        return cls(categories, ranges, name_rules, default)
+
+    def categorize(self, code: int, name: str = "") -> str:
+        """
+        Categorize one icon.
+
+        Args:
+            code: Code point
+            name: Icon name (for name rules)
+
+        Returns:
+            Category key
+        """
+        index = bisect.bisect_right(self._starts, code) - 1
+        if index < 0:
+            return self.default
+        trie = self._tries[index]
+        if trie is not None and name:
+            matches = trie.find_all(split_name(name))
+            if matches:
+                return min(value for _, _, value in matches)[1]
+        return self._defaults[index]
+
+    def rule_fingerprint(self, code: int, name: str = "") -> str:
+        """
+        Describe the rules that apply to an icon.
+
+        The category of an icon can only change when this value changes
+        (see metadata_manifest.py).
+
+        Args:
+            code: Code point
+            name: Icon name
+
+        Returns:
+            Default category and matched name rules, as text
+        """
+        index = bisect.bisect_right(self._starts, code) - 1
+        if index < 0:
+            return repr((self.default, []))
+        trie = self._tries[index]
+        matches = sorted(value for _, _, value in trie.find_all(split_name(name))) if trie and name else []
+        return repr((self._defaults[index], matches))
+
+    def categorize_all(self, codes: Sequence[int], names: Optional[Sequence[str]] = None) -> List[str]:
+        """
+        Categorize a batch of icons.
+
+        Args:
+            codes: Code points
+            names: Icon names in the same order (None: ranges only)
+
+        Returns:
+            Category keys in input order
+        """
+        if names is None:
+            names = [""] * len(codes)
+        return [self.categorize(code, name) for code, name in zip(codes, names)]
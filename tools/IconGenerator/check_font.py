@@ -1,11 +1,22 @@
 #!/usr/bin/env python3
 """Check what glyphs are actually in the font file."""
 
-from fontTools.ttLib import TTFont
+import argparse
+from pathlib import Path
 
-font_path = r"D:\Code\Claude\Lemoo.UI\src\UI\Lemoo.UI\Resources\Fonts\Segoe Fluent Icons.ttf"
-font = TTFont(font_path)
-cmap = font['cmap'].getBestCmap()
+from font_cache import open_cached_font
+
+project_root = Path(__file__).parent.parent.parent
+default_font = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+
+parser = argparse.ArgumentParser(description="Check what glyphs are in the font file")
+parser.add_argument("font", nargs="?", default=str(default_font), help="Font file to check")
+parser.add_argument("--no-cache", action="store_true", help="Always parse the font, bypassing the font cache")
+args = parser.parse_args()
+
+font = open_cached_font(args.font, use_cache=not args.no_cache)
+cmap = font.get_best_cmap()
+font.close()
 
 print("Checking if key icons exist at their Unicode values:")
 for code, name in [(0xE72A, 'Forward'), (0xE72B, 'Back'), (0xE721, 'Search'), (0xE80F, 'Home'), (0xE713, 'Settings')]:
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+CJK Text Normalization and Tokenization
+
+Chinese text has no spaces between words, so icon translations and Chinese
+keywords are indexed as character n-grams: every CJK character (unigram)
+and every pair of adjacent CJK characters (bigram). A query of one or two
+characters is then a single posting list lookup; a longer query
+intersects the posting lists of its bigrams.
+
+Before tokenizing, text is normalized to one width form with NFKC:
+full-width Latin letters, digits and punctuation ('ＷｉＦｉ', '＋', '，')
+become their half-width forms and half-width katakana become full-width,
+so typed and stored text compare equal regardless of the input method.
+
+Usage:
+    from cjk_text import cjk_tokens, normalize_text
+
+    normalize_text("ＷｉＦｉ 设置")    # 'wifi 设置'
+    cjk_tokens("全局导航")            # ['全', '局', '导', '航', '全局', '局导', '导航']
+"""
+
+import re
+import unicodedata
+from typing import List
+
+
+# CJK ideographs: Extension A, Unified Ideographs, Compatibility Ideographs, Extensions B-F
+CJK_PATTERN = re.compile('[\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff\U00020000-\U0002fa1f]+')
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for indexing and searching.
+
+    Args:
+        text: Search text or indexed string
+
+    Returns:
+        NFKC-normalized, lower-cased text
+    """
+    return unicodedata.normalize("NFKC", text).lower()
+
+
+def is_cjk(char: str) -> bool:
+    """
+    Check whether a character is a CJK ideograph.
+
+    Args:
+        char: Single character
+
+    Returns:
+        True for CJK ideographs
+    """
+    return CJK_PATTERN.fullmatch(char) is not None
+
+
+def is_cjk_text(text: str) -> bool:
+    """
+    Check whether text consists of CJK ideographs only.
+
+    Args:
+        text: Normalized text
+
+    Returns:
+        True if text is non-empty and all CJK
+    """
+    return CJK_PATTERN.fullmatch(text) is not None
+
+
+def cjk_tokens(text: str) -> List[str]:
+    """
+    Split the CJK runs of a string into unigrams and bigrams.
+
+    Args:
+        text: Normalized text (non-CJK characters are ignored)
+
+    Returns:
+        Unigrams, then bigrams, of every CJK run in order (with repeats)
+    """
+    tokens = []
+    for run in CJK_PATTERN.findall(text):
+        tokens.extend(run)
+        tokens.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return tokens
+
+
+def cjk_query_tokens(text: str) -> List[str]:
+    """
+    Get the tokens a CJK query must match: its bigrams, or the character
+    itself for a one-character query.
+
+    Args:
+        text: Normalized CJK text
+
+    Returns:
+        Tokens, in order
+    """
+    if len(text) == 1:
+        return [text]
+    return [text[i:i + 2] for i in range(len(text) - 1)]
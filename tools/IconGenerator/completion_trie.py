@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Icon Name Completion Trie
+
+Builds a prefix trie over icon names, alias names and zh names in which
+every node stores its top-k completions, so completing a prefix is a walk
+of len(prefix) nodes plus one slice -- independent of the catalog size.
+
+The trie is stored as flat arrays (nodes numbered breadth-first, so the
+children of a node are consecutive and sorted by character):
+
+    labels       string; labels[n - 1] is the character leading into node n
+    children     children of node n are nodes children[n] .. children[n + 1] - 1
+    top          top-k entries of node n are top_entries[top[n] .. top[n + 1] - 1]
+    top_entries  entry ids, best first
+    entries      [text, document id, score] per completion text
+    documents    [name, unicode] per icon, in IconMetadata.json order
+
+Keys are normalized like the search index (NFKC and lower-cased, see
+cjk_text.normalize_text), so full-width input completes too. Each node lists an icon at most once (through its best
+scoring text), ranked by score, then text.
+
+The trie is written as a compact JSON sidecar next to the metadata file
+(IconMetadata.complete.json).
+
+Usage:
+    python completion_trie.py --metadata path/to/IconMetadata.json [--top-k 10]
+    python completion_trie.py --metadata path/to/IconMetadata.json --complete chev
+
+    from completion_trie import CompletionTrie
+    trie = CompletionTrie.load("IconMetadata.complete.json")
+    trie.complete("chev")      # [('ChevronUp', 'E70E', 'ChevronUp'), ...]
+"""
+
+import argparse
+import json
+from bisect import bisect_left
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from cjk_text import normalize_text
+from json_output import write_json
+from metadata_stream import MetadataStreamReader
+
+
+# Bump when the trie layout changes
+TRIE_FORMAT_VERSION = 1
+
+# Completions stored per node
+DEFAULT_TOP_K = 10
+
+
+def completion_score(icon: Dict[str, Any], text: str, category_priority: Dict[str, int]) -> int:
+    """
+    Score a completion; higher ranks first.
+
+    Short texts win (base icons before their size and state variants),
+    then verified icons, then icons of high-priority categories; alias
+    names (alias records and entries of an "aliases" list) rank just below
+    the canonical name.
+
+    Args:
+        icon: Icon metadata
+        text: Completion text
+        category_priority: Category key -> priority (1 = first)
+
+    Returns:
+        Integer score
+    """
+    score = 1000 - 10 * len(text)
+    if icon.get("verified"):
+        score += 5
+    score -= min(category_priority.get(icon.get("category"), 99), 99) // 10
+    if icon.get("alias_of") or text in icon.get("aliases", []):
+        score -= 1
+    return score
+
+
+def icon_completion_texts(icon: Dict[str, Any]) -> List[str]:
+    """
+    Get the texts an icon is completed from: its name (alias records have
+    their own name), the names in its "aliases" list (see
+    find_duplicates.py --apply) and its zh name.
+
+    Args:
+        icon: Icon metadata
+
+    Returns:
+        Distinct texts, original case
+    """
+    texts = [icon["name"]]
+    seen = {normalize_text(icon["name"])}
+    for text in icon.get("aliases", []) + [icon.get("i18n", {}).get("zh")]:
+        if text and normalize_text(text) not in seen:
+            seen.add(normalize_text(text))
+            texts.append(text)
+    return texts
+
+
+def build_completion_trie(icons: Iterable[Dict[str, Any]], categories: Iterable[Dict[str, Any]] = (),
+                          top_k: int = DEFAULT_TOP_K) -> Dict[str, Any]:
+    """
+    Build the completion trie.
+
+    Args:
+        icons: Icon records in metadata order
+        categories: Category definitions (for their priorities)
+        top_k: Completions stored per node
+
+    Returns:
+        Trie document (see the module docstring)
+    """
+    category_priority = {category["key"]: category.get("priority", 99) for category in categories}
+
+    documents = []
+    entries = []
+    for doc_id, icon in enumerate(icons):
+        documents.append([icon["name"], icon["unicode"]])
+        for text in icon_completion_texts(icon):
+            entries.append([text, doc_id, completion_score(icon, text, category_priority)])
+    # Rank order: score, then text, then document
+    entries.sort(key=lambda entry: (-entry[2], normalize_text(entry[0]), entry[1]))
+
+    # Pointer trie: node = [children dict, entry ids ending here]
+    root: List[Any] = [{}, []]
+    for entry_id, (text, _, _) in enumerate(entries):
+        node = root
+        for char in normalize_text(text):
+            node = node[0].setdefault(char, [{}, []])
+        node[1].append(entry_id)
+
+    # Top-k per node, bottom-up; entry ids are already in rank order
+    def collect(node: List[Any]) -> List[int]:
+        candidates = list(node[1])
+        for child in node[0].values():
+            candidates.extend(collect(child))
+        candidates.sort()
+        top, seen = [], set()
+        for entry_id in candidates:
+            doc_id = entries[entry_id][1]
+            if doc_id not in seen:
+                seen.add(doc_id)
+                top.append(entry_id)
+                if len(top) == top_k:
+                    break
+        node.append(top)
+        return top
+
+    collect(root)
+
+    # Flatten breadth-first
+    labels, children, top, top_entries = [], [], [], []
+    queue = deque([root])
+    next_node = 1
+    while queue:
+        node = queue.popleft()
+        children.append(next_node)
+        top.append(len(top_entries))
+        top_entries.extend(node[2])
+        for char in sorted(node[0]):
+            labels.append(char)
+            queue.append(node[0][char])
+            next_node += 1
+    children.append(next_node)
+    top.append(len(top_entries))
+
+    return {
+        "version": TRIE_FORMAT_VERSION,
+        "top_k": top_k,
+        "documents": documents,
+        "entries": entries,
+        "labels": "".join(labels),
+        "children": children,
+        "top": top,
+        "top_entries": top_entries,
+    }
+
+
+class CompletionTrie:
+    """Prefix completion over a serialized trie."""
+
+    def __init__(self, trie: Dict[str, Any]):
+        """
+        Initialize the trie.
+
+        Args:
+            trie: Trie document from build_completion_trie() or the sidecar file
+
+        Raises:
+            ValueError: If the trie was written by an incompatible version
+        """
+        if trie.get("version") != TRIE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported completion trie format: {trie.get('version')}")
+        self.top_k: int = trie["top_k"]
+        self.documents: List[List[str]] = trie["documents"]
+        self.entries: List[List[Any]] = trie["entries"]
+        self.labels: str = trie["labels"]
+        self.children: List[int] = trie["children"]
+        self.top: List[int] = trie["top"]
+        self.top_entries: List[int] = trie["top_entries"]
+
+    @classmethod
+    def load(cls, path: Path) -> "CompletionTrie":
+        """
+        Load a trie sidecar file.
+
+        Args:
+            path: IconMetadata.complete.json
+
+        Returns:
+            CompletionTrie
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def find_node(self, prefix: str) -> int:
+        """
+        Walk the trie along a prefix.
+
+        Args:
+            prefix: Normalized prefix
+
+        Returns:
+            Node id, or -1 if no text starts with the prefix
+        """
+        node = 0
+        for char in prefix:
+            # Node n is labelled by labels[n - 1]; the root has no label
+            first, end = self.children[node] - 1, self.children[node + 1] - 1
+            index = bisect_left(self.labels, char, first, end)
+            if index == end or self.labels[index] != char:
+                return -1
+            node = index + 1
+        return node
+
+    def complete(self, prefix: str, limit: int = 0) -> List[Tuple[str, str, str]]:
+        """
+        Complete a prefix.
+
+        Args:
+            prefix: Typed text (case- and width-insensitive)
+            limit: Maximum number of completions (0: top_k)
+
+        Returns:
+            (icon name, unicode, completed text) tuples, best first
+        """
+        prefix = normalize_text(prefix).strip()
+        node = self.find_node(prefix) if prefix else -1
+        if node < 0:
+            return []
+        end = self.top[node + 1]
+        if limit:
+            end = min(end, self.top[node] + limit)
+        results = []
+        for entry_id in self.top_entries[self.top[node]:end]:
+            text, doc_id, _ = self.entries[entry_id]
+            name, unicode = self.documents[doc_id]
+            results.append((name, unicode, text))
+        return results
+
+
+def write_completion_trie(path: Path, icons: Iterable[Dict[str, Any]], categories: Iterable[Dict[str, Any]] = (),
+                          top_k: int = DEFAULT_TOP_K) -> bool:
+    """
+    Build the completion trie and write it as a compact sidecar.
+
+    Args:
+        path: Output file
+        icons: Icon records in metadata order
+        categories: Category definitions
+        top_k: Completions stored per node
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    return write_json(path, build_completion_trie(icons, categories, top_k), compact=True)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build or query the icon name completion trie")
+    parser.add_argument("--metadata", type=Path, required=True, help="IconMetadata.json")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Trie file (default: IconMetadata.complete.json next to the metadata)")
+    parser.add_argument("--top-k", type=int, default=DEFAULT_TOP_K, help="Completions stored per node")
+    parser.add_argument("--complete", help="Complete a prefix instead of building the trie")
+    args = parser.parse_args()
+
+    output_path = args.output or args.metadata.with_suffix(".complete.json")
+
+    if args.complete is not None:
+        trie = CompletionTrie.load(output_path)
+        for name, unicode, text in trie.complete(args.complete):
+            print(f"  {unicode:6s} {text:32s} {name}")
+        return 0
+
+    reader = MetadataStreamReader(args.metadata)
+    icons = list(reader)
+    changed = write_completion_trie(output_path, icons, reader.header.get("categories", []), args.top_k)
+    trie = CompletionTrie.load(output_path)
+    print(f"✓ {len(trie.entries)} completions, {len(trie.labels) + 1} nodes, top {trie.top_k} per node")
+    print(f"✓ {'Saved' if changed else 'Unchanged'}: {output_path} ({output_path.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+"""
+Glyph Outline Exporter
+
+Exports every cmap glyph of Segoe Fluent Icons.ttf as normalized SVG path
+data (1x1 em box, y axis pointing down) into an IconOutlines.json sidecar
+next to IconMetadata.json, so icons can be drawn as vector geometry without
+loading the font.
+
+Converted paths are cached by outline hash, so re-exporting after a font
+update only converts glyphs whose outlines actually changed.
+
+Usage:
+    python export_outlines.py [--precision N] [--no-cache] [--clear-cache]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from font_reader import open_font
+from glyph_outlines import contours_to_svg_path, outline_hash
+from json_output import write_json
+from metadata_stream import iter_icons
+
+
+# Bump when contours_to_svg_path output changes
+OUTLINE_CACHE_VERSION = 1
+
+DEFAULT_CACHE_PATH = Path(__file__).parent / ".cache" / "outlines.json"
+
+
+class OutlineCache:
+    """Content-addressed cache of converted SVG path data."""
+
+    def __init__(self, cache_path: Optional[Path] = None, enabled: bool = True):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_path: Cache file (default: .cache/outlines.json next to this script)
+            enabled: Set to False to neither read nor write the cache
+        """
+        self.cache_path = Path(cache_path) if cache_path else DEFAULT_CACHE_PATH
+        self.enabled = enabled
+        self.entries: Dict[str, str] = {}
+        self.hits = 0
+        self.misses = 0
+        self._dirty = False
+
+        if enabled:
+            try:
+                with open(self.cache_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get("version") == OUTLINE_CACHE_VERSION:
+                    self.entries = data.get("entries", {})
+            except (OSError, ValueError):
+                pass
+
+    @staticmethod
+    def make_key(glyph_hash: str, units_per_em: int, ascender: int, precision: int) -> str:
+        """Combine the outline hash with the normalization parameters."""
+        params = f"{glyph_hash}:{units_per_em}:{ascender}:{precision}"
+        return hashlib.sha256(params.encode('ascii')).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return cached path data, counting hits and misses."""
+        path = self.entries.get(key) if self.enabled else None
+        if path is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return path
+
+    def put(self, key: str, path: str) -> None:
+        """Store converted path data."""
+        if self.enabled:
+            self.entries[key] = path
+            self._dirty = True
+
+    def save(self, live_keys: Optional[set] = None) -> None:
+        """
+        Write the cache back to disk.
+
+        Args:
+            live_keys: If given, drop entries not used by the current export
+        """
+        if not self.enabled or not (self._dirty or (live_keys is not None and set(self.entries) - live_keys)):
+            return
+        if live_keys is not None:
+            self.entries = {k: v for k, v in self.entries.items() if k in live_keys}
+
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_path.with_suffix(".tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"version": OUTLINE_CACHE_VERSION, "entries": self.entries}, f)
+        os.replace(tmp_path, self.cache_path)
+
+    def clear(self) -> None:
+        """Delete the cache file and forget all entries."""
+        self.entries = {}
+        if self.cache_path.exists():
+            self.cache_path.unlink()
+
+
+def load_icon_names(metadata_path: Path) -> Dict[int, str]:
+    """
+    Map code points to icon names from IconMetadata.json.
+
+    Alias records (alias_of) are skipped so each code point keeps its
+    canonical name.
+
+    Args:
+        metadata_path: Path to IconMetadata.json
+
+    Returns:
+        Code point -> icon name
+    """
+    if not metadata_path.exists():
+        return {}
+    names: Dict[int, str] = {}
+    for icon in iter_icons(metadata_path):
+        if icon.get('alias_of'):
+            continue
+        names.setdefault(int(icon['unicode'], 16), icon['name'])
+    return names
+
+
+def export_outlines(font, icon_names: Dict[int, str], cache: OutlineCache,
+                    precision: int = 4) -> List[Dict[str, Any]]:
+    """
+    Convert every cmap glyph with an outline to SVG path data.
+
+    Args:
+        font: An open font_reader font
+        icon_names: Code point -> icon name (optional labels)
+        cache: Outline cache
+        precision: Decimal places kept in the path data
+
+    Returns:
+        Glyph records sorted by code point
+    """
+    units_per_em = font.units_per_em
+    ascender = font.ascender
+
+    glyphs = []
+    live_keys = set()
+    for code, glyph_name in sorted(font.get_best_cmap().items()):
+        contours = font.get_glyph_contours(glyph_name)
+        if not contours:
+            continue
+
+        glyph_hash = outline_hash(contours)
+        key = cache.make_key(glyph_hash, units_per_em, ascender, precision)
+        live_keys.add(key)
+
+        path = cache.get(key)
+        if path is None:
+            path = contours_to_svg_path(contours, units_per_em, ascender, precision)
+            cache.put(key, path)
+
+        record = {"unicode": f"{code:04X}", "glyph": glyph_name}
+        if code in icon_names:
+            record["name"] = icon_names[code]
+        record["outline_hash"] = glyph_hash
+        record["path"] = path
+        glyphs.append(record)
+
+    cache.save(live_keys)
+    return glyphs
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    icons_dir = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons"
+    default_font = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+
+    parser = argparse.ArgumentParser(description="Export glyph outlines as SVG path data")
+    parser.add_argument("--font", type=Path, default=default_font, help="Source font file")
+    parser.add_argument("--metadata", type=Path, default=icons_dir / "IconMetadata.json",
+                        help="IconMetadata.json used to label glyphs with icon names")
+    parser.add_argument("--output", type=Path, default=icons_dir / "IconOutlines.json", help="Output sidecar file")
+    parser.add_argument("--precision", type=int, default=4, help="Decimal places in path data")
+    parser.add_argument("--no-cache", action="store_true", help="Convert every glyph, bypassing the outline cache")
+    parser.add_argument("--clear-cache", action="store_true", help="Invalidate the outline cache before running")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Glyph Outline Exporter")
+    print("=" * 60)
+    print(f"Font: {args.font}")
+    print(f"Output: {args.output}")
+
+    cache = OutlineCache(enabled=not args.no_cache)
+    if args.clear_cache:
+        cache.clear()
+
+    try:
+        with open_font(str(args.font)) as font:
+            glyphs = export_outlines(font, load_icon_names(args.metadata), cache, args.precision)
+            sidecar = {
+                "font": {
+                    "name": font.get_best_full_name(),
+                    "version": str(font.font_revision),
+                },
+                "units_per_em": font.units_per_em,
+                "view_box": "0 0 1 1",
+                "precision": args.precision,
+                "glyphs": glyphs,
+            }
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+    write_json(args.output, sidecar)
+
+    print(f"\nExported {len(glyphs)} glyph outlines")
+    print(f"Converted: {cache.misses}, reused from cache: {cache.hits}")
+    print(f"Size: {args.output.stat().st_size} bytes")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
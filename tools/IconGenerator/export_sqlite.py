@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+SQLite Catalog Export
+
+Writes an icon catalog (IconMetadata.json or a build_catalog.py catalog)
+into a single SQLite database, so tooling and designers can run ranked,
+indexed queries without loading the JSON:
+
+    meta          format version and the top-level document fields
+    categories    key, name, name_zh, priority
+    icons         one row per icon (alias records excluded), with the
+                  remaining record fields as compact JSON in `details`
+    aliases       alias name -> icon (records with "alias_of" and the
+                  names in a record's "aliases" list)
+    keywords      distinct keywords
+    icon_keywords icon <-> keyword
+    icon_search   contentless FTS5 index over names (incl. aliases),
+                  keywords and zh translations; rowid = icons.id
+
+Covering indexes on icons(code_point, ...) and icons(name COLLATE NOCASE,
+...) answer code point and name lookups from the index alone.
+
+The export is incremental: every icon row stores a hash of its record, and
+only added, changed and removed icons are written on the next run. The
+FTS5 table is contentless, so deleting a row re-derives the indexed text
+from the normalized tables. A database of another format version is
+rebuilt from scratch.
+
+Usage:
+    python export_sqlite.py [--metadata PATH] [--output build/IconMetadata.sqlite] [--full]
+    python export_sqlite.py --query "arrow left"
+
+    sqlite3 build/IconMetadata.sqlite \\
+        "SELECT i.name FROM icon_search s JOIN icons i ON i.id = s.rowid
+         WHERE icon_search MATCH 'chevron*' ORDER BY bm25(icon_search, 10, 2, 5) LIMIT 10"
+"""
+
+import argparse
+import hashlib
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from cjk_text import is_cjk, normalize_text
+from json_output import dumps_canonical
+from metadata_stream import MetadataStreamReader
+
+
+# Bump when the schema or the indexed text changes; older databases are rebuilt
+SQLITE_FORMAT_VERSION = 2
+
+DEFAULT_OUTPUT = Path(__file__).parent / "build" / "IconMetadata.sqlite"
+
+# Icon fields stored in their own columns or tables; the rest go to `details`
+COLUMN_FIELDS = ("name", "unicode", "category", "glyph", "namespace", "verified", "keywords", "i18n")
+
+# bm25() column weights: name, keywords, zh
+SEARCH_WEIGHTS = (10.0, 2.0, 5.0)
+
+SCHEMA = """
+CREATE TABLE meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+) WITHOUT ROWID;
+
+CREATE TABLE categories (
+    id INTEGER PRIMARY KEY,
+    key TEXT NOT NULL UNIQUE,
+    name TEXT,
+    name_zh TEXT,
+    priority INTEGER
+);
+
+CREATE TABLE icons (
+    id INTEGER PRIMARY KEY,
+    namespace TEXT NOT NULL DEFAULT '',
+    name TEXT NOT NULL,
+    code_point INTEGER NOT NULL,
+    unicode TEXT NOT NULL,
+    category_id INTEGER REFERENCES categories(id),
+    glyph TEXT,
+    en TEXT,
+    zh TEXT,
+    verified INTEGER NOT NULL DEFAULT 0,
+    details TEXT NOT NULL,
+    record_hash TEXT NOT NULL,
+    UNIQUE (namespace, name)
+);
+
+CREATE INDEX icons_code_point ON icons(code_point, namespace, name, id);
+CREATE INDEX icons_name ON icons(name COLLATE NOCASE, namespace, code_point, id);
+CREATE INDEX icons_category ON icons(category_id, id);
+
+CREATE TABLE aliases (
+    alias TEXT NOT NULL COLLATE NOCASE,
+    icon_id INTEGER NOT NULL REFERENCES icons(id) ON DELETE CASCADE,
+    PRIMARY KEY (alias, icon_id)
+) WITHOUT ROWID;
+
+CREATE INDEX aliases_icon ON aliases(icon_id, alias);
+
+CREATE TABLE keywords (
+    id INTEGER PRIMARY KEY,
+    keyword TEXT NOT NULL UNIQUE
+);
+
+CREATE TABLE icon_keywords (
+    icon_id INTEGER NOT NULL REFERENCES icons(id) ON DELETE CASCADE,
+    keyword_id INTEGER NOT NULL REFERENCES keywords(id),
+    PRIMARY KEY (icon_id, keyword_id)
+) WITHOUT ROWID;
+
+CREATE INDEX icon_keywords_keyword ON icon_keywords(keyword_id, icon_id);
+
+CREATE VIRTUAL TABLE icon_search USING fts5(
+    name, keywords, zh,
+    content='',
+    tokenize='unicode61'
+);
+"""
+
+
+def fts_text(text: str) -> str:
+    """
+    Prepare text for the unicode61 tokenizer.
+
+    Text is NFKC-normalized first (full-width letters and digits become
+    half-width). unicode61 treats a run of CJK characters as one token, so
+    every CJK character is separated into a token of its own; a phrase
+    query over consecutive characters then matches any part of a Chinese
+    name.
+
+    Args:
+        text: Text to index or search
+
+    Returns:
+        Tokenizer input
+    """
+    return "".join(f" {char} " if is_cjk(char) else char for char in normalize_text(text)).strip()
+
+
+def fts_query(text: str) -> str:
+    """
+    Turn search box input into an FTS5 query.
+
+    Every word must match: Latin words as prefixes, Chinese words as a
+    phrase of their characters.
+
+    Args:
+        text: Search text
+
+    Returns:
+        FTS5 MATCH expression (empty if there is nothing to search for)
+    """
+    terms = []
+    for word in normalize_text(text).split():
+        word = word.replace('"', '')
+        if not word:
+            continue
+        if any(is_cjk(char) for char in word):
+            terms.append(f'"{fts_text(word)}"')
+        else:
+            terms.append(f'"{word}"*')
+    return " ".join(terms)
+
+
+def record_hash(icon: Dict[str, Any], aliases: List[str]) -> str:
+    """
+    Hash an icon record together with the aliases indexed for it.
+
+    Args:
+        icon: Icon metadata
+        aliases: Alias names of the icon (alias records and its "aliases" list)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(dumps_canonical([icon, sorted(aliases)], compact=True)).hexdigest()
+
+
+class SqliteExporter:
+    """Writes icon catalogs into a SQLite database, incrementally."""
+
+    def __init__(self, path: Path):
+        """
+        Open (or create) the database.
+
+        Args:
+            path: Database file
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = self._open()
+        self.stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path)
+        try:
+            version = conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()
+        except sqlite3.DatabaseError:
+            version = None
+        if version is None or version[0] != str(SQLITE_FORMAT_VERSION):
+            conn.close()
+            self.path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.executescript(SCHEMA)
+            conn.execute("INSERT INTO meta VALUES ('version', ?)", (str(SQLITE_FORMAT_VERSION),))
+            conn.commit()
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def close(self) -> None:
+        """Close the database."""
+        self.conn.close()
+
+    def __enter__(self) -> "SqliteExporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def clear(self) -> None:
+        """Delete all icons (the next export writes every row)."""
+        with self.conn:
+            self.conn.execute("DELETE FROM icons")
+            self.conn.execute("DELETE FROM keywords")
+            self.conn.execute("INSERT INTO icon_search(icon_search) VALUES ('delete-all')")
+
+    def export(self, header: Dict[str, Any], icons: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Bring the database in line with a catalog.
+
+        Args:
+            header: Top-level document fields other than "icons"
+            icons: Icon records
+
+        Returns:
+            Row counts: added, updated, removed, unchanged
+        """
+        records = []
+        aliases: Dict[Tuple[str, str], List[str]] = {}
+        for icon in icons:
+            if icon.get("alias_of"):
+                aliases.setdefault((icon.get("namespace", ""), icon["alias_of"]), []).append(icon["name"])
+            else:
+                records.append(icon)
+
+        with self.conn:
+            for key, value in header.items():
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                                  (key, dumps_canonical(value, compact=True).decode('utf-8').rstrip("\n")))
+            category_ids = self._write_categories(header.get("categories", []))
+
+            existing = {(namespace, name): (icon_id, digest) for icon_id, namespace, name, digest
+                        in self.conn.execute("SELECT id, namespace, name, record_hash FROM icons")}
+            for icon in records:
+                key = (icon.get("namespace", ""), icon["name"])
+                # Alias records plus the names merged into the record (find_duplicates.py --apply);
+                # the latter are part of the record, so a changed list changes the hash too
+                icon_aliases = aliases.pop(key, []) + icon.get("aliases", [])
+                digest = record_hash(icon, icon_aliases)
+                current = existing.pop(key, None)
+                if current is not None and current[1] == digest:
+                    self.stats["unchanged"] += 1
+                    continue
+                if current is not None:
+                    self._delete_icon(current[0])
+                    self.stats["updated"] += 1
+                else:
+                    self.stats["added"] += 1
+                self._insert_icon(icon, icon_aliases, digest, category_ids,
+                                  current[0] if current is not None else None)
+
+            for icon_id, _ in existing.values():
+                self._delete_icon(icon_id)
+                self.stats["removed"] += 1
+            for (namespace, target), names in aliases.items():
+                print(f"Warning: alias target {target} not found, skipping {', '.join(names)}")
+
+            self.conn.execute("DELETE FROM keywords WHERE id NOT IN (SELECT keyword_id FROM icon_keywords)")
+            self.conn.execute("DELETE FROM categories WHERE key NOT IN ({}) AND id NOT IN "
+                              "(SELECT category_id FROM icons WHERE category_id IS NOT NULL)".format(
+                                  ",".join("?" * len(category_ids))), list(category_ids))
+
+        if self.stats["added"] + self.stats["updated"] + self.stats["removed"]:
+            self.conn.execute("INSERT INTO icon_search(icon_search) VALUES ('optimize')")
+            self.conn.commit()
+        return self.stats
+
+    def _write_categories(self, categories: List[Dict[str, Any]]) -> Dict[str, int]:
+        for category in categories:
+            self.conn.execute(
+                "INSERT INTO categories (key, name, name_zh, priority) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET name = excluded.name, name_zh = excluded.name_zh, "
+                "priority = excluded.priority",
+                (category["key"], category.get("name"), category.get("name_zh"), category.get("priority")))
+        keys = {category["key"] for category in categories}
+        return {key: category_id for category_id, key in self.conn.execute("SELECT id, key FROM categories")
+                if key in keys}
+
+    def _category_id(self, key: Optional[str], category_ids: Dict[str, int]) -> Optional[int]:
+        if key is None:
+            return None
+        if key not in category_ids:
+            self.conn.execute("INSERT OR IGNORE INTO categories (key) VALUES (?)", (key,))
+            category_ids[key] = self.conn.execute("SELECT id FROM categories WHERE key = ?", (key,)).fetchone()[0]
+        return category_ids[key]
+
+    def _insert_icon(self, icon: Dict[str, Any], aliases: List[str], digest: str,
+                     category_ids: Dict[str, int], icon_id: Optional[int]) -> None:
+        i18n = icon.get("i18n", {})
+        details = {key: value for key, value in icon.items() if key not in COLUMN_FIELDS}
+        cursor = self.conn.execute(
+            "INSERT INTO icons (id, namespace, name, code_point, unicode, category_id, glyph, en, zh, verified, "
+            "details, record_hash) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (icon_id, icon.get("namespace", ""), icon["name"], int(icon["unicode"], 16), icon["unicode"],
+             self._category_id(icon.get("category"), category_ids), icon.get("glyph"), i18n.get("en"),
+             i18n.get("zh"), int(bool(icon.get("verified"))),
+             dumps_canonical(details, compact=True).decode('utf-8').rstrip("\n"), digest))
+        icon_id = cursor.lastrowid
+
+        keywords = sorted(set(icon.get("keywords", [])))
+        self.conn.executemany("INSERT OR IGNORE INTO keywords (keyword) VALUES (?)", [(k,) for k in keywords])
+        self.conn.executemany(
+            "INSERT INTO icon_keywords (icon_id, keyword_id) SELECT ?, id FROM keywords WHERE keyword = ?",
+            [(icon_id, keyword) for keyword in keywords])
+        self.conn.executemany("INSERT OR IGNORE INTO aliases (alias, icon_id) VALUES (?, ?)",
+                              [(alias, icon_id) for alias in sorted(set(aliases))])
+        self.conn.execute("INSERT INTO icon_search (rowid, name, keywords, zh) VALUES (?, ?, ?, ?)",
+                          (icon_id, *self._search_text(icon_id)))
+
+    def _search_text(self, icon_id: int) -> Tuple[str, str, str]:
+        # Derived from the stored rows only: a contentless FTS5 delete must
+        # repeat exactly the values that were inserted
+        name, zh = self.conn.execute("SELECT name, zh FROM icons WHERE id = ?", (icon_id,)).fetchone()
+        aliases = [row[0] for row in self.conn.execute(
+            "SELECT alias FROM aliases WHERE icon_id = ? ORDER BY alias", (icon_id,))]
+        keywords = [row[0] for row in self.conn.execute(
+            "SELECT k.keyword FROM icon_keywords ik JOIN keywords k ON k.id = ik.keyword_id "
+            "WHERE ik.icon_id = ? ORDER BY k.keyword", (icon_id,))]
+        return " ".join([name] + aliases), " ".join(keywords), fts_text(zh or "")
+
+    def _delete_icon(self, icon_id: int) -> None:
+        self.conn.execute("INSERT INTO icon_search (icon_search, rowid, name, keywords, zh) "
+                          "VALUES ('delete', ?, ?, ?, ?)", (icon_id, *self._search_text(icon_id)))
+        self.conn.execute("DELETE FROM icons WHERE id = ?", (icon_id,))
+
+
+def export_sqlite(path: Path, metadata_path: Path, full: bool = False) -> Dict[str, int]:
+    """
+    Export a metadata file into a SQLite database.
+
+    Args:
+        path: Database file
+        metadata_path: IconMetadata.json or a catalog file
+        full: Rewrite every row instead of only the changed ones
+
+    Returns:
+        Row counts: added, updated, removed, unchanged
+    """
+    reader = MetadataStreamReader(metadata_path)
+    with SqliteExporter(path) as exporter:
+        if full:
+            exporter.clear()
+        icons = list(reader)
+        return exporter.export(reader.header, icons)
+
+
+def search(conn: sqlite3.Connection, text: str, limit: int = 20) -> List[Tuple[str, str, float]]:
+    """
+    Ranked search over the exported database.
+
+    Args:
+        conn: Connection to an exported database
+        text: Search text
+        limit: Maximum number of results
+
+    Returns:
+        (name, unicode, bm25 score) tuples, best first
+    """
+    query = fts_query(text)
+    if not query:
+        return []
+    weights = ", ".join(str(weight) for weight in SEARCH_WEIGHTS)
+    return conn.execute(
+        f"SELECT i.name, i.unicode, bm25(icon_search, {weights}) AS score FROM icon_search "
+        f"JOIN icons i ON i.id = icon_search.rowid WHERE icon_search MATCH ? ORDER BY score LIMIT ?",
+        (query, limit)).fetchall()
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    default_metadata = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons" / "IconMetadata.json"
+
+    parser = argparse.ArgumentParser(description="Export the icon catalog into a SQLite database")
+    parser.add_argument("--metadata", type=Path, default=default_metadata, help="IconMetadata.json or catalog")
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Database file")
+    parser.add_argument("--full", action="store_true", help="Rewrite every row")
+    parser.add_argument("--query", help="Search the database instead of exporting")
+    parser.add_argument("--limit", type=int, default=20, help="Maximum number of search results")
+    args = parser.parse_args()
+
+    if args.query is not None:
+        if not args.output.exists():
+            print(f"✗ Error: {args.output} does not exist, export it first")
+            return 1
+        conn = sqlite3.connect(args.output)
+        results = search(conn, args.query, args.limit)
+        conn.close()
+        for name, unicode, score in results:
+            print(f"  {unicode:6s} {name:40s} {score:8.3f}")
+        print(f"✓ {len(results)} results for '{args.query}'")
+        return 0
+
+    start = time.perf_counter()
+    stats = export_sqlite(args.output, args.metadata, args.full)
+    elapsed = time.perf_counter() - start
+    print(f"✓ {stats['added']} added, {stats['updated']} updated, {stats['removed']} removed, "
+          f"{stats['unchanged']} unchanged ({elapsed:.2f}s)")
+    print(f"✓ Database: {args.output} ({args.output.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -4,11 +4,13 @@ Extract IconMetadata.json from existing IconKind.cs file
 This preserves all manual translations and categorizations
 """
 
-import json
 import re
 from pathlib import Path
 from typing import List, Dict, Any
 
+from cjk_text import normalize_text
+from json_output import write_json
+
 
 def extract_icon_data_from_cs(cs_file_path: str) -> List[Dict[str, Any]]:
     """
@@ -150,7 +152,7 @@ def extract_icon_data_from_cs(cs_file_path: str) -> List[Dict[str, Any]]:
             "name": name,
             "enum_name": enum_name,
             "category": category_key,
-            "keywords": list(set(keywords)),  # Remove duplicates
+            "keywords": sorted({normalize_text(keyword) for keyword in keywords}),  # Normalized as indexed, deduplicated
             "i18n": {
                 "en": name,
                 "zh": category
@@ -204,10 +206,10 @@ def main():
     }
 
     # Save to JSON
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(metadata, f, indent=2, ensure_ascii=False)
-
-    print(f"Saved to: {output_path}")
+    if write_json(output_path, metadata):
+        print(f"Saved to: {output_path}")
+    else:
+        print(f"Unchanged, not rewritten: {output_path}")
 
     # Statistics
     from collections import Counter
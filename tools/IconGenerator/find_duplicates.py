@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Duplicate Glyph Detector
+
+Segoe Fluent Icons maps many code points to identical outlines (legacy
+Segoe MDL2 code points, renamed icons), and add_common_aliases.py adds
+alias records that point at the same glyph again. This script hashes the
+canonical outline of every icon (contours, points and on-curve flags,
+independent of contour order and start points, see
+glyph_outlines.outline_hash), groups identical glyphs and proposes one
+canonical icon per group; the other records become aliases.
+
+The report is written to build/duplicates.json. With --apply, a
+deduplicated copy of IconMetadata.json is written as well: alias records
+are dropped and their names are merged into the canonical icon's
+"aliases" list (and their keywords into its "keywords").
+
+Usage:
+    python find_duplicates.py
+    python find_duplicates.py --apply --output build/IconMetadata.dedup.json
+"""
+
+import argparse
+import json
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from font_reader import open_font
+from glyph_outlines import outline_hash
+from json_output import write_json
+
+
+def group_identical_glyphs(font) -> Dict[str, List[int]]:
+    """
+    Group the font's cmap code points by outline hash.
+
+    Empty glyphs (space, control characters) are ignored.
+
+    Args:
+        font: An open font_reader font
+
+    Returns:
+        Outline hash -> sorted code points, only for hashes shared by two or
+        more code points
+    """
+    groups: Dict[str, List[int]] = defaultdict(list)
+    hashes_by_glyph: Dict[str, str] = {}
+    for code, glyph_name in sorted(font.get_best_cmap().items()):
+        # Code points sharing a glyph name share the hash; decode once
+        if glyph_name not in hashes_by_glyph:
+            contours = font.get_glyph_contours(glyph_name)
+            hashes_by_glyph[glyph_name] = outline_hash(contours) if contours else ""
+        glyph_hash = hashes_by_glyph[glyph_name]
+        if glyph_hash:
+            groups[glyph_hash].append(code)
+    return {glyph_hash: codes for glyph_hash, codes in groups.items() if len(codes) > 1}
+
+
+def canonical_sort_key(icon: Dict[str, Any]) -> Tuple:
+    """
+    Order icon records by how suitable they are as the canonical icon.
+
+    Prefers records that are not alias records, then verified records,
+    then the lowest code point, then the shortest name.
+    """
+    return (bool(icon.get('alias_of')), not icon.get('verified', False),
+            int(icon['unicode'], 16), len(icon['name']), icon['name'])
+
+
+def build_report(groups: Dict[str, List[int]], icons: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Propose a canonical icon for every group of identical glyphs.
+
+    Args:
+        groups: Outline hash -> code points (from group_identical_glyphs)
+        icons: Icon records from IconMetadata.json
+
+    Returns:
+        One entry per group that contains at least two icon records, sorted
+        by the canonical icon's code point
+    """
+    icons_by_code: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+    for icon in icons:
+        icons_by_code[int(icon['unicode'], 16)].append(icon)
+
+    report = []
+    for glyph_hash, codes in groups.items():
+        records = sorted((icon for code in codes for icon in icons_by_code.get(code, [])), key=canonical_sort_key)
+        if len(records) < 2:
+            continue
+
+        canonical, aliases = records[0], records[1:]
+        report.append({
+            "outline_hash": glyph_hash,
+            "canonical": {"name": canonical['name'], "unicode": canonical['unicode']},
+            "aliases": [{"name": icon['name'], "unicode": icon['unicode']} for icon in aliases],
+            "unnamed_codepoints": [f"{code:04X}" for code in codes if code not in icons_by_code],
+        })
+
+    report.sort(key=lambda entry: int(entry['canonical']['unicode'], 16))
+    return report
+
+
+def apply_report(data: Dict[str, Any], report: List[Dict[str, Any]]) -> int:
+    """
+    Merge alias records into their canonical icons, in place.
+
+    Args:
+        data: Parsed IconMetadata.json
+        report: Output of build_report
+
+    Returns:
+        Number of records removed
+    """
+    canonical_of: Dict[Tuple[str, str], Tuple[str, str]] = {}
+    for entry in report:
+        target = (entry['canonical']['name'], entry['canonical']['unicode'])
+        for alias in entry['aliases']:
+            canonical_of[(alias['name'], alias['unicode'])] = target
+
+    by_key = {(icon['name'], icon['unicode']): icon for icon in data['icons']}
+
+    kept = []
+    for icon in data['icons']:
+        key = (icon['name'], icon['unicode'])
+        if key not in canonical_of:
+            kept.append(icon)
+            continue
+
+        canonical = by_key[canonical_of[key]]
+        aliases = canonical.setdefault('aliases', [])
+        for name in [icon['name']] + icon.get('aliases', []):
+            if name != canonical['name'] and name not in aliases:
+                aliases.append(name)
+        keywords = canonical.setdefault('keywords', [])
+        for keyword in icon.get('keywords', []):
+            if keyword not in keywords:
+                keywords.append(keyword)
+
+    removed = len(data['icons']) - len(kept)
+    data['icons'] = kept
+    return removed
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    default_font = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+    default_metadata = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons" / "IconMetadata.json"
+
+    parser = argparse.ArgumentParser(description="Find icons with identical glyph outlines")
+    parser.add_argument("--font", type=Path, default=default_font, help="Source font file")
+    parser.add_argument("--metadata", type=Path, default=default_metadata, help="IconMetadata.json")
+    parser.add_argument("--report", type=Path, default=Path(__file__).parent / "build" / "duplicates.json",
+                        help="Report file")
+    parser.add_argument("--apply", action="store_true",
+                        help="Write a deduplicated IconMetadata.json with aliases merged")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Deduplicated metadata path for --apply (default: overwrite --metadata)")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Duplicate Glyph Detector")
+    print("=" * 60)
+
+    try:
+        with open(args.metadata, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        with open_font(str(args.font)) as font:
+            groups = group_identical_glyphs(font)
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        return 1
+
+    report = build_report(groups, data['icons'])
+    duplicate_records = sum(len(entry['aliases']) for entry in report)
+
+    write_json(args.report, {"groups": report})
+
+    print(f"Font code points with a shared outline: {sum(len(codes) for codes in groups.values())} "
+          f"in {len(groups)} groups")
+    print(f"Icon groups: {len(report)}")
+    print(f"Duplicate icon records: {duplicate_records} of {len(data['icons'])}")
+
+    print("\nLargest groups:")
+    for entry in sorted(report, key=lambda e: len(e['aliases']), reverse=True)[:10]:
+        aliases = ", ".join(alias['name'] for alias in entry['aliases'])
+        print(f"  {entry['canonical']['name']} ({entry['canonical']['unicode']}) <- {aliases}")
+
+    print(f"\nReport: {args.report}")
+
+    if args.apply:
+        output = args.output or args.metadata
+        removed = apply_report(data, report)
+        write_json(output, data)
+        print(f"✓ Removed {removed} duplicate records, {len(data['icons'])} icons left")
+        print(f"✓ Metadata: {output}")
+
+    print("=" * 60)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,308 @@
+#!/usr/bin/env python3
+"""
+Persistent Font Data Cache
+
+Stores the decoded cmap, glyph order, name/head fields, per-glyph layout
+metrics and outline hashes of a font on disk, keyed by the font's SHA-256.
+A small index remembers each font path's size and mtime so unchanged fonts
+are recognised without re-hashing them.
+
+On a cache hit no font parsing happens at all; on a miss the font is read
+through font_reader.open_font() and the result is stored for the next run.
+
+Usage:
+    from font_cache import open_cached_font
+
+    font = open_cached_font("Segoe Fluent Icons.ttf")
+    cmap = font.get_best_cmap()
+
+    python font_cache.py --clear        # invalidate all entries
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from font_reader import open_font
+
+
+# Bump when the entry layout or the decoding logic changes
+CACHE_FORMAT_VERSION = 4
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".cache" / "fonts"
+
+# Name IDs kept in the cache (copyright, family, subfamily, unique ID,
+# full name, version, PostScript name, typographic and WWS family/subfamily)
+CACHED_NAME_IDS = (0, 1, 2, 3, 4, 5, 6, 16, 17, 21, 22)
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Compute the SHA-256 of a file.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CachedFont:
+    """Font data restored from the cache, with the font_reader interface."""
+
+    def __init__(self, font_path: Path, entry: Dict, from_cache: bool):
+        """
+        Initialize from a cache entry.
+
+        Args:
+            font_path: Path of the font the entry describes
+            entry: Decoded cache entry
+            from_cache: True if the entry was read from disk (cache hit)
+        """
+        self.font_path = font_path
+        self.sha256: str = entry["sha256"]
+        self.from_cache = from_cache
+        self._cmap = {int(code, 16): name for code, name in entry["cmap"].items()}
+        self._glyph_order: List[str] = entry["glyph_order"]
+        self._names = {int(name_id): text for name_id, text in entry["names"].items()}
+        self._best_full_name: Optional[str] = entry["best_full_name"]
+        self.font_revision: float = entry["head"]["font_revision"]
+        self.units_per_em: int = entry["head"]["units_per_em"]
+        self._metrics: Dict[str, Dict[str, Any]] = entry["metrics"]
+        self._outline_hashes: Dict[str, str] = entry["outline_hashes"]
+
+    def __enter__(self) -> "CachedFont":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Nothing to release; present for interface compatibility."""
+
+    @property
+    def num_glyphs(self) -> int:
+        """Number of glyphs in the font."""
+        return len(self._glyph_order)
+
+    def get_best_cmap(self) -> Dict[int, str]:
+        """Get the preferred Unicode cmap as code point -> glyph name."""
+        return self._cmap
+
+    def get_glyph_order(self) -> List[str]:
+        """Get glyph names in glyph ID order."""
+        return self._glyph_order
+
+    def get_debug_name(self, name_id: int) -> Optional[str]:
+        """Get a cached name string (see CACHED_NAME_IDS)."""
+        return self._names.get(name_id)
+
+    def get_best_full_name(self) -> Optional[str]:
+        """Get the font's full name."""
+        return self._best_full_name
+
+    def get_glyph_metrics(self, glyph_name: str) -> Dict[str, Any]:
+        """Get em-normalized layout metrics (see glyph_outlines.glyph_metrics)."""
+        if glyph_name not in self._metrics:
+            raise KeyError(f"Unknown glyph: {glyph_name}")
+        return self._metrics[glyph_name]
+
+    def get_outline_hash(self, glyph_name: str) -> str:
+        """Get the hash of a glyph's outline (see glyph_outlines.outline_hash)."""
+        if glyph_name not in self._outline_hashes:
+            raise KeyError(f"Unknown glyph: {glyph_name}")
+        return self._outline_hashes[glyph_name]
+
+
+class FontCache:
+    """On-disk cache of decoded font data."""
+
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Directory for cache files (default: .cache/fonts next to this script)
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.index_path = self.cache_dir / "index.json"
+
+    def _load_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: Dict[str, Dict]) -> None:
+        self._write_json(self.index_path, index)
+
+    def _write_json(self, path: Path, data: Dict) -> None:
+        # Write to a temporary file first so an interrupted run never leaves
+        # a truncated entry behind; the PID keeps parallel builds apart
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+    def font_hash(self, font_path: Path) -> str:
+        """
+        Get the SHA-256 of a font, reusing the indexed hash if size and mtime match.
+
+        Args:
+            font_path: Font file
+
+        Returns:
+            Hex digest
+        """
+        stat = font_path.stat()
+        key = str(font_path.resolve())
+        index = self._load_index()
+
+        known = index.get(key)
+        if known and known.get("size") == stat.st_size and known.get("mtime_ns") == stat.st_mtime_ns:
+            return known["sha256"]
+
+        sha256 = file_sha256(font_path)
+        index[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha256}
+        self._save_index(index)
+        return sha256
+
+    def entry_path(self, sha256: str) -> Path:
+        """Path of the cache entry for a font hash."""
+        return self.cache_dir / f"{sha256}.json"
+
+    def load(self, sha256: str) -> Optional[Dict]:
+        """
+        Load a cache entry.
+
+        Args:
+            sha256: Font hash
+
+        Returns:
+            The entry, or None if missing, corrupt or from another cache format
+        """
+        try:
+            with open(self.entry_path(sha256), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("version") != CACHE_FORMAT_VERSION or entry.get("sha256") != sha256:
+            return None
+        return entry
+
+    def store(self, sha256: str, font) -> Dict:
+        """
+        Decode a font and store its entry.
+
+        Args:
+            sha256: Font hash
+            font: An open font_reader font
+
+        Returns:
+            The stored entry
+        """
+        names = {}
+        for name_id in CACHED_NAME_IDS:
+            text = font.get_debug_name(name_id)
+            if text is not None:
+                names[str(name_id)] = text
+
+        entry = {
+            "version": CACHE_FORMAT_VERSION,
+            "sha256": sha256,
+            "cmap": {f"{code:X}": name for code, name in sorted(font.get_best_cmap().items())},
+            "glyph_order": list(font.get_glyph_order()),
+            "metrics": {name: font.get_glyph_metrics(name) for name in font.get_glyph_order()},
+            "outline_hashes": {name: font.get_outline_hash(name) for name in font.get_glyph_order()},
+            "names": names,
+            "best_full_name": font.get_best_full_name(),
+            "head": {
+                "font_revision": font.font_revision,
+                "units_per_em": font.units_per_em,
+            },
+        }
+        self._write_json(self.entry_path(sha256), entry)
+        return entry
+
+    def clear(self) -> int:
+        """
+        Delete all cache entries and the index.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        if self.cache_dir.exists():
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink()
+                removed += 1
+        return removed
+
+
+def open_cached_font(font_path: str, use_cache: bool = True, use_fonttools: bool = False,
+                     cache_dir: Optional[Path] = None):
+    """
+    Open a font, serving its decoded tables from the cache when possible.
+
+    Args:
+        font_path: Path to the font file
+        use_cache: Set to False to bypass the cache entirely
+        use_fonttools: Decode with fontTools instead of font_reader on a miss
+        cache_dir: Override the cache directory
+
+    Returns:
+        CachedFont, or a font_reader font when the cache is disabled
+    """
+    path = Path(font_path)
+    if not use_cache:
+        return open_font(str(path), use_fonttools=use_fonttools)
+
+    if not path.exists():
+        raise FileNotFoundError(f"Font file not found: {path}")
+
+    cache = FontCache(cache_dir)
+    sha256 = cache.font_hash(path)
+
+    entry = cache.load(sha256)
+    if entry is not None:
+        return CachedFont(path, entry, from_cache=True)
+
+    with open_font(str(path), use_fonttools=use_fonttools) as font:
+        entry = cache.store(sha256, font)
+    return CachedFont(path, entry, from_cache=False)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Manage the decoded font cache")
+    parser.add_argument("--clear", action="store_true", help="Delete all cache entries")
+    parser.add_argument("--cache-dir", type=Path, default=None, help="Cache directory")
+    args = parser.parse_args()
+
+    cache = FontCache(args.cache_dir)
+    if args.clear:
+        removed = cache.clear()
+        print(f"Removed {removed} cache files from: {cache.cache_dir}")
+    else:
+        entries = [p for p in cache.cache_dir.glob("*.json") if p != cache.index_path] \
+            if cache.cache_dir.exists() else []
+        print(f"Cache directory: {cache.cache_dir}")
+        print(f"Cached fonts: {len(entries)}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,824 @@
+#!/usr/bin/env python3
+"""
+Lightweight TrueType Font Reader
+
+Reads just the parts of a TrueType font the icon generators need (table
+directory, cmap formats 4/12, name, head, hhea, hmtx, maxp, post glyph
+names and glyf/loca outlines and bounds) straight from a memory-mapped file,
+without importing fontTools.
+
+fontTools is kept as a fallback: open_font() returns a FontToolsFontReader
+when the raw reader cannot handle a font, and both readers expose the same
+interface.
+
+Usage:
+    from font_reader import open_font
+
+    with open_font("Segoe Fluent Icons.ttf") as font:
+        cmap = font.get_best_cmap()
+        print(font.get_best_full_name(), len(cmap))
+"""
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# One contour: (x, y, on_curve) points in font units
+Contour = List[Tuple[float, float, bool]]
+
+
+# Same preference order as fontTools' table__c_m_a_p.getBestCmap()
+CMAP_PREFERENCES = (
+    (3, 10),
+    (0, 6),
+    (0, 4),
+    (3, 1),
+    (0, 3),
+    (0, 2),
+    (0, 1),
+    (0, 0),
+)
+
+# Standard Macintosh glyph order used by 'post' table formats 1.0 and 2.0
+MAC_GLYPH_NAMES = """
+.notdef .null nonmarkingreturn space exclam quotedbl numbersign dollar percent
+ampersand quotesingle parenleft parenright asterisk plus comma hyphen period
+slash zero one two three four five six seven eight nine colon semicolon less
+equal greater question at A B C D E F G H I J K L M N O P Q R S T U V W X Y Z
+bracketleft backslash bracketright asciicircum underscore grave a b c d e f g h
+i j k l m n o p q r s t u v w x y z braceleft bar braceright asciitilde
+Adieresis Aring Ccedilla Eacute Ntilde Odieresis Udieresis aacute agrave
+acircumflex adieresis atilde aring ccedilla eacute egrave ecircumflex edieresis
+iacute igrave icircumflex idieresis ntilde oacute ograve ocircumflex odieresis
+otilde uacute ugrave ucircumflex udieresis dagger degree cent sterling section
+bullet paragraph germandbls registered copyright trademark acute dieresis
+notequal AE Oslash infinity plusminus lessequal greaterequal yen mu partialdiff
+summation product pi integral ordfeminine ordmasculine Omega ae oslash
+questiondown exclamdown logicalnot radical florin approxequal Delta
+guillemotleft guillemotright ellipsis nonbreakingspace Agrave Atilde Otilde OE
+oe endash emdash quotedblleft quotedblright quoteleft quoteright divide lozenge
+ydieresis Ydieresis fraction currency guilsinglleft guilsinglright fi fl
+daggerdbl periodcentered quotesinglbase quotedblbase perthousand Acircumflex
+Ecircumflex Aacute Edieresis Egrave Iacute Icircumflex Idieresis Igrave Oacute
+Ocircumflex apple Ograve Uacute Ucircumflex Ugrave dotlessi circumflex tilde
+macron breve dotaccent ring cedilla hungarumlaut ogonek caron Lslash lslash
+Scaron scaron Zcaron zcaron brokenbar Eth eth Yacute yacute Thorn thorn minus
+multiply onesuperior twosuperior threesuperior onehalf onequarter threequarters
+franc Gbreve gbreve Idotaccent Scedilla scedilla Cacute cacute Ccaron ccaron
+dcroat
+""".split()
+
+# Composite glyph component flags
+ARG_1_AND_2_ARE_WORDS = 0x0001
+ARGS_ARE_XY_VALUES = 0x0002
+WE_HAVE_A_SCALE = 0x0008
+MORE_COMPONENTS = 0x0020
+WE_HAVE_AN_X_AND_Y_SCALE = 0x0040
+WE_HAVE_A_TWO_BY_TWO = 0x0080
+
+# Adobe Glyph List names for printable ASCII (U+0020..U+007E) coincide with
+# the Macintosh standard names 3..97. Other code points are named uniXXXX.
+ASCII_GLYPH_NAMES = {0x20 + i: name for i, name in enumerate(MAC_GLYPH_NAMES[3:98])}
+
+
+class FontReaderError(Exception):
+    """Raised when a font uses a feature the raw reader does not decode."""
+
+
+class RawFontReader:
+    """Decode selected TrueType tables directly from a memory-mapped file."""
+
+    def __init__(self, font_path: str):
+        """
+        Open and memory-map the font file.
+
+        Args:
+            font_path: Path to the .ttf font file
+        """
+        self.font_path = Path(font_path)
+        if not self.font_path.exists():
+            raise FileNotFoundError(f"Font file not found: {self.font_path}")
+
+        self.tables: Dict[str, Tuple[int, int]] = {}
+        self._cmap: Optional[Dict[int, str]] = None
+        self._glyph_order: Optional[List[str]] = None
+        self._names: Optional[List[Tuple[int, int, int, int, str]]] = None
+        self._glyph_ids: Optional[Dict[str, int]] = None
+        self._loca: Optional[Tuple[int, ...]] = None
+        self._fallback: Optional["FontToolsFontReader"] = None
+        self._buf = None
+
+        self._file = open(self.font_path, 'rb')
+        try:
+            self._buf = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_table_directory()
+        except ValueError:
+            # mmap refuses zero-length files
+            self.close()
+            raise FontReaderError(f"Font file is empty: {self.font_path}")
+        except Exception:
+            self.close()
+            raise
+
+    def __enter__(self) -> "RawFontReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map and file handle."""
+        if self._fallback is not None:
+            self._fallback.close()
+            self._fallback = None
+        if self._buf is not None:
+            self._buf.close()
+            self._buf = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # Table directory
+    # ------------------------------------------------------------------
+
+    def _read_table_directory(self) -> None:
+        """Read the sfnt header and table records."""
+        if len(self._buf) < 12:
+            raise FontReaderError("File too small to be a TrueType font")
+
+        sfnt_version, num_tables = struct.unpack_from('>4sH', self._buf, 0)
+        if sfnt_version not in (b'\x00\x01\x00\x00', b'true'):
+            # OpenType/CFF, collections and WOFF are left to fontTools
+            raise FontReaderError(f"Unsupported sfnt version: {sfnt_version!r}")
+
+        for i in range(num_tables):
+            tag, _checksum, offset, length = struct.unpack_from('>4sIII', self._buf, 12 + i * 16)
+            if offset + length > len(self._buf):
+                raise FontReaderError(f"Table {tag!r} extends past end of file")
+            self.tables[tag.decode('latin-1')] = (offset, length)
+
+    def has_table(self, tag: str) -> bool:
+        """Return True if the font contains the given table."""
+        return tag in self.tables
+
+    def get_table_data(self, tag: str) -> memoryview:
+        """
+        Get a zero-copy view of a table's bytes.
+
+        The view must be released before close() is called.
+
+        Args:
+            tag: Four-character table tag (e.g., 'cmap')
+
+        Returns:
+            memoryview over the table data
+        """
+        if tag not in self.tables:
+            raise FontReaderError(f"Font has no '{tag}' table")
+        offset, length = self.tables[tag]
+        return memoryview(self._buf)[offset:offset + length]
+
+    def _table_offset(self, tag: str) -> int:
+        if tag not in self.tables:
+            raise FontReaderError(f"Font has no '{tag}' table")
+        return self.tables[tag][0]
+
+    # ------------------------------------------------------------------
+    # head / maxp
+    # ------------------------------------------------------------------
+
+    @property
+    def font_revision(self) -> float:
+        """Font revision from the 'head' table (16.16 fixed point)."""
+        (revision,) = struct.unpack_from('>i', self._buf, self._table_offset('head') + 4)
+        return revision / 65536.0
+
+    @property
+    def units_per_em(self) -> int:
+        """Units per em from the 'head' table."""
+        (upem,) = struct.unpack_from('>H', self._buf, self._table_offset('head') + 18)
+        return upem
+
+    @property
+    def num_glyphs(self) -> int:
+        """Number of glyphs from the 'maxp' table."""
+        (count,) = struct.unpack_from('>H', self._buf, self._table_offset('maxp') + 4)
+        return count
+
+    @property
+    def ascender(self) -> int:
+        """Typographic ascender from the 'hhea' table."""
+        (value,) = struct.unpack_from('>h', self._buf, self._table_offset('hhea') + 4)
+        return value
+
+    @property
+    def descender(self) -> int:
+        """Typographic descender from the 'hhea' table (negative below baseline)."""
+        (value,) = struct.unpack_from('>h', self._buf, self._table_offset('hhea') + 6)
+        return value
+
+    # ------------------------------------------------------------------
+    # hmtx
+    # ------------------------------------------------------------------
+
+    def get_advance_width(self, glyph_name: str) -> int:
+        """
+        Get a glyph's advance width from the 'hmtx' table.
+
+        Glyphs past numberOfHMetrics share the last full metric's advance.
+
+        Args:
+            glyph_name: Glyph name
+
+        Returns:
+            Advance width in font units
+        """
+        gid = self.get_glyph_id(glyph_name)
+        (num_h_metrics,) = struct.unpack_from('>H', self._buf, self._table_offset('hhea') + 34)
+        index = min(gid, num_h_metrics - 1)
+        (advance,) = struct.unpack_from('>H', self._buf, self._table_offset('hmtx') + index * 4)
+        return advance
+
+    # ------------------------------------------------------------------
+    # cmap
+    # ------------------------------------------------------------------
+
+    def _cmap_subtables(self) -> List[Tuple[int, int, int]]:
+        """Return (platformID, encodingID, absolute offset) for each subtable."""
+        base = self._table_offset('cmap')
+        _version, count = struct.unpack_from('>HH', self._buf, base)
+        subtables = []
+        for i in range(count):
+            platform_id, encoding_id, offset = struct.unpack_from('>HHI', self._buf, base + 4 + i * 8)
+            subtables.append((platform_id, encoding_id, base + offset))
+        return subtables
+
+    def _decode_cmap_subtable(self, offset: int) -> Dict[int, int]:
+        """Decode a format 4 or 12 subtable into a code point -> glyph ID map."""
+        (fmt,) = struct.unpack_from('>H', self._buf, offset)
+        if fmt == 4:
+            return self._decode_cmap_format_4(offset)
+        if fmt == 12:
+            return self._decode_cmap_format_12(offset)
+        raise FontReaderError(f"Unsupported cmap subtable format: {fmt}")
+
+    def _decode_cmap_format_4(self, offset: int) -> Dict[int, int]:
+        buf = self._buf
+        (seg_count_x2,) = struct.unpack_from('>H', buf, offset + 6)
+        seg_count = seg_count_x2 // 2
+
+        end_codes_at = offset + 14
+        start_codes_at = end_codes_at + seg_count_x2 + 2  # skip reservedPad
+        deltas_at = start_codes_at + seg_count_x2
+        range_offsets_at = deltas_at + seg_count_x2
+
+        end_codes = struct.unpack_from(f'>{seg_count}H', buf, end_codes_at)
+        start_codes = struct.unpack_from(f'>{seg_count}H', buf, start_codes_at)
+        deltas = struct.unpack_from(f'>{seg_count}h', buf, deltas_at)
+        range_offsets = struct.unpack_from(f'>{seg_count}H', buf, range_offsets_at)
+
+        mapping: Dict[int, int] = {}
+        for i in range(seg_count):
+            start, end, delta, range_offset = start_codes[i], end_codes[i], deltas[i], range_offsets[i]
+            if start == 0xFFFF:
+                continue
+            if range_offset == 0:
+                for code in range(start, end + 1):
+                    mapping[code] = (code + delta) & 0xFFFF
+            else:
+                # idRangeOffset is relative to its own position in the array
+                glyphs_at = range_offsets_at + i * 2 + range_offset
+                count = end - start + 1
+                glyph_ids = struct.unpack_from(f'>{count}H', buf, glyphs_at)
+                for code, glyph_id in zip(range(start, end + 1), glyph_ids):
+                    if glyph_id != 0:
+                        mapping[code] = (glyph_id + delta) & 0xFFFF
+        return mapping
+
+    def _decode_cmap_format_12(self, offset: int) -> Dict[int, int]:
+        (num_groups,) = struct.unpack_from('>I', self._buf, offset + 12)
+        mapping: Dict[int, int] = {}
+        for start, end, start_glyph in struct.iter_unpack('>III', self._buf[offset + 16:offset + 16 + num_groups * 12]):
+            for code in range(start, end + 1):
+                mapping[code] = start_glyph + (code - start)
+        return mapping
+
+    def get_best_cmap_ids(self) -> Dict[int, int]:
+        """
+        Get the preferred Unicode cmap as code point -> glyph ID.
+
+        Returns:
+            Mapping of code point to glyph index
+        """
+        subtables = {(p, e): off for p, e, off in self._cmap_subtables()}
+        for key in CMAP_PREFERENCES:
+            if key in subtables:
+                return self._decode_cmap_subtable(subtables[key])
+        return {}
+
+    def get_best_cmap(self) -> Dict[int, str]:
+        """
+        Get the preferred Unicode cmap as code point -> glyph name.
+
+        Equivalent to fontTools' TTFont['cmap'].getBestCmap().
+
+        Returns:
+            Mapping of code point to glyph name
+        """
+        if self._cmap is None:
+            glyph_order = self.get_glyph_order()
+            self._cmap = {code: glyph_order[gid] for code, gid in self.get_best_cmap_ids().items()
+                          if gid < len(glyph_order)}
+        return self._cmap
+
+    # ------------------------------------------------------------------
+    # Glyph order
+    # ------------------------------------------------------------------
+
+    def get_glyph_order(self) -> List[str]:
+        """
+        Get glyph names in glyph ID order.
+
+        Names come from the 'post' table when it carries them (formats 1.0
+        and 2.0); otherwise they are derived from the cmap the same way
+        fontTools does (uniXXXX / uXXXXX, with '.altN' suffixes for glyphs
+        reached from several code points).
+
+        Returns:
+            List of glyph names
+        """
+        if self._glyph_order is None:
+            names = self._read_post_glyph_names()
+            if names is None:
+                names = self._glyph_names_from_cmap()
+            self._glyph_order = names
+        return self._glyph_order
+
+    def _read_post_glyph_names(self) -> Optional[List[str]]:
+        if 'post' not in self.tables:
+            return None
+
+        base = self._table_offset('post')
+        (version,) = struct.unpack_from('>I', self._buf, base)
+        if version == 0x00010000:
+            return list(MAC_GLYPH_NAMES[:self.num_glyphs])
+        if version != 0x00020000:
+            return None
+
+        (count,) = struct.unpack_from('>H', self._buf, base + 32)
+        indices = struct.unpack_from(f'>{count}H', self._buf, base + 34)
+
+        # Pascal strings follow the index array
+        extra_names = []
+        pos = base + 34 + count * 2
+        end = base + self.tables['post'][1]
+        while pos < end:
+            length = self._buf[pos]
+            extra_names.append(self._buf[pos + 1:pos + 1 + length].decode('latin-1'))
+            pos += 1 + length
+
+        names = []
+        for index in indices:
+            if index < 258:
+                names.append(MAC_GLYPH_NAMES[index])
+            elif index - 258 < len(extra_names):
+                names.append(extra_names[index - 258])
+            else:
+                raise FontReaderError(f"Invalid 'post' glyph name index: {index}")
+        return names
+
+    def _glyph_names_from_cmap(self) -> List[str]:
+        names = ["glyph%.5d" % i for i in range(self.num_glyphs)]
+        if names:
+            names[0] = ".notdef"
+
+        # Lowest Unicode code point reaching each glyph, across all Unicode subtables
+        reversed_min: Dict[int, int] = {}
+        for platform_id, encoding_id, offset in self._cmap_subtables():
+            if not (platform_id == 0 or (platform_id == 3 and encoding_id in (0, 1, 10))):
+                continue
+            for code, gid in self._decode_cmap_subtable(offset).items():
+                if gid not in reversed_min or code < reversed_min[gid]:
+                    reversed_min[gid] = code
+
+        use_count: Dict[str, int] = {}
+        for gid in range(len(names)):
+            if gid not in reversed_min:
+                continue
+            code = reversed_min[gid]
+            if code in ASCII_GLYPH_NAMES:
+                name = ASCII_GLYPH_NAMES[code]
+            elif code <= 0xFFFF:
+                name = "uni%04X" % code
+            else:
+                name = "u%X" % code
+            uses = use_count[name] = use_count.get(name, 0) + 1
+            if uses > 1:
+                name = "%s.alt%d" % (name, uses - 1)
+            names[gid] = name
+        return names
+
+    # ------------------------------------------------------------------
+    # name
+    # ------------------------------------------------------------------
+
+    def _read_names(self) -> List[Tuple[int, int, int, int, str]]:
+        if self._names is not None:
+            return self._names
+
+        base = self._table_offset('name')
+        _fmt, count, string_offset = struct.unpack_from('>HHH', self._buf, base)
+        storage = base + string_offset
+
+        names = []
+        for i in range(count):
+            platform_id, encoding_id, language_id, name_id, length, offset = \
+                struct.unpack_from('>6H', self._buf, base + 6 + i * 12)
+            raw = self._buf[storage + offset:storage + offset + length]
+            if platform_id in (0, 3):
+                encoding = 'utf-16-be'
+            elif platform_id == 1 and encoding_id == 0:
+                encoding = 'mac_roman'
+            else:
+                continue
+            try:
+                text = raw.decode(encoding)
+            except UnicodeDecodeError:
+                continue
+            names.append((platform_id, encoding_id, language_id, name_id, text))
+
+        self._names = names
+        return names
+
+    def get_debug_name(self, name_id: int) -> Optional[str]:
+        """
+        Get a name string, preferring English records.
+
+        Equivalent to fontTools' table__n_a_m_e.getDebugName().
+
+        Args:
+            name_id: OpenType name ID (e.g., 0 = copyright, 4 = full name)
+
+        Returns:
+            Name string, or None if the font has no such record
+        """
+        some_name = None
+        for platform_id, _encoding_id, language_id, nid, text in self._read_names():
+            if nid != name_id:
+                continue
+            some_name = text
+            if (platform_id, language_id) in ((1, 0), (3, 0x409)):
+                return text
+        return some_name
+
+    def get_best_full_name(self) -> Optional[str]:
+        """
+        Get the font's full name.
+
+        Equivalent to fontTools' table__n_a_m_e.getBestFullName().
+
+        Returns:
+            Full font name, or None if no suitable record exists
+        """
+        for name_ids in ((21, 22), (16, 17), (1, 2), (4,), (6,)):
+            if len(name_ids) == 2:
+                family = self.get_debug_name(name_ids[0])
+                subfamily = self.get_debug_name(name_ids[1])
+                if family is None or subfamily is None:
+                    continue
+                if subfamily.lower() == "regular":
+                    return family
+                return f"{family} {subfamily}"
+            name = self.get_debug_name(name_ids[0])
+            if name is not None:
+                return name
+        return None
+
+    # ------------------------------------------------------------------
+    # glyf / loca
+    # ------------------------------------------------------------------
+
+    def get_glyph_id(self, glyph_name: str) -> int:
+        """
+        Look up a glyph ID by name.
+
+        Args:
+            glyph_name: Glyph name from get_glyph_order() or get_best_cmap()
+
+        Returns:
+            Glyph index
+        """
+        if self._glyph_ids is None:
+            self._glyph_ids = {name: gid for gid, name in enumerate(self.get_glyph_order())}
+        if glyph_name not in self._glyph_ids:
+            raise KeyError(f"Unknown glyph: {glyph_name}")
+        return self._glyph_ids[glyph_name]
+
+    def _glyph_location(self, gid: int) -> Tuple[int, int]:
+        """Return (absolute offset, length) of a glyph's 'glyf' record."""
+        if self._loca is None:
+            (index_to_loc_format,) = struct.unpack_from('>h', self._buf, self._table_offset('head') + 50)
+            count = self.num_glyphs + 1
+            if index_to_loc_format == 0:
+                self._loca = tuple(o * 2 for o in struct.unpack_from(f'>{count}H', self._buf, self._table_offset('loca')))
+            else:
+                self._loca = struct.unpack_from(f'>{count}I', self._buf, self._table_offset('loca'))
+        start, end = self._loca[gid], self._loca[gid + 1]
+        return self._table_offset('glyf') + start, end - start
+
+    def get_glyph_contours(self, glyph_name: str) -> List[Contour]:
+        """
+        Decode a glyph's outline, with composite glyphs flattened.
+
+        Glyphs the raw decoder does not support (point-anchored composites,
+        damaged records) are decoded by fontTools instead.
+
+        Args:
+            glyph_name: Glyph name
+
+        Returns:
+            List of contours of (x, y, on_curve) points in font units
+        """
+        gid = self.get_glyph_id(glyph_name)
+        try:
+            return self._decode_glyph(gid, depth=0)
+        except (FontReaderError, struct.error, IndexError):
+            if self._fallback is None:
+                self._fallback = FontToolsFontReader(str(self.font_path))
+            return self._fallback.get_glyph_contours(glyph_name)
+
+    def get_glyph_bounds(self, glyph_name: str) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Get a glyph's ink bounds from its 'glyf' header.
+
+        Args:
+            glyph_name: Glyph name
+
+        Returns:
+            (xMin, yMin, xMax, yMax) in font units, or None for empty glyphs
+        """
+        offset, length = self._glyph_location(self.get_glyph_id(glyph_name))
+        if length == 0:
+            return None
+        return struct.unpack_from('>4h', self._buf, offset + 2)
+
+    def get_glyph_metrics(self, glyph_name: str) -> Dict[str, Any]:
+        """Get em-normalized layout metrics (see glyph_outlines.glyph_metrics)."""
+        from glyph_outlines import glyph_metrics
+        return glyph_metrics(self, glyph_name)
+
+    def get_outline_hash(self, glyph_name: str) -> str:
+        """Get the hash of a glyph's outline (see glyph_outlines.outline_hash)."""
+        from glyph_outlines import outline_hash
+        return outline_hash(self.get_glyph_contours(glyph_name))
+
+    def _decode_glyph(self, gid: int, depth: int) -> List[Contour]:
+        if depth > 8:
+            raise FontReaderError(f"Composite glyph nesting too deep at glyph {gid}")
+
+        offset, length = self._glyph_location(gid)
+        if length == 0:
+            return []
+
+        buf = self._buf
+        (num_contours,) = struct.unpack_from('>h', buf, offset)
+        if num_contours < 0:
+            return self._decode_composite_glyph(offset + 10, depth)
+
+        end_points = struct.unpack_from(f'>{num_contours}H', buf, offset + 10)
+        num_points = end_points[-1] + 1 if num_contours else 0
+        pos = offset + 10 + num_contours * 2
+        (instruction_length,) = struct.unpack_from('>H', buf, pos)
+        pos += 2 + instruction_length
+
+        flags = []
+        while len(flags) < num_points:
+            flag = buf[pos]
+            pos += 1
+            flags.append(flag)
+            if flag & 0x08:
+                repeat = buf[pos]
+                pos += 1
+                flags.extend([flag] * repeat)
+
+        xs = []
+        value = 0
+        for flag in flags:
+            if flag & 0x02:
+                delta = buf[pos]
+                pos += 1
+                value += delta if flag & 0x10 else -delta
+            elif not flag & 0x10:
+                (delta,) = struct.unpack_from('>h', buf, pos)
+                pos += 2
+                value += delta
+            xs.append(value)
+
+        ys = []
+        value = 0
+        for flag in flags:
+            if flag & 0x04:
+                delta = buf[pos]
+                pos += 1
+                value += delta if flag & 0x20 else -delta
+            elif not flag & 0x20:
+                (delta,) = struct.unpack_from('>h', buf, pos)
+                pos += 2
+                value += delta
+            ys.append(value)
+
+        contours = []
+        start = 0
+        for end in end_points:
+            contours.append([(xs[i], ys[i], bool(flags[i] & 0x01)) for i in range(start, end + 1)])
+            start = end + 1
+        return contours
+
+    def _decode_composite_glyph(self, pos: int, depth: int) -> List[Contour]:
+        buf = self._buf
+        contours: List[Contour] = []
+        while True:
+            flags, component_gid = struct.unpack_from('>HH', buf, pos)
+            pos += 4
+            if not flags & ARGS_ARE_XY_VALUES:
+                # Point-matched anchoring is not used by icon fonts
+                raise FontReaderError("Composite glyphs anchored by point numbers are not supported")
+            if flags & ARG_1_AND_2_ARE_WORDS:
+                dx, dy = struct.unpack_from('>hh', buf, pos)
+                pos += 4
+            else:
+                dx, dy = struct.unpack_from('>bb', buf, pos)
+                pos += 2
+
+            xx, xy, yx, yy = 1.0, 0.0, 0.0, 1.0
+            if flags & WE_HAVE_A_SCALE:
+                (scale,) = struct.unpack_from('>h', buf, pos)
+                xx = yy = scale / 16384.0
+                pos += 2
+            elif flags & WE_HAVE_AN_X_AND_Y_SCALE:
+                sx, sy = struct.unpack_from('>hh', buf, pos)
+                xx, yy = sx / 16384.0, sy / 16384.0
+                pos += 4
+            elif flags & WE_HAVE_A_TWO_BY_TWO:
+                a, b, c, d = struct.unpack_from('>hhhh', buf, pos)
+                xx, xy, yx, yy = a / 16384.0, b / 16384.0, c / 16384.0, d / 16384.0
+                pos += 8
+
+            transformed = (xx, xy, yx, yy) != (1.0, 0.0, 0.0, 1.0)
+            for contour in self._decode_glyph(component_gid, depth + 1):
+                if transformed:
+                    contours.append([(x * xx + y * yx + dx, x * xy + y * yy + dy, on) for x, y, on in contour])
+                else:
+                    contours.append([(x + dx, y + dy, on) for x, y, on in contour])
+
+            if not flags & MORE_COMPONENTS:
+                return contours
+
+
+class FontToolsFontReader:
+    """RawFontReader-compatible wrapper around fontTools.ttLib.TTFont."""
+
+    def __init__(self, font_path: str):
+        """
+        Open the font with fontTools.
+
+        Args:
+            font_path: Path to the font file
+        """
+        from fontTools.ttLib import TTFont
+
+        self.font_path = Path(font_path)
+        if not self.font_path.exists():
+            raise FileNotFoundError(f"Font file not found: {self.font_path}")
+        self.font = TTFont(str(self.font_path))
+
+    def __enter__(self) -> "FontToolsFontReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying TTFont."""
+        if self.font is not None:
+            self.font.close()
+            self.font = None
+
+    def has_table(self, tag: str) -> bool:
+        """Return True if the font contains the given table."""
+        return tag in self.font
+
+    @property
+    def font_revision(self) -> float:
+        """Font revision from the 'head' table."""
+        return float(self.font['head'].fontRevision)
+
+    @property
+    def units_per_em(self) -> int:
+        """Units per em from the 'head' table."""
+        return self.font['head'].unitsPerEm
+
+    @property
+    def num_glyphs(self) -> int:
+        """Number of glyphs in the font."""
+        return len(self.font.getGlyphOrder())
+
+    @property
+    def ascender(self) -> int:
+        """Typographic ascender from the 'hhea' table."""
+        return self.font['hhea'].ascent
+
+    @property
+    def descender(self) -> int:
+        """Typographic descender from the 'hhea' table."""
+        return self.font['hhea'].descent
+
+    def get_best_cmap(self) -> Dict[int, str]:
+        """Get the preferred Unicode cmap as code point -> glyph name."""
+        return self.font['cmap'].getBestCmap() or {}
+
+    def get_best_cmap_ids(self) -> Dict[int, int]:
+        """Get the preferred Unicode cmap as code point -> glyph ID."""
+        return {code: self.font.getGlyphID(name) for code, name in self.get_best_cmap().items()}
+
+    def get_glyph_order(self) -> List[str]:
+        """Get glyph names in glyph ID order."""
+        return self.font.getGlyphOrder()
+
+    def get_debug_name(self, name_id: int) -> Optional[str]:
+        """Get a name string, preferring English records."""
+        return self.font['name'].getDebugName(name_id)
+
+    def get_best_full_name(self) -> Optional[str]:
+        """Get the font's full name."""
+        return self.font['name'].getBestFullName()
+
+    def get_glyph_id(self, glyph_name: str) -> int:
+        """Look up a glyph ID by name."""
+        return self.font.getGlyphID(glyph_name)
+
+    def get_advance_width(self, glyph_name: str) -> int:
+        """Get a glyph's advance width from the 'hmtx' table."""
+        return self.font['hmtx'][glyph_name][0]
+
+    def get_glyph_bounds(self, glyph_name: str) -> Optional[Tuple[int, int, int, int]]:
+        """Get a glyph's ink bounds as (xMin, yMin, xMax, yMax), or None for empty glyphs."""
+        glyph = self.font['glyf'][glyph_name]
+        if glyph.numberOfContours == 0:
+            return None
+        return glyph.xMin, glyph.yMin, glyph.xMax, glyph.yMax
+
+    def get_glyph_metrics(self, glyph_name: str) -> Dict[str, Any]:
+        """Get em-normalized layout metrics (see glyph_outlines.glyph_metrics)."""
+        from glyph_outlines import glyph_metrics
+        return glyph_metrics(self, glyph_name)
+
+    def get_outline_hash(self, glyph_name: str) -> str:
+        """Get the hash of a glyph's outline (see glyph_outlines.outline_hash)."""
+        from glyph_outlines import outline_hash
+        return outline_hash(self.get_glyph_contours(glyph_name))
+
+    def get_glyph_contours(self, glyph_name: str) -> List[Contour]:
+        """Decode a glyph's outline, with composite glyphs flattened."""
+        glyf = self.font['glyf']
+        coordinates, end_points, flags = glyf[glyph_name].getCoordinates(glyf)
+        contours = []
+        start = 0
+        for end in end_points:
+            contours.append([(coordinates[i][0], coordinates[i][1], bool(flags[i] & 0x01))
+                             for i in range(start, end + 1)])
+            start = end + 1
+        return contours
+
+
+def open_font(font_path: str, use_fonttools: bool = False):
+    """
+    Open a font with the raw reader, falling back to fontTools.
+
+    The raw reader is validated eagerly (table directory, cmap and glyph
+    order); glyph outlines it cannot decode later fall back to fontTools
+    glyph by glyph, so callers never see a FontReaderError halfway through
+    a run.
+
+    Args:
+        font_path: Path to the font file
+        use_fonttools: Skip the raw reader and use fontTools directly
+
+    Returns:
+        RawFontReader or FontToolsFontReader
+    """
+    if not use_fonttools:
+        reader = None
+        try:
+            reader = RawFontReader(font_path)
+            reader.get_best_cmap()
+            return reader
+        except (FontReaderError, struct.error, IndexError) as e:
+            if reader is not None:
+                reader.close()
+            print(f"Raw font reader unavailable ({e}), falling back to fontTools")
+
+    return FontToolsFontReader(font_path)
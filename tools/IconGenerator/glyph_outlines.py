@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+Glyph Outline Helpers
+
+Shared helpers for working with decoded TrueType outlines (see
+font_reader.get_glyph_contours): a canonical outline hash, conversion of
+quadratic contours to normalized SVG path data, flattening to polygons
+for rasterization, and em-normalized layout metrics.
+"""
+
+import hashlib
+import math
+import struct
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from font_reader import Contour
+
+
+def canonical_contour(contour: Contour) -> Contour:
+    """
+    Rotate a closed contour to a canonical start point.
+
+    The contour starts at its smallest (x, y) on-curve point (its smallest
+    point if all are off-curve); ties pick the smallest rotation. The
+    direction is kept, since it decides the fill.
+
+    Args:
+        contour: One decoded contour
+
+    Returns:
+        The same points, rotated
+    """
+    if not contour:
+        return contour
+    candidates = [point for point in contour if point[2]] or contour
+    smallest = min(point[:2] for point in candidates)
+    starts = [i for i, point in enumerate(contour) if point[:2] == smallest and point in candidates]
+    return min(contour[i:] + contour[:i] for i in starts)
+
+
+def outline_hash(contours: List[Contour]) -> str:
+    """
+    Hash a glyph outline independent of glyph name, hinting and metrics.
+
+    The hash covers contour structure, point coordinates and on-curve flags
+    of the canonical outline: every contour rotated to its canonical start
+    point (canonical_contour) and the contours sorted, so two glyphs drawn
+    identically produce the same value even if their contours are stored
+    in a different order or start at a different point.
+
+    Args:
+        contours: Decoded contours
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    digest.update(struct.pack('>I', len(contours)))
+    for contour in sorted(canonical_contour(contour) for contour in contours):
+        digest.update(struct.pack('>I', len(contour)))
+        for x, y, on_curve in contour:
+            digest.update(struct.pack('>dd?', x, y, on_curve))
+    return digest.hexdigest()
+
+
+def format_number(value: float, precision: int) -> str:
+    """Format a coordinate with at most `precision` decimals and no trailing zeros."""
+    text = f"{value:.{precision}f}".rstrip('0').rstrip('.')
+    return "0" if text in ("", "-0") else text
+
+
+def iter_contour_segments(contour: Contour) -> Iterator[Tuple]:
+    """
+    Walk a TrueType contour as explicit line and quadratic segments.
+
+    Implied on-curve points between consecutive off-curve points are made
+    explicit, and the contour is closed back to its start point.
+
+    Args:
+        contour: One decoded contour
+
+    Yields:
+        ('M', (x, y)) first, then ('L', (x, y)) or ('Q', (cx, cy), (x, y))
+    """
+    if not contour:
+        return
+
+    # Start on an on-curve point; if there is none, start at the implied
+    # midpoint between the first two off-curve points
+    start_index = next((i for i, p in enumerate(contour) if p[2]), None)
+    if start_index is None:
+        x0, y0, _ = contour[0]
+        x1, y1, _ = contour[1 % len(contour)]
+        start = ((x0 + x1) / 2, (y0 + y1) / 2)
+        points = contour
+    else:
+        start = contour[start_index][:2]
+        points = contour[start_index + 1:] + contour[:start_index]
+
+    yield ('M', start)
+
+    control = None
+    for x, y, on_curve in points:
+        if on_curve:
+            if control is None:
+                yield ('L', (x, y))
+            else:
+                yield ('Q', control, (x, y))
+                control = None
+        else:
+            if control is not None:
+                yield ('Q', control, ((control[0] + x) / 2, (control[1] + y) / 2))
+            control = (x, y)
+
+    if control is not None:
+        yield ('Q', control, start)
+
+
+def contours_to_svg_path(contours: List[Contour], units_per_em: int, ascender: int,
+                         precision: int = 4) -> str:
+    """
+    Convert TrueType contours to SVG path data in a 1x1 em box.
+
+    Coordinates are divided by units_per_em and the y axis is flipped so that
+    the ascender maps to y=0 and the baseline to y=ascender/units_per_em.
+
+    Args:
+        contours: Decoded contours in font units
+        units_per_em: Font units per em
+        ascender: Font ascender in font units
+        precision: Decimal places kept in the output
+
+    Returns:
+        SVG path data (M/L/H/V/Q/Z commands), empty for blank glyphs
+    """
+    def coords(point: Tuple[float, float]) -> Tuple[str, str]:
+        x, y = point
+        return format_number(x / units_per_em, precision), format_number((ascender - y) / units_per_em, precision)
+
+    commands = []
+    for contour in contours:
+        current = ("", "")
+        for segment in iter_contour_segments(contour):
+            target = coords(segment[-1])
+            if segment[0] == 'M':
+                commands.append(f"M{target[0]} {target[1]}")
+            elif segment[0] == 'L':
+                # Use H/V for axis-aligned segments, they are common in icon outlines
+                if target[1] == current[1]:
+                    commands.append(f"H{target[0]}")
+                elif target[0] == current[0]:
+                    commands.append(f"V{target[1]}")
+                else:
+                    commands.append(f"L{target[0]} {target[1]}")
+            else:
+                control = coords(segment[1])
+                commands.append(f"Q{control[0]} {control[1]} {target[0]} {target[1]}")
+            current = target
+        if contour:
+            commands.append("Z")
+
+    return "".join(commands)
+
+
+def contours_to_polygons(contours: List[Contour], tolerance: float) -> List[List[Tuple[float, float]]]:
+    """
+    Flatten TrueType contours into closed polygons.
+
+    Each quadratic segment is split into enough line segments that the
+    polygon stays within roughly `tolerance` of the curve.
+
+    Args:
+        contours: Decoded contours in font units
+        tolerance: Maximum deviation in font units
+
+    Returns:
+        One list of (x, y) vertices per contour, in font units
+    """
+    polygons = []
+    for contour in contours:
+        polygon: List[Tuple[float, float]] = []
+        for segment in iter_contour_segments(contour):
+            if segment[0] != 'Q':
+                polygon.append(segment[1])
+                continue
+
+            (x0, y0), (cx, cy), (x1, y1) = polygon[-1], segment[1], segment[2]
+            # Distance of the control point from the chord bounds the curve deviation
+            deviation = abs((cx - x0) * (y1 - y0) - (cy - y0) * (x1 - x0)) / max(math.hypot(x1 - x0, y1 - y0), 1e-9)
+            steps = max(1, math.ceil(math.sqrt(deviation / (2 * tolerance))))
+            for step in range(1, steps + 1):
+                t = step / steps
+                mt = 1 - t
+                polygon.append((mt * mt * x0 + 2 * mt * t * cx + t * t * x1,
+                                mt * mt * y0 + 2 * mt * t * cy + t * t * y1))
+        if len(polygon) >= 3:
+            polygons.append(polygon)
+    return polygons
+
+
+def polygon_centroid(polygons: List[List[Tuple[float, float]]]) -> Optional[Tuple[float, float]]:
+    """
+    Compute the area-weighted centroid of the filled region.
+
+    Contours are combined with their signed (shoelace) areas, so counters
+    wound against the outer contour are subtracted as holes.
+
+    Args:
+        polygons: Closed polygons from contours_to_polygons
+
+    Returns:
+        (x, y) centroid, or None if the polygons enclose no area
+    """
+    area = cx = cy = 0.0
+    for polygon in polygons:
+        x0, y0 = polygon[-1]
+        for x1, y1 in polygon:
+            cross = x0 * y1 - x1 * y0
+            area += cross
+            cx += (x0 + x1) * cross
+            cy += (y0 + y1) * cross
+            x0, y0 = x1, y1
+
+    if abs(area) < 1e-9:
+        return None
+    return cx / (3 * area), cy / (3 * area)
+
+
+def glyph_metrics(font, glyph_name: str, precision: int = 4) -> Dict[str, Any]:
+    """
+    Compute layout metrics for a glyph, normalized to the em.
+
+    Coordinates use the same frame as contours_to_svg_path: origin at the
+    ascender, y axis pointing down, 1.0 = units_per_em.
+
+    Args:
+        font: An open font_reader font
+        glyph_name: Glyph name
+        precision: Decimal places kept
+
+    Returns:
+        Dictionary with:
+            advance: Advance width
+            ink_bounds: [left, top, right, bottom] of the outline, or None if empty
+            optical_offset: [dx, dy] from the center of the advance x line-height
+                box to the outline's area centroid, or None if empty
+    """
+    units_per_em = font.units_per_em
+    ascender = font.ascender
+    advance = font.get_advance_width(glyph_name)
+
+    metrics: Dict[str, Any] = {
+        "advance": round(advance / units_per_em, precision),
+        "ink_bounds": None,
+        "optical_offset": None,
+    }
+
+    bounds = font.get_glyph_bounds(glyph_name)
+    if bounds is None:
+        return metrics
+
+    x_min, y_min, x_max, y_max = bounds
+    metrics["ink_bounds"] = [
+        round(x_min / units_per_em, precision),
+        round((ascender - y_max) / units_per_em, precision),
+        round(x_max / units_per_em, precision),
+        round((ascender - y_min) / units_per_em, precision),
+    ]
+
+    # Flatten to well below the stored precision
+    polygons = contours_to_polygons(font.get_glyph_contours(glyph_name), units_per_em * 1e-4)
+    centroid = polygon_centroid(polygons)
+    if centroid is not None:
+        box_center_x = advance / 2
+        box_center_y = (ascender - font.descender) / 2
+        # "+ 0.0" turns -0.0 into 0.0 so the JSON output stays clean
+        metrics["optical_offset"] = [
+            round((centroid[0] - box_center_x) / units_per_em, precision) + 0.0,
+            round((ascender - centroid[1] - box_center_y) / units_per_em, precision) + 0.0,
+        ]
+    return metrics
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Official Icon Documentation Tables
+
+Code point -> icon name tables taken from icon font documentation, stored
+as sorted TSV files in data/documentation/ (one file per source or
+version, e.g. segoe-fluent-icons.tsv next to segoe-mdl2-assets.tsv).
+
+Each file starts with '# key: value' header lines (name, source URL)
+followed by one 'UNICODE<TAB>Name' row per icon, sorted by code point.
+Tables are read on first use and cached per process, so importing a
+generator does not touch the data files.
+
+Usage:
+    from icon_documentation import load_documentation
+
+    table = load_documentation("segoe-fluent-icons")
+    table.names["E72B"]     # 'Back'
+
+    python icon_documentation.py                              # list sources
+    python icon_documentation.py --import-markdown docs.md --output data/documentation/new-source.tsv
+"""
+
+import argparse
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+DOCUMENTATION_DIR = Path(__file__).parent / "data" / "documentation"
+
+DEFAULT_SOURCE = "segoe-fluent-icons"
+
+# Table rows in the documentation pages: | e700 | GlobalNavButton |
+MARKDOWN_ROW_PATTERN = re.compile(r'\|\s*([a-f0-9]+)\s*\|\s*([A-Za-z0-9_]+)\s*\|', re.IGNORECASE)
+
+
+class DocumentationTable:
+    """One documentation source, loaded on first access."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the table.
+
+        Args:
+            path: TSV file
+        """
+        self.path = Path(path)
+        self.source = self.path.stem
+        self._header: Optional[Dict[str, str]] = None
+        self._names: Optional[Dict[str, str]] = None
+
+    def _load(self) -> None:
+        header: Dict[str, str] = {}
+        names: Dict[str, str] = {}
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.rstrip('\n')
+                if not line:
+                    continue
+                if line.startswith('#'):
+                    key, _, value = line[1:].partition(':')
+                    header[key.strip()] = value.strip()
+                    continue
+                unicode_hex, _, name = line.partition('\t')
+                names[unicode_hex] = name
+        self._header = header
+        self._names = names
+
+    @property
+    def header(self) -> Dict[str, str]:
+        """Header fields (name, source, ...)."""
+        if self._header is None:
+            self._load()
+        return self._header
+
+    @property
+    def names(self) -> Dict[str, str]:
+        """Upper-case hex code point -> official icon name, in code point order."""
+        if self._names is None:
+            self._load()
+        return self._names
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@lru_cache(maxsize=None)
+def load_documentation(source: str = DEFAULT_SOURCE) -> DocumentationTable:
+    """
+    Get a documentation table by source name or TSV path.
+
+    Args:
+        source: File stem in data/documentation/ or a path to a TSV file
+
+    Returns:
+        DocumentationTable (rows are read on first access)
+    """
+    path = Path(source)
+    if path.suffix != ".tsv":
+        path = DOCUMENTATION_DIR / f"{source}.tsv"
+    if not path.exists():
+        raise FileNotFoundError(f"Documentation table not found: {path}")
+    return DocumentationTable(path)
+
+
+def available_sources() -> List[str]:
+    """List the documentation sources in data/documentation/."""
+    return sorted(path.stem for path in DOCUMENTATION_DIR.glob("*.tsv"))
+
+
+def parse_markdown_table(text: str) -> Dict[str, str]:
+    """
+    Extract '| code | Name |' rows from a documentation page.
+
+    Later rows win when a code point is listed twice.
+
+    Args:
+        text: Markdown (or text copied from the rendered page)
+
+    Returns:
+        Upper-case hex code point -> name
+    """
+    return {unicode_hex.upper(): name for unicode_hex, name in MARKDOWN_ROW_PATTERN.findall(text)}
+
+
+def write_table(path: Path, names: Dict[str, str], header: Dict[str, str]) -> None:
+    """
+    Write a documentation table as sorted TSV.
+
+    Args:
+        path: Output file
+        names: Hex code point -> name
+        header: Header fields written as '# key: value' lines
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8', newline='\n') as f:
+        for key, value in header.items():
+            f.write(f"# {key}: {value}\n")
+        f.write("# columns: unicode\tname\n")
+        for unicode_hex in sorted(names, key=lambda code: int(code, 16)):
+            f.write(f"{unicode_hex}\t{names[unicode_hex]}\n")
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="List or import icon documentation tables")
+    parser.add_argument("--import-markdown", type=Path, help="Documentation page to convert")
+    parser.add_argument("--output", type=Path, help="TSV file to write (with --import-markdown)")
+    parser.add_argument("--name", default="", help="Font name for the header (with --import-markdown)")
+    parser.add_argument("--source", default="", help="Source URL for the header (with --import-markdown)")
+    args = parser.parse_args()
+
+    if args.import_markdown:
+        if not args.output:
+            print("✗ Error: --output is required with --import-markdown")
+            return 1
+        names = parse_markdown_table(args.import_markdown.read_text(encoding='utf-8'))
+        header = {key: value for key, value in (("name", args.name), ("source", args.source)) if value}
+        write_table(args.output, names, header)
+        print(f"✓ Imported {len(names)} icons to: {args.output}")
+        return 0
+
+    print(f"Documentation tables in: {DOCUMENTATION_DIR}")
+    for source in available_sources():
+        table = load_documentation(source)
+        print(f"  {source:30s} {len(table):5d} icons  {table.header.get('name', '')}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,540 @@
+#!/usr/bin/env python3
+"""
+Indexed Icon Queries
+
+Answers the questions the old check scripts (verify_output.py,
+final_verification.py, show_stats.py, ranges.py) answered with throwaway
+dicts and linear scans: which icon has this code point or name, what is in
+a category, which icons carry a keyword, how many icons fall in a range.
+
+The first query builds a persistent index next to the font cache
+(.cache/query/) and later runs only load it; the index is rebuilt when the
+metadata file's size or mtime changes. Every field is a sorted key array
+with one posting list (document ids, in IconMetadata.json order) per key:
+
+    code        code point spellings: 'e72b', '0xe72b', 'u+e72b', '\\ue72b'
+    name        icon names, alias records and "aliases" lists included (case-insensitive)
+    category    category keys and their English and Chinese names
+    keyword     search keywords
+    zh          Chinese names
+
+A query is a list of terms that must all match. 'field:value' matches keys
+of that field starting with value; a bare term matches any field. Keys and
+terms are NFKC-normalized and lower-cased (see cjk_text.normalize_text).
+Because every term is a prefix match, typing more text never adds results:
+when a query extends the previous one, a QuerySession intersects the
+previous results with the changed and added terms only, instead of
+evaluating every term again.
+
+Usage:
+    python icongen.py query lookup E72B back 0xE713        # exact code point / name
+    python icongen.py query find arrow category:nav         # prefix terms, AND
+    python icongen.py query find < queries.txt              # one query per line, narrowing
+    python icongen.py query lookup < keys.txt               # one key per line
+    python icongen.py query stats | ranges | verify [E72B=Back ...]
+
+    from icon_query import QueryIndex
+    index = QueryIndex.open(metadata_path)
+    index.lookup("E72B")                  # document ids, in metadata order
+    index.find("arrow category:nav")
+"""
+
+import argparse
+import bisect
+import hashlib
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from cjk_text import normalize_text
+from json_output import write_json
+from keywords import codepoint_query
+
+
+# Bump when the index layout or the key derivation changes
+QUERY_INDEX_FORMAT_VERSION = 2
+
+DEFAULT_CACHE_DIR = Path(__file__).parent / ".cache" / "query"
+
+DEFAULT_METADATA = (Path(__file__).parent.parent.parent / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons"
+                    / "IconMetadata.json")
+
+FIELDS = ("code", "name", "category", "keyword", "zh")
+
+# Icons every generated catalog must contain (code point, name)
+KEY_ICONS = [
+    ("E72B", "Back"),
+    ("E72A", "Forward"),
+    ("E721", "Search"),
+    ("E80F", "Home"),
+    ("E713", "Settings"),
+]
+
+# Code point blocks reported by 'ranges' (label, first, end exclusive)
+DEFAULT_RANGES = [
+    ("E700-E900", 0xE700, 0xE900),
+    ("EA00-EC00", 0xEA00, 0xEC00),
+    ("ED00-EF00", 0xED00, 0xEF00),
+    ("F000-F200", 0xF000, 0xF200),
+    ("F300-F500", 0xF300, 0xF500),
+    ("F600-F800", 0xF600, 0xF800),
+]
+
+Term = Tuple[Optional[str], str]
+
+
+def document_keys(document: List[Any], categories: Dict[str, Dict[str, Any]],
+                  aliases: Iterable[str] = ()) -> Dict[str, List[str]]:
+    """
+    Get the normalized keys of one document, per field.
+
+    Args:
+        document: [unicode, name, category, zh, alias_of, keywords]
+        categories: Category key -> definition
+        aliases: Alias names folded into the record ("aliases", see find_duplicates.py --apply)
+
+    Returns:
+        Field -> keys
+    """
+    unicode, name, category, zh, _, keywords = document
+    code = unicode.lower()
+    definition = categories.get(category, {})
+    category_keys = [category, definition.get("name"), definition.get("name_zh")]
+    return {
+        "code": [code, f"0x{code}", f"u+{code}", f"\\u{code}"],
+        "name": [normalize_text(name)] + [normalize_text(alias) for alias in aliases],
+        "category": sorted({normalize_text(key) for key in category_keys if key}),
+        "keyword": [normalize_text(keyword) for keyword in keywords],
+        "zh": [normalize_text(zh)] if zh else [],
+    }
+
+
+def build_query_index(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build the query index of a metadata document.
+
+    Args:
+        metadata: IconMetadata.json document
+
+    Returns:
+        Index document: version, categories, documents and per field sorted keys with postings
+    """
+    categories = metadata.get("categories", [])
+    category_map = {category["key"]: category for category in categories}
+    documents = []
+    postings: Dict[str, Dict[str, List[int]]] = {field: {} for field in FIELDS}
+    for doc_id, icon in enumerate(metadata["icons"]):
+        document = [icon["unicode"], icon["name"], icon["category"], icon.get("i18n", {}).get("zh"),
+                    icon.get("alias_of"), icon.get("keywords", [])]
+        documents.append(document)
+        for field, keys in document_keys(document, category_map, icon.get("aliases", [])).items():
+            for key in set(keys):
+                postings[field].setdefault(key, []).append(doc_id)
+
+    fields = {}
+    for field in FIELDS:
+        keys = sorted(postings[field])
+        fields[field] = {"keys": keys, "postings": [postings[field][key] for key in keys]}
+    return {
+        "version": QUERY_INDEX_FORMAT_VERSION,
+        "categories": categories,
+        "documents": documents,
+        "fields": fields,
+    }
+
+
+def parse_query(query: str) -> List[Term]:
+    """
+    Split a query into terms.
+
+    Args:
+        query: Query text ('arrow category:nav')
+
+    Returns:
+        (field or None for any field, normalized value) per term
+    """
+    terms = []
+    for word in normalize_text(query).split():
+        field, sep, value = word.partition(":")
+        if sep and field in FIELDS:
+            terms.append((field, value))
+        else:
+            terms.append((None, word))
+    return terms
+
+
+def extends(previous: List[Term], terms: List[Term]) -> bool:
+    """
+    Check whether a query can only match a subset of a previous query's results.
+
+    True when the earlier terms are unchanged, the previous last term is
+    now longer (same field) and any further terms are new.
+
+    Args:
+        previous: Terms of the previous query
+        terms: Terms of the new query
+
+    Returns:
+        True if the previous results can be narrowed
+    """
+    if not previous or len(terms) < len(previous):
+        return False
+    if terms[:len(previous) - 1] != previous[:-1]:
+        return False
+    (last_field, last_value), (field, value) = previous[-1], terms[len(previous) - 1]
+    return field == last_field and value.startswith(last_value)
+
+
+class QueryIndex:
+    """Icon lookups over a loaded query index."""
+
+    def __init__(self, index: Dict[str, Any]):
+        """
+        Initialize the index.
+
+        Args:
+            index: Index document from build_query_index() or the cache file
+
+        Raises:
+            ValueError: If the index was written by an incompatible version
+        """
+        if index.get("version") != QUERY_INDEX_FORMAT_VERSION:
+            raise ValueError(f"Unsupported query index format: {index.get('version')}")
+        self.categories: List[Dict[str, Any]] = index["categories"]
+        self.documents: List[List[Any]] = index["documents"]
+        self.fields: Dict[str, Dict[str, List[Any]]] = index["fields"]
+
+    @classmethod
+    def open(cls, metadata_path: Path, cache_dir: Path = DEFAULT_CACHE_DIR, rebuild: bool = False) -> "QueryIndex":
+        """
+        Load the cached index of a metadata file, building it if missing or stale.
+
+        Args:
+            metadata_path: IconMetadata.json
+            cache_dir: Cache directory
+            rebuild: Ignore the cached index
+
+        A cache file that cannot be read (truncated, corrupt, other
+        version) is discarded and rebuilt from the metadata.
+
+        Returns:
+            QueryIndex
+        """
+        metadata_path = Path(metadata_path).resolve()
+        stat = metadata_path.stat()
+        source = {"path": str(metadata_path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        cache_path = cache_dir / f"{hashlib.sha1(str(metadata_path).encode('utf-8')).hexdigest()[:16]}.json"
+
+        if not rebuild and cache_path.exists():
+            try:
+                with open(cache_path, 'r', encoding='utf-8') as f:
+                    cached = json.load(f)
+                if cached.get("version") == QUERY_INDEX_FORMAT_VERSION and cached.get("source") == source:
+                    return cls(cached)
+            except (ValueError, KeyError, AttributeError, TypeError):
+                # Truncated or corrupt cache file (json.JSONDecodeError is a ValueError): rebuild it
+                pass
+
+        with open(metadata_path, 'r', encoding='utf-8') as f:
+            index = build_query_index(json.load(f))
+        index["source"] = source
+        write_json(cache_path, index, compact=True)
+        return cls(index)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def exact(self, field: str, key: str) -> List[int]:
+        """
+        Get the posting list of one key.
+
+        Args:
+            field: Field name
+            key: Normalized key
+
+        Returns:
+            Document ids (empty if the key is not indexed)
+        """
+        keys = self.fields[field]["keys"]
+        position = bisect.bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            return self.fields[field]["postings"][position]
+        return []
+
+    def prefix(self, field: str, value: str) -> set:
+        """
+        Get the documents with a key of a field starting with value.
+
+        Args:
+            field: Field name
+            value: Normalized prefix
+
+        Returns:
+            Set of document ids
+        """
+        keys, postings = self.fields[field]["keys"], self.fields[field]["postings"]
+        result: set = set()
+        position = bisect.bisect_left(keys, value)
+        while position < len(keys) and keys[position].startswith(value):
+            result.update(postings[position])
+            position += 1
+        return result
+
+    def lookup(self, key: str) -> List[int]:
+        """
+        Look up icons by code point or by name/alias (case-insensitive).
+
+        Args:
+            key: 'E72B', '0xE72B', 'U+E72B', '\\uE72B', an icon name or an alias
+
+        Returns:
+            Document ids in metadata order
+        """
+        code = codepoint_query(key)
+        if code is not None:
+            matches = self.exact("code", code.lower())
+            if matches:
+                return list(matches)
+        return list(self.exact("name", normalize_text(key.strip())))
+
+    def term_matches(self, term: Term) -> set:
+        """Documents matching one term, from the index."""
+        field, value = term
+        if field is not None:
+            return self.prefix(field, value)
+        result: set = set()
+        for name in FIELDS:
+            result |= self.prefix(name, value)
+        return result
+
+    def match(self, terms: List[Term], candidates: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Find the icons matching every term.
+
+        Args:
+            terms: Parsed query terms
+            candidates: Restrict the result to these documents
+
+        Returns:
+            Document ids in metadata order
+        """
+        if not terms:
+            return []
+        matches = [self.term_matches(term) for term in terms]
+        if candidates is not None:
+            matches.append(set(candidates))
+        # Smallest set first
+        matches.sort(key=len)
+        result = matches[0]
+        for other in matches[1:]:
+            if not result:
+                break
+            result = result & other
+        return sorted(result)
+
+    def find(self, query: str) -> List[int]:
+        """
+        Find the icons matching every term of a query.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Document ids in metadata order
+        """
+        return self.match(parse_query(query))
+
+    def code_points(self) -> List[int]:
+        """Sorted code points of all documents (for range counts)."""
+        return sorted(int(document[0], 16) for document in self.documents)
+
+    def category_counts(self) -> Dict[str, int]:
+        """Icons per category key."""
+        counts: Dict[str, int] = {}
+        for document in self.documents:
+            counts[document[2]] = counts.get(document[2], 0) + 1
+        return counts
+
+
+class QuerySession:
+    """Runs a sequence of queries, narrowing the previous results when a query extends the previous one."""
+
+    def __init__(self, index: QueryIndex):
+        """
+        Initialize the session.
+
+        Args:
+            index: Query index
+        """
+        self.index = index
+        self.narrowed = 0
+        self._terms: List[Term] = []
+        self._results: List[int] = []
+
+    def find(self, query: str) -> List[int]:
+        """
+        Run a query.
+
+        Args:
+            query: Query text
+
+        Returns:
+            Document ids in metadata order
+        """
+        terms = parse_query(query)
+        if extends(self._terms, terms):
+            # Unchanged terms already hold for the previous results
+            self.narrowed += 1
+            results = self.index.match(terms[len(self._terms) - 1:], self._results)
+        else:
+            results = self.index.match(terms)
+        self._terms, self._results = terms, results
+        return results
+
+
+def format_document(document: List[Any]) -> str:
+    """One result line: code point, name, category, Chinese name, alias target."""
+    unicode, name, category, zh, alias_of, _ = document
+    alias = f" -> {alias_of}" if alias_of else ""
+    return f"  {unicode:6s} {name + alias:32s} {category:14s} {zh or ''}"
+
+
+def read_lines(lines: Iterable[str]) -> Iterable[str]:
+    """Non-empty stripped lines."""
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield line
+
+
+def run_lookup(index: QueryIndex, keys: Sequence[str]) -> int:
+    """Print the icons of each code point or name; fails if one is not found."""
+    missing = 0
+    for key in keys:
+        matches = index.lookup(key)
+        if not matches:
+            missing += 1
+            print(f"✗ {key}: not found")
+        for doc_id in matches:
+            print(f"{key:<12s}{format_document(index.documents[doc_id])}")
+    return 1 if missing else 0
+
+
+def run_find(index: QueryIndex, queries: Sequence[str], limit: int) -> int:
+    """Print the icons matching each query, narrowing across consecutive queries."""
+    session = QuerySession(index)
+    for query in queries:
+        matches = session.find(query)
+        print(f"✓ {len(matches)} icons match '{query}'")
+        for doc_id in matches[:limit] if limit else matches:
+            print(format_document(index.documents[doc_id]))
+    if session.narrowed:
+        print(f"  ({session.narrowed} of {len(queries)} queries narrowed the previous results)")
+    return 0
+
+
+def run_stats(index: QueryIndex) -> int:
+    """Print the icon count per category."""
+    print("=" * 60)
+    print("Catalog Statistics")
+    print("=" * 60)
+    print(f"Total icons: {len(index)}")
+    print(f"Total categories: {len(index.categories)}")
+    print("\nCategories breakdown:")
+    counts = index.category_counts()
+    for category in sorted(index.categories, key=lambda c: c.get("priority", 999)):
+        print(f"  - {category['name']:20s} ({category.get('name_zh', '')}): {counts.get(category['key'], 0):4d} icons")
+    print("=" * 60)
+    return 0
+
+
+def run_ranges(index: QueryIndex) -> int:
+    """Print the icon count per code point block."""
+    code_points = index.code_points()
+    print("=" * 60)
+    print("Code Point Range Coverage")
+    print("=" * 60)
+    print(f"{'Range':<15} {'Icons':>10}")
+    print("-" * 60)
+    total = 0
+    for label, first, end in DEFAULT_RANGES:
+        count = bisect.bisect_left(code_points, end) - bisect.bisect_left(code_points, first)
+        total += count
+        print(f"{label:<15} {count:>10}")
+    print("-" * 60)
+    print(f"{'TOTAL':<15} {total:>10}")
+    print(f"{'All icons':<15} {len(code_points):>10}")
+    print("=" * 60)
+    return 0
+
+
+def run_verify(index: QueryIndex, expected: Sequence[Tuple[str, str]]) -> int:
+    """Check that code points carry the expected names; fails on any mismatch."""
+    print("=" * 60)
+    print("Key Icon Verification")
+    print("=" * 60)
+    print(f"{'Unicode':<8} {'Expected':<20} {'Actual':<20} Status")
+    print("-" * 60)
+    all_ok = True
+    for code, expected_name in expected:
+        names = [index.documents[doc_id][1] for doc_id in index.lookup(code)]
+        ok = expected_name in names
+        all_ok = all_ok and ok
+        print(f"{code:<8} {expected_name:<20} {(names[0] if names else 'NOT FOUND'):<20} {'✓' if ok else '✗'}")
+    print("-" * 60)
+    for code, _ in expected:
+        for doc_id in index.lookup(code):
+            unicode, name, category, zh, _, keywords = index.documents[doc_id]
+            print(f"{name} ({unicode}): {category}, {zh or 'N/A'}, keywords: {', '.join(keywords[:8])}")
+    print("-" * 60)
+    print(f"{'✓' if all_ok else '✗'} {len(expected)} key icons checked in {len(index)} icons")
+    return 0 if all_ok else 1
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Main entry point."""
+    parser = argparse.ArgumentParser(prog="icongen query", description="Query the icon catalog through persistent indexes")
+    parser.add_argument("--metadata", type=Path, default=DEFAULT_METADATA, help="IconMetadata.json")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR, help="Index cache directory")
+    parser.add_argument("--rebuild", action="store_true", help="Rebuild the cached index")
+    parser.add_argument("--timing", action="store_true", help="Print index load and query times")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    lookup = commands.add_parser("lookup", help="Exact lookup by code point or name/alias (keys from stdin if none)")
+    lookup.add_argument("keys", nargs="*", help="Code points or icon names")
+    find = commands.add_parser("find", help="Icons matching all prefix terms (queries from stdin if none)")
+    find.add_argument("query", nargs="*", help="Terms: 'field:value' (code, name, category, keyword, zh) or bare")
+    find.add_argument("--limit", type=int, default=20, help="Results printed per query (0: all)")
+    commands.add_parser("stats", help="Icons per category")
+    commands.add_parser("ranges", help="Icons per code point block")
+    verify = commands.add_parser("verify", help="Check key icons (CODE=Name pairs; default: Back, Forward, ...)")
+    verify.add_argument("expected", nargs="*", help="Expected CODE=Name pairs")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    index = QueryIndex.open(args.metadata, args.cache_dir, args.rebuild)
+    loaded = time.perf_counter()
+
+    if args.command == "lookup":
+        status = run_lookup(index, args.keys or list(read_lines(sys.stdin)))
+    elif args.command == "find":
+        status = run_find(index, [" ".join(args.query)] if args.query else list(read_lines(sys.stdin)), args.limit)
+    elif args.command == "stats":
+        status = run_stats(index)
+    elif args.command == "ranges":
+        status = run_ranges(index)
+    else:
+        expected = [tuple(pair.split("=", 1)) for pair in args.expected] or KEY_ICONS
+        if any(len(pair) != 2 for pair in expected):
+            parser.error("verify expects CODE=Name pairs")
+        status = run_verify(index, expected)
+
+    if args.timing:
+        print(f"Index load: {(loaded - start) * 1000:.1f} ms, queries: {(time.perf_counter() - loaded) * 1000:.1f} ms")
+    return status
+
+
+if __name__ == "__main__":
+    exit(main())
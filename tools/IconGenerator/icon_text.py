@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Icon Name Text Helpers
+
+Shared tokenization of PascalCase icon names, a reader for the TSV phrase
+dictionaries in data/, and a token trie for matching dictionary phrases
+("ZoomIn", "ChevronLeft") against names. Matching works
+on whole name tokens, so "Group" never matches "Up" and "Headphone" never
+matches "Phone", and the cost of a lookup depends on the length of the
+name, not on the size of the dictionary.
+
+Usage:
+    from icon_text import TokenTrie, split_name
+
+    trie = TokenTrie()
+    trie.add(split_name("ChevronLeft"), "左箭头")
+    trie.longest_match(split_name("ChevronLeftSmall"))   # (0, 2, '左箭头')
+"""
+
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+
+# PascalCase words, upper-case acronyms followed by a word or the end, and digit runs
+NAME_TOKEN_PATTERN = re.compile(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)|[0-9]+')
+
+# Key under which a trie node stores its value; never produced by split_name
+_VALUE = ""
+
+
+def split_name(name: str) -> List[str]:
+    """
+    Split a PascalCase icon name into lower-case tokens.
+
+    Examples:
+        'ChevronLeft' -> ['chevron', 'left']
+        'VPNOverlay' -> ['vpn', 'overlay']
+        'Printer3D' -> ['printer', '3', 'd']
+
+    Args:
+        name: Icon name
+
+    Returns:
+        Lower-case tokens
+    """
+    return [token.lower() for token in NAME_TOKEN_PATTERN.findall(name)]
+
+
+def read_dictionary(path: Path) -> Dict[str, str]:
+    """
+    Read a phrase dictionary.
+
+    Args:
+        path: TSV file with 'Name<TAB>value' lines ('#' starts a comment line)
+
+    Returns:
+        Name -> value (later lines win)
+    """
+    entries: Dict[str, str] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            name, sep, text = line.partition('\t')
+            if not sep:
+                raise ValueError(f"{path}:{line_number}: expected 'Name<TAB>value'")
+            entries[name.strip()] = text.strip()
+    return entries
+
+
+class TokenTrie:
+    """Trie over token sequences with leftmost-longest matching."""
+
+    def __init__(self):
+        """Initialize an empty trie."""
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+
+    def add(self, tokens: Iterable[str], value: Any) -> None:
+        """
+        Add a phrase; adding the same phrase again replaces its value.
+
+        Args:
+            tokens: Phrase tokens (see split_name)
+            value: Value returned for matches of this phrase
+        """
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        if node is self._root:
+            return
+        if _VALUE not in node:
+            self._size += 1
+        node[_VALUE] = value
+
+    def __len__(self) -> int:
+        return self._size
+
+    def longest_at(self, tokens: List[str], start: int) -> Optional[Tuple[int, Any]]:
+        """
+        Find the longest phrase starting at a token position.
+
+        Args:
+            tokens: Name tokens
+            start: Start position
+
+        Returns:
+            (end position, value), or None if no phrase starts there
+        """
+        node = self._root
+        match = None
+        for position in range(start, len(tokens)):
+            node = node.get(tokens[position])
+            if node is None:
+                break
+            if _VALUE in node:
+                match = (position + 1, node[_VALUE])
+        return match
+
+    def longest_match(self, tokens: List[str]) -> Optional[Tuple[int, int, Any]]:
+        """
+        Find the longest phrase anywhere in the tokens, leftmost on ties.
+
+        Args:
+            tokens: Name tokens
+
+        Returns:
+            (start, end, value), or None if nothing matches
+        """
+        best = None
+        for start in range(len(tokens)):
+            match = self.longest_at(tokens, start)
+            if match is not None and (best is None or match[0] - start > best[1] - best[0]):
+                best = (start, match[0], match[1])
+        return best
+
+    def find_all(self, tokens: List[str]) -> List[Tuple[int, int, Any]]:
+        """
+        Find every phrase occurrence, including overlapping ones.
+
+        Args:
+            tokens: Name tokens
+
+        Returns:
+            (start, end, value) for each phrase found, by start then length
+        """
+        matches = []
+        for start in range(len(tokens)):
+            node = self._root
+            for position in range(start, len(tokens)):
+                node = node.get(tokens[position])
+                if node is None:
+                    break
+                if _VALUE in node:
+                    matches.append((start, position + 1, node[_VALUE]))
+        return matches
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Icon Generator Command Line
+
+Entry point for the icon tools that are used as subcommands.
+
+Commands:
+    query       indexed lookups over the icon catalog (icon_query.py)
+
+Usage:
+    python icongen.py query lookup E72B Back
+    python icongen.py query find arrow category:navigation
+    python icongen.py query --help
+"""
+
+import importlib
+import sys
+from typing import Optional, Sequence
+
+
+# Subcommand -> (module with main(argv), description)
+COMMANDS = {
+    "query": ("icon_query", "Indexed lookups over the icon catalog"),
+}
+
+
+def main(argv: Optional[Sequence[str]] = None):
+    """Main entry point."""
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if not argv or argv[0] not in COMMANDS:
+        print("usage: icongen <command> [args]")
+        print("\ncommands:")
+        for command, (_, description) in COMMANDS.items():
+            print(f"  {command:12s}{description}")
+        return 0 if argv[:1] in (["-h"], ["--help"]) else 2
+    module = importlib.import_module(COMMANDS[argv[0]][0])
+    return module.main(argv[1:])
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Canonical JSON Output
+
+Every JSON file the generator scripts produce (IconMetadata.json, sidecars,
+catalogs, reports) is written through write_json(), so the same data always
+gives the same bytes:
+
+    - object keys sorted
+    - "keywords" lists sorted and de-duplicated
+    - floats rounded to FLOAT_PRECISION decimals, -0.0 written as 0.0
+    - UTF-8 without BOM, '\\n' line endings on every platform, final newline
+
+When the new bytes equal the file on disk the file is not written at all
+and keeps its mtime. IconMetadata.json is an AdditionalFile of
+LemooIconGenerator, so a generator run without changes no longer triggers
+a source generator run and an incremental C# rebuild.
+
+Usage:
+    from json_output import write_json
+
+    if not write_json(output_path, metadata):
+        print("unchanged")
+"""
+
+import json
+import math
+import os
+from pathlib import Path
+from typing import Any
+
+
+# Decimals kept for float values
+FLOAT_PRECISION = 6
+
+# Lists whose order carries no meaning; they are sorted and de-duplicated
+SORTED_LIST_KEYS = frozenset({"keywords"})
+
+
+def canonicalize(value: Any, key: str = "") -> Any:
+    """
+    Normalize a JSON value for canonical output.
+
+    Args:
+        value: Decoded JSON value
+        key: Key the value is stored under in its parent object
+
+    Returns:
+        Normalized copy
+    """
+    if isinstance(value, dict):
+        return {k: canonicalize(v, k) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        if key in SORTED_LIST_KEYS and all(isinstance(item, str) for item in value):
+            return sorted(set(value))
+        return [canonicalize(item) for item in value]
+    if isinstance(value, float) and math.isfinite(value):
+        return round(value, FLOAT_PRECISION) + 0.0
+    return value
+
+
+def dumps_canonical(data: Any, compact: bool = False) -> bytes:
+    """
+    Serialize data canonically.
+
+    Args:
+        data: JSON-compatible data
+        compact: No indentation or spaces (machine-read indexes)
+
+    Returns:
+        UTF-8 bytes ending in a newline
+    """
+    if compact:
+        text = json.dumps(canonicalize(data), ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+    else:
+        text = json.dumps(canonicalize(data), ensure_ascii=False, sort_keys=True, indent=2)
+    return (text + "\n").encode('utf-8')
+
+
+def write_json(path: Path, data: Any, compact: bool = False) -> bool:
+    """
+    Write data canonically unless the file already has exactly these bytes.
+
+    Args:
+        path: Output file
+        data: JSON-compatible data
+        compact: No indentation or spaces (machine-read indexes)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    return write_bytes(path, dumps_canonical(data, compact))
+
+
+def write_bytes(path: Path, content: bytes) -> bool:
+    """
+    Write content unless the file already has exactly these bytes.
+
+    The file is replaced atomically, so readers never see a partial file.
+
+    Args:
+        path: Output file
+        content: File content
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = Path(path)
+    try:
+        if path.stat().st_size == len(content) and path.read_bytes() == content:
+            return False
+    except OSError:
+        pass
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+    with open(tmp_path, 'wb') as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+    return True
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Icon Search Keyword Engine
+
+Generates the search keywords stored in IconMetadata.json for a whole
+catalog in one call. The synonym table (data/keywords/synonyms.tsv) is
+compiled once into a token trie and every name is tokenized once, so the
+cost grows with the number of icons, not with icons x synonyms; repeated
+names (aliases, multi-font catalogs) are served from a memo.
+
+Keywords of an icon:
+    - caller-supplied extra terms (e.g. the glyph name)
+    - the PascalCase words of the name
+    - synonyms of every word or phrase found in the name
+
+Terms that carry no search information are pruned:
+    - the code point spellings ('e72b', 'ue72b', '0xe72b'); code point
+      queries are matched exactly against the record's "unicode" field
+      (see codepoint_query)
+    - the lower-cased name and the category key, which are searched as
+      fields of their own
+    - stopwords: terms found in more than MAX_DOCUMENT_FREQUENCY of the
+      catalog's icons (see KeywordEngine.fit)
+
+Usage:
+    from keywords import KeywordEngine
+
+    engine = KeywordEngine.load()
+    engine.fit(["Back", "Forward"])
+    engine.generate_all([("Back", "E72B", "navigation")])
+
+    python keywords.py --metadata path/to/IconMetadata.json   # document frequencies, pruning report
+"""
+
+import argparse
+import json
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from icon_text import NAME_TOKEN_PATTERN, TokenTrie, read_dictionary, split_name
+
+
+DEFAULT_SYNONYMS_PATH = Path(__file__).parent / "data" / "keywords" / "synonyms.tsv"
+
+# Terms in more than this share of a catalog's icons are dropped as stopwords
+MAX_DOCUMENT_FREQUENCY = 0.1
+
+# 'ue72b', 'u+e72b', '\\ue72b', '0xe72b' (hex code points of 4 to 6 digits) or bare 'e72b'
+CODEPOINT_PATTERN = re.compile(r'(0x|u\+|\\?u)?([0-9a-f]{4,6})')
+
+# Private Use Areas: icon fonts place their glyphs here. Bare hex is only read
+# as a code point inside these ranges, so words like 'face' or 'added' are not
+PRIVATE_USE_RANGES = ((0xE000, 0xF8FF), (0xF0000, 0xFFFFD), (0x100000, 0x10FFFD))
+
+
+def codepoint_query(text: str) -> Optional[str]:
+    """
+    Recognize a code point typed as a search query.
+
+    Prefixed spellings ('0x', 'u', 'u+', '\\u') are always code points; bare
+    hex only when it falls in a Private Use Area.
+
+    Args:
+        text: Search text
+
+    Returns:
+        Upper-case hex code point as stored in "unicode" (e.g. 'E72B'), or
+        None if the text is not a code point spelling
+    """
+    match = CODEPOINT_PATTERN.fullmatch(text.strip().lower())
+    if not match:
+        return None
+    prefix, digits = match.groups()
+    if prefix is None and not any(low <= int(digits, 16) <= high for low, high in PRIVATE_USE_RANGES):
+        return None
+    return digits.upper()
+
+
+def document_frequencies(keyword_lists: Iterable[Iterable[str]]) -> Counter:
+    """
+    Count the icons each keyword occurs in.
+
+    Args:
+        keyword_lists: Keywords per icon
+
+    Returns:
+        Keyword -> number of icons
+    """
+    return Counter(term for keywords in keyword_lists for term in set(keywords))
+
+
+def prune_keywords(icon: Dict[str, Any], stopwords: Iterable[str] = ()) -> List[str]:
+    """
+    Prune the keywords of an existing record the way KeywordEngine does.
+
+    Args:
+        icon: Icon metadata
+        stopwords: Additional terms to drop
+
+    Returns:
+        Remaining keywords, sorted
+    """
+    code = icon.get("unicode", "").lower()
+    dropped = {code, f"u{code}", f"0x{code}", icon.get("name", "").lower(), icon.get("category", "").lower()}
+    dropped.update(stopwords)
+    return sorted(set(icon.get("keywords", [])) - dropped)
+
+# (name, unicode hex, category) or (name, unicode hex, category, extra terms)
+KeywordRequest = Tuple
+
+
+class KeywordEngine:
+    """Compiled synonym table plus per-name keyword memo."""
+
+    def __init__(self, synonyms: Optional[Dict[str, List[str]]] = None,
+                 max_document_frequency: float = MAX_DOCUMENT_FREQUENCY):
+        """
+        Initialize the engine.
+
+        Args:
+            synonyms: Word or phrase -> extra keywords
+            max_document_frequency: Share of icons above which a term is a stopword
+        """
+        self._trie = TokenTrie()
+        self._name_terms: Dict[str, Tuple[str, ...]] = {}
+        self.max_document_frequency = max_document_frequency
+        self.stopwords: frozenset = frozenset()
+        for phrase, values in (synonyms or {}).items():
+            self._trie.add(split_name(phrase), tuple(values))
+
+    @classmethod
+    def load(cls, synonyms_path: Optional[Path] = None) -> "KeywordEngine":
+        """
+        Load the synonym table.
+
+        Args:
+            synonyms_path: TSV with 'word<TAB>synonym, synonym' lines
+                (default: data/keywords/synonyms.tsv)
+
+        Returns:
+            KeywordEngine
+        """
+        entries = read_dictionary(synonyms_path or DEFAULT_SYNONYMS_PATH)
+        return cls({phrase: [value.strip() for value in values.split(',') if value.strip()]
+                    for phrase, values in entries.items()})
+
+    def name_terms(self, name: str) -> Tuple[str, ...]:
+        """
+        Get the keywords derived from an icon name alone (memoized).
+
+        Args:
+            name: Icon name
+
+        Returns:
+            Lower-cased words of the name and their synonyms
+        """
+        terms = self._name_terms.get(name)
+        if terms is None:
+            collected = [word.lower() for word in NAME_TOKEN_PATTERN.findall(name) if not word.isdigit()]
+            for _, _, values in self._trie.find_all(split_name(name)):
+                collected.extend(values)
+            terms = tuple(collected)
+            self._name_terms[name] = terms
+        return terms
+
+    def fit(self, names: Iterable[str]) -> frozenset:
+        """
+        Determine the stopwords of a catalog from the document frequencies
+        of the name-derived terms.
+
+        Call before generating keywords; all names of the catalog are
+        needed, including those of icons that are not regenerated.
+
+        Args:
+            names: Names of all icons in the catalog
+
+        Returns:
+            The stopwords
+        """
+        names = list(names)
+        frequencies = document_frequencies(self.name_terms(name) for name in names)
+        limit = len(names) * self.max_document_frequency
+        self.stopwords = frozenset(term for term, count in frequencies.items() if count > limit)
+        return self.stopwords
+
+    def rule_fingerprint(self, name: str) -> str:
+        """
+        Describe the synonym entries and stopwords that apply to a name.
+
+        The keywords of a name can only change when this value changes
+        (see metadata_manifest.py).
+
+        Args:
+            name: Icon name
+
+        Returns:
+            Matched synonym lists and pruned stopwords, as text
+        """
+        return repr(([values for _, _, values in self._trie.find_all(split_name(name))],
+                     sorted(self.stopwords.intersection(self.name_terms(name)))))
+
+    def keywords_for(self, name: str, unicode_hex: str, category: str,
+                     extra_terms: Sequence[str] = ()) -> List[str]:
+        """
+        Generate the keywords of one icon.
+
+        Args:
+            name: Icon name
+            unicode_hex: Code point in hex
+            category: Category key
+            extra_terms: Additional keywords (lower-cased)
+
+        Returns:
+            Sorted, de-duplicated keywords
+        """
+        keywords = {term.lower() for term in extra_terms}
+        keywords.update(self.name_terms(name))
+        code = unicode_hex.lower()
+        keywords -= {code, f"u{code}", f"0x{code}", name.lower(), category.lower()}
+        keywords -= self.stopwords
+        return sorted(keywords)
+
+    def generate_all(self, requests: Iterable[KeywordRequest]) -> List[List[str]]:
+        """
+        Generate keywords for a whole catalog.
+
+        Args:
+            requests: (name, unicode hex, category[, extra terms]) per icon
+
+        Returns:
+            Keyword lists in request order
+        """
+        return [self.keywords_for(*request) for request in requests]
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Report keyword document frequencies and pruning")
+    parser.add_argument("--metadata", type=Path, required=True, help="IconMetadata.json")
+    parser.add_argument("--max-df", type=float, default=MAX_DOCUMENT_FREQUENCY,
+                        help="Share of icons above which a term is a stopword")
+    parser.add_argument("--top", type=int, default=15, help="Most frequent keywords to list")
+    args = parser.parse_args()
+
+    with open(args.metadata, 'r', encoding='utf-8') as f:
+        icons = json.load(f)["icons"]
+
+    # Document frequencies of the terms left after dropping code points, names and categories
+    pruned = [prune_keywords(icon) for icon in icons]
+    frequencies = document_frequencies(pruned)
+    limit = len(icons) * args.max_df
+    stopwords = {term for term, count in frequencies.items() if count > limit}
+    pruned = [[term for term in keywords if term not in stopwords] for keywords in pruned]
+
+    def table_size(keyword_lists: List[List[str]]) -> Tuple[int, int, int]:
+        entries = sum(len(keywords) for keywords in keyword_lists)
+        distinct = len(document_frequencies(keyword_lists))
+        size = len(json.dumps(keyword_lists, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        return entries, distinct, size
+
+    print("=" * 60)
+    print("Keyword Document Frequencies")
+    print("=" * 60)
+    print(f"Icons: {len(icons)}, stopword limit: {limit:.0f} icons ({args.max_df:.0%})")
+    for term, count in frequencies.most_common(args.top):
+        print(f"  {term:24s} {count:>6}{'  (stopword)' if term in stopwords else ''}")
+    print("-" * 60)
+    print(f"{'':12s} {'Entries':>10} {'Distinct':>10} {'Bytes':>10}")
+    before = table_size([icon.get("keywords", []) for icon in icons])
+    after = table_size(pruned)
+    print(f"{'Current':12s} {before[0]:>10} {before[1]:>10} {before[2]:>10}")
+    print(f"{'Pruned':12s} {after[0]:>10} {after[1]:>10} {after[2]:>10}")
+    if before[0]:
+        print(f"✓ Pruning removes {before[0] - after[0]} keyword entries "
+              f"({(before[0] - after[0]) / before[0]:.0%}), {before[2] - after[2]} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Incremental Regeneration Manifest
+
+Remembers, for every icon record a generator wrote, a hash of the inputs
+the record was built from: the documentation row, the glyph outline and
+metrics, and the keyword, translation and category rules that apply to
+the icon's name. On the next run only records whose inputs changed are
+rebuilt; all others are taken over from the existing output file.
+
+A manifest is only trusted when
+    - the output file still has the SHA-256 recorded in the manifest
+      (a hand-edited or post-processed file, e.g. by add_common_aliases.py,
+      is rebuilt in full), and
+    - the generator code is unchanged (create_official_metadata.py and the
+      local modules it imports, see code_files).
+
+Manifests live in .cache/manifests/, one per output path.
+
+Usage:
+    from metadata_manifest import MetadataManifest, input_hash
+
+    manifest = MetadataManifest.for_output(output_path)
+    previous = manifest.load()          # None: rebuild everything
+    ...
+    manifest.save({"E700": input_hash("E700", "GlobalNavButton", ...)})
+"""
+
+import ast
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from font_cache import file_sha256
+
+
+# Bump when the manifest layout changes
+MANIFEST_FORMAT_VERSION = 1
+
+DEFAULT_MANIFEST_DIR = Path(__file__).parent / ".cache" / "manifests"
+
+# Generator entry point; it and every local module it imports (transitively) shape the records
+GENERATOR_MODULE = "create_official_metadata.py"
+
+
+def input_hash(*parts: str) -> str:
+    """
+    Hash the inputs of one record.
+
+    Args:
+        parts: Input descriptions (documentation row, outline hash, rule fingerprints, ...)
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256("\x1f".join(parts).encode('utf-8')).hexdigest()
+
+
+def code_files(entry: str = GENERATOR_MODULE) -> List[str]:
+    """
+    List the generator's own modules: the entry script and every module of
+    this directory it imports, directly or through other local modules.
+
+    Args:
+        entry: Entry script file name
+
+    Returns:
+        Sorted file names
+    """
+    tool_dir = Path(__file__).parent
+    found = set()
+    pending = [entry]
+    while pending:
+        name = pending.pop()
+        if name in found:
+            continue
+        found.add(name)
+        tree = ast.parse((tool_dir / name).read_bytes(), filename=name)
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                modules = [alias.name for alias in node.names]
+            elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+                modules = [node.module]
+            else:
+                continue
+            pending.extend(f"{module}.py" for module in modules if (tool_dir / f"{module}.py").is_file())
+    return sorted(found)
+
+
+def code_version() -> str:
+    """Hash of the generator modules (see code_files)."""
+    digest = hashlib.sha256()
+    for name in code_files():
+        digest.update(name.encode('utf-8'))
+        digest.update((Path(__file__).parent / name).read_bytes())
+    return digest.hexdigest()
+
+
+class MetadataManifest:
+    """Per-record input hashes of one generated metadata file."""
+
+    def __init__(self, path: Path, output_path: Path):
+        """
+        Initialize the manifest.
+
+        Args:
+            path: Manifest file
+            output_path: Metadata file the manifest describes
+        """
+        self.path = Path(path)
+        self.output_path = Path(output_path)
+
+    @classmethod
+    def for_output(cls, output_path: Path, manifest_dir: Optional[Path] = None) -> "MetadataManifest":
+        """
+        Get the manifest of an output file.
+
+        Args:
+            output_path: Metadata file
+            manifest_dir: Override the manifest directory
+
+        Returns:
+            MetadataManifest
+        """
+        output_path = Path(output_path)
+        key = hashlib.sha256(str(output_path.resolve()).encode('utf-8')).hexdigest()[:16]
+        return cls((manifest_dir or DEFAULT_MANIFEST_DIR) / f"{output_path.stem}-{key}.json", output_path)
+
+    def load(self) -> Optional[Dict[str, str]]:
+        """
+        Load the recorded input hashes.
+
+        Returns:
+            Record key -> input hash, or None if the manifest is missing or
+            does not match the current output file and generator code
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if manifest.get("version") != MANIFEST_FORMAT_VERSION or manifest.get("code") != code_version():
+            return None
+        if not self.output_path.exists() or manifest.get("output_sha256") != file_sha256(self.output_path):
+            return None
+        return manifest.get("inputs")
+
+    def save(self, inputs: Dict[str, str]) -> None:
+        """
+        Record the input hashes of the output file just written.
+
+        Args:
+            inputs: Record key -> input hash
+        """
+        manifest = {
+            "version": MANIFEST_FORMAT_VERSION,
+            "code": code_version(),
+            "output_sha256": file_sha256(self.output_path),
+            "inputs": inputs,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+    def clear(self) -> None:
+        """Forget the recorded hashes (the next run rebuilds everything)."""
+        if self.path.exists():
+            self.path.unlink()
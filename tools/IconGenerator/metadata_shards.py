@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Sharded Icon Metadata Output
+
+Splits an IconMetadata.json document into shards, so an app can load a
+small core table at startup and fetch the larger parts on demand:
+
+    IconMetadata.core.json       font, categories and per icon: name, unicode, category
+    IconMetadata.keywords.json   search keywords
+    IconMetadata.i18n.<lang>.json  one shard per locale (zh, en, ...)
+    IconMetadata.details.json    all remaining icon fields (glyph, metrics, ...)
+    IconMetadata.shards.json     shard manifest: file, size and SHA-256 per shard
+
+The per-icon arrays of every shard are aligned with the icons of the core
+shard (entry i belongs to core icon i), so no shard repeats the names. The
+split is lossless: merge_shards() rebuilds the original document.
+
+Usage:
+    python metadata_shards.py --metadata path/to/IconMetadata.json --output build/shards
+    python metadata_shards.py --merge build/shards --output IconMetadata.merged.json
+
+    create_official_metadata.py, parse_font.py and build_catalog.py also
+    accept --shards DIR.
+"""
+
+import argparse
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+from json_output import dumps_canonical, write_bytes, write_json
+
+
+# Bump when the shard layout changes
+SHARD_FORMAT_VERSION = 1
+
+DEFAULT_PREFIX = "IconMetadata"
+
+# Icon fields stored in the core shard
+CORE_FIELDS = ("name", "unicode", "category")
+
+
+def split_metadata(metadata: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+    Split a metadata document into shards.
+
+    Args:
+        metadata: IconMetadata.json document
+
+    Returns:
+        Shard name ('core', 'keywords', 'i18n.zh', 'details', ...) -> shard document
+    """
+    icons: List[Dict[str, Any]] = metadata["icons"]
+    locales = sorted({locale for icon in icons for locale in icon.get("i18n", {})})
+
+    core = {key: value for key, value in metadata.items() if key != "icons"}
+    core["icons"] = [{field: icon[field] for field in CORE_FIELDS if field in icon} for icon in icons]
+
+    shards = {
+        "core": core,
+        # None: the icon has no keywords field (not the same as an empty list)
+        "keywords": {"keywords": [icon.get("keywords") for icon in icons]},
+    }
+    for locale in locales:
+        shards[f"i18n.{locale}"] = {"locale": locale,
+                                    "names": [icon.get("i18n", {}).get(locale) for icon in icons]}
+    # An empty i18n object has no locale shard entry to come back from, so it stays in the details
+    shards["details"] = {"icons": [
+        {key: value for key, value in icon.items()
+         if key not in CORE_FIELDS and key != "keywords" and (key != "i18n" or not value)}
+        for icon in icons
+    ]}
+    return shards
+
+
+def write_shards(directory: Path, metadata: Dict[str, Any], prefix: str = DEFAULT_PREFIX) -> Dict[str, Any]:
+    """
+    Write a metadata document as shards plus a shard manifest.
+
+    Unchanged shards are not rewritten (see json_output.write_bytes).
+
+    Args:
+        directory: Output directory
+        metadata: IconMetadata.json document
+        prefix: File name prefix
+
+    Returns:
+        The shard manifest
+    """
+    directory = Path(directory)
+    manifest: Dict[str, Any] = {
+        "version": SHARD_FORMAT_VERSION,
+        "icon_count": len(metadata["icons"]),
+        "shards": {},
+    }
+    for name, shard in split_metadata(metadata).items():
+        content = dumps_canonical(shard, compact=True)
+        file_name = f"{prefix}.{name}.json"
+        write_bytes(directory / file_name, content)
+        manifest["shards"][name] = {
+            "file": file_name,
+            "size": len(content),
+            "sha256": hashlib.sha256(content).hexdigest(),
+        }
+
+    write_json(directory / f"{prefix}.shards.json", manifest)
+
+    # Locales that are gone would otherwise leave stale shards behind
+    for path in directory.glob(f"{prefix}.i18n.*.json"):
+        if path.name[len(prefix) + 1:-len(".json")] not in manifest["shards"]:
+            path.unlink()
+    return manifest
+
+
+def merge_shards(directory: Path, prefix: str = DEFAULT_PREFIX) -> Dict[str, Any]:
+    """
+    Rebuild the metadata document from its shards.
+
+    Args:
+        directory: Shard directory
+        prefix: File name prefix
+
+    Returns:
+        IconMetadata.json document
+
+    Raises:
+        ValueError: If a shard does not match the manifest
+    """
+    directory = Path(directory)
+    with open(directory / f"{prefix}.shards.json", 'r', encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get("version") != SHARD_FORMAT_VERSION:
+        raise ValueError(f"Unsupported shard format: {manifest.get('version')}")
+
+    shards: Dict[str, Any] = {}
+    for name, entry in manifest["shards"].items():
+        content = (directory / entry["file"]).read_bytes()
+        if hashlib.sha256(content).hexdigest() != entry["sha256"]:
+            raise ValueError(f"Shard {entry['file']} does not match the manifest")
+        shards[name] = json.loads(content)
+
+    metadata = {key: value for key, value in shards["core"].items() if key != "icons"}
+    icons = []
+    for index, core_icon in enumerate(shards["core"]["icons"]):
+        icon = dict(core_icon)
+        icon.update(shards["details"]["icons"][index])
+        keywords = shards["keywords"]["keywords"][index]
+        if keywords is not None:
+            icon["keywords"] = keywords
+        i18n = {shard["locale"]: shard["names"][index]
+                for name, shard in shards.items() if name.startswith("i18n.") and shard["names"][index] is not None}
+        if i18n:
+            icon["i18n"] = i18n
+        icons.append(icon)
+    metadata["icons"] = icons
+    return metadata
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Split IconMetadata.json into shards or merge them back")
+    parser.add_argument("--metadata", type=Path, help="IconMetadata.json to split")
+    parser.add_argument("--merge", type=Path, help="Shard directory to merge")
+    parser.add_argument("--output", type=Path, required=True,
+                        help="Shard directory (split) or metadata file (merge)")
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX, help="Shard file name prefix")
+    args = parser.parse_args()
+
+    if bool(args.metadata) == bool(args.merge):
+        print("✗ Error: use either --metadata or --merge")
+        return 1
+
+    if args.merge:
+        metadata = merge_shards(args.merge, args.prefix)
+        write_json(args.output, metadata)
+        print(f"✓ Merged {len(metadata['icons'])} icons to: {args.output}")
+        return 0
+
+    with open(args.metadata, 'r', encoding='utf-8') as f:
+        metadata = json.load(f)
+    manifest = write_shards(args.output, metadata, args.prefix)
+    for name, entry in manifest["shards"].items():
+        print(f"  {entry['file']:36s} {entry['size']:>9} bytes")
+    print(f"✓ {manifest['icon_count']} icons in {len(manifest['shards'])} shards: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Streaming Metadata Writer and Reader
+
+Writes and reads IconMetadata.json-style documents one icon record at a
+time, so memory use does not grow with the catalog (multi-font catalogs
+with outlines and long keyword lists).
+
+The writer produces exactly the bytes json_output.write_json() would, so
+streamed and non-streamed output can be mixed freely. It writes to a
+temporary file and only replaces the target when the content differs,
+comparing both files chunk by chunk.
+
+The reader accepts any JSON layout: it decodes the top-level fields with
+json.JSONDecoder.raw_decode over a sliding buffer and yields the entries
+of "icons" as it reaches them.
+
+Usage:
+    from metadata_stream import MetadataStreamReader, write_metadata_stream
+
+    write_metadata_stream(path, {"font": {...}, "categories": [...]}, generate_icons())
+
+    reader = MetadataStreamReader(path)
+    for icon in reader:
+        ...
+    reader.header      # top-level fields other than "icons"
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from json_output import canonicalize
+
+
+# Key of the record list that is streamed
+ICONS_KEY = "icons"
+
+# Bytes read or compared at a time
+CHUNK_SIZE = 1 << 16
+
+
+def _dumps(value: Any, indent: int) -> str:
+    text = json.dumps(canonicalize(value), ensure_ascii=False, sort_keys=True, indent=2)
+    return text.replace("\n", "\n" + " " * indent)
+
+
+def _same_content(a: Path, b: Path) -> bool:
+    if not b.exists() or a.stat().st_size != b.stat().st_size:
+        return False
+    with open(a, 'rb') as fa, open(b, 'rb') as fb:
+        while True:
+            chunk = fa.read(CHUNK_SIZE)
+            if chunk != fb.read(CHUNK_SIZE):
+                return False
+            if not chunk:
+                return True
+
+
+class MetadataStreamWriter:
+    """Writes a metadata document record by record in canonical form."""
+
+    def __init__(self, path: Path, header: Dict[str, Any]):
+        """
+        Initialize the writer.
+
+        Args:
+            path: Output file
+            header: Top-level fields other than "icons"
+        """
+        self.path = Path(path)
+        self.count = 0
+        self.changed: Optional[bool] = None
+        keys = sorted(set(header) | {ICONS_KEY})
+        split = keys.index(ICONS_KEY)
+        self._before = [(key, header[key]) for key in keys[:split]]
+        self._after = [(key, header[key]) for key in keys[split + 1:]]
+        self._tmp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+        self._file = None
+
+    def __enter__(self) -> "MetadataStreamWriter":
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self._tmp_path, 'w', encoding='utf-8', newline='\n')
+        self._file.write("{\n")
+        for key, value in self._before:
+            self._file.write(f"  {json.dumps(key)}: {_dumps(value, 2)},\n")
+        self._file.write(f"  {json.dumps(ICONS_KEY)}: [")
+        return self
+
+    def write(self, icon: Dict[str, Any]) -> None:
+        """
+        Append one icon record.
+
+        Args:
+            icon: Icon metadata
+        """
+        self._file.write(",\n    " if self.count else "\n    ")
+        self._file.write(_dumps(icon, 4))
+        self.count += 1
+
+    def close(self) -> bool:
+        """
+        Finish the document and move it into place if it changed.
+
+        Returns:
+            True if the output file was written
+        """
+        self._file.write("\n  ]" if self.count else "]")
+        for key, value in self._after:
+            self._file.write(f",\n  {json.dumps(key)}: {_dumps(value, 2)}")
+        self._file.write("\n}\n")
+        self._file.close()
+
+        self.changed = not _same_content(self._tmp_path, self.path)
+        if self.changed:
+            os.replace(self._tmp_path, self.path)
+        else:
+            self._tmp_path.unlink()
+        return self.changed
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._file.close()
+            self._tmp_path.unlink()
+
+
+def write_metadata_stream(path: Path, header: Dict[str, Any], icons: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Stream icon records into a metadata document.
+
+    Args:
+        path: Output file
+        header: Top-level fields other than "icons"
+        icons: Icon records, consumed one at a time
+
+    Returns:
+        True if the output file was written, False if it was already up to date
+    """
+    with MetadataStreamWriter(path, header) as writer:
+        for icon in icons:
+            writer.write(icon)
+    return writer.changed
+
+
+class MetadataStreamReader:
+    """Iterates the icon records of a metadata document without loading it whole."""
+
+    def __init__(self, path: Path):
+        """
+        Initialize the reader.
+
+        Args:
+            path: Metadata file
+
+        Top-level fields are collected in `header` while iterating: fields
+        before "icons" are available once the first record is yielded, all
+        of them once iteration has finished.
+        """
+        self.path = Path(path)
+        self.header: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        with open(self.path, 'r', encoding='utf-8') as f:
+            self._file = f
+            self._buffer = ""
+            self._pos = 0
+            self._eof = False
+
+            self._expect("{")
+            if self._peek() == "}":
+                return
+            while True:
+                key = self._value()
+                self._expect(":")
+                if key == ICONS_KEY:
+                    self._expect("[")
+                    if self._peek() == "]":
+                        self._pos += 1
+                    else:
+                        while True:
+                            yield self._value()
+                            if self._next_delimiter(",]") == "]":
+                                break
+                else:
+                    self.header[key] = self._value()
+                if self._next_delimiter(",}") == "}":
+                    return
+
+    def _fill(self) -> bool:
+        # Drop consumed text, then append the next chunk
+        if self._eof:
+            return False
+        chunk = self._file.read(CHUNK_SIZE)
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        self._eof = not chunk
+        return bool(chunk)
+
+    def _peek(self) -> str:
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in " \t\r\n":
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError(f"{self.path}: unexpected end of file")
+
+    def _expect(self, char: str) -> None:
+        if self._peek() != char:
+            raise ValueError(f"{self.path}: expected '{char}'")
+        self._pos += 1
+
+    def _next_delimiter(self, chars: str) -> str:
+        char = self._peek()
+        if char not in chars:
+            raise ValueError(f"{self.path}: expected one of '{chars}'")
+        self._pos += 1
+        return char
+
+    def _value(self) -> Any:
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Most likely the value continues in the next chunk
+                if self._fill():
+                    continue
+                raise
+            # A number at the end of the buffer may still be incomplete
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._pos = end
+            return value
+
+
+def iter_icons(path: Path) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate the icon records of a metadata file.
+
+    Args:
+        path: Metadata file
+
+    Returns:
+        Iterator over icon dictionaries, in file order
+    """
+    return iter(MetadataStreamReader(path))
@@ -6,32 +6,47 @@ This script extracts icon metadata from Segoe Fluent Icons.ttf file
 and generates IconMetadata.json for code generation.
 
 Requirements:
-    pip install fonttools
+    fonttools is optional: font_reader.py decodes the tables this script
+    needs directly and only falls back to fonttools for unusual fonts.
 
 Usage:
-    python parse_font.py
+    python parse_font.py [--no-cache] [--clear-cache] [--categories RULES] [--binary PATH] [--shards DIR]
 """
 
-import json
+import argparse
 import re
 from pathlib import Path
-from fontTools.ttLib import TTFont
 from typing import List, Dict, Any
 
+from binary_catalog import write_catalog
+from categories import DEFAULT_RULES, Categorizer
+from font_cache import FontCache, open_cached_font
+from keywords import KeywordEngine
+from metadata_shards import write_shards
+from metadata_stream import write_metadata_stream
+
 
 class IconMetadataExtractor:
     """Extract icon metadata from TrueType font files."""
 
-    def __init__(self, font_path: str):
+    def __init__(self, font_path: str, use_fonttools: bool = False, use_cache: bool = True,
+                 category_rules: str = DEFAULT_RULES):
         """
         Initialize the extractor.
 
         Args:
             font_path: Path to the .ttf font file
+            use_fonttools: Read the font with fontTools instead of font_reader
+            use_cache: Reuse decoded font data from the font cache
+            category_rules: Category rules name or TSV path (see categories.py)
         """
         self.font_path = Path(font_path)
+        self.use_fonttools = use_fonttools
+        self.use_cache = use_cache
         self.font = None
         self.icons = []
+        self.keyword_engine = KeywordEngine.load()
+        self.categorizer = Categorizer.load(category_rules)
 
     def load_font(self) -> None:
         """Load the font file."""
@@ -39,8 +54,10 @@ class IconMetadataExtractor:
             raise FileNotFoundError(f"Font file not found: {self.font_path}")
 
         print(f"Loading font: {self.font_path}")
-        self.font = TTFont(str(self.font_path))
-        print(f"Font loaded successfully: {self.font['name'].getBestFullName()}")
+        self.font = open_cached_font(str(self.font_path), use_cache=self.use_cache,
+                                     use_fonttools=self.use_fonttools)
+        source = " (from cache)" if getattr(self.font, "from_cache", False) else ""
+        print(f"Font loaded successfully{source}: {self.font.get_best_full_name()}")
 
     def get_glyph_names(self) -> List[str]:
         """
@@ -53,7 +70,7 @@ class IconMetadataExtractor:
             raise RuntimeError("Font not loaded. Call load_font() first.")
 
         # Get the glyph order (exclude .notdef and special glyphs)
-        glyph_order = self.font.getGlyphOrder()
+        glyph_order = self.font.get_glyph_order()
         return [name for name in glyph_order if not name.startswith('.')]
 
     def extract_unicode_from_glyph_name(self, glyph_name: str) -> str:
@@ -89,51 +106,18 @@ class IconMetadataExtractor:
         """
         Estimate icon category based on glyph name and Unicode range.
 
-        Segoe Fluent Icons Unicode ranges (approximate):
-        - E700-E77F: Navigation & Basic
-        - E780-E7FF: Actions & Editing
-        - E800-E87F: Media & Audio
-        - E880-E8FF: Communication
-        - E900-E97F: Files & Folders
-        - E980-E9FF: Status & Alerts
-        - EA00-EA7F: UI Elements
-        - EA80-EAFF: Developer Tools
-        - EB00-EBFF: Security & Privacy
-
         Args:
             glyph_name: The glyph name
             unicode_point: Unicode code point (e.g., 'E72B')
 
         Returns:
-            Category name
+            Category name (rules from data/categories/, see categories.py)
         """
-        # Convert hex to int for range comparison
         try:
             code = int(unicode_point, 16)
         except ValueError:
-            return "uncategorized"
-
-        # Categorize by Unicode range
-        if 0xE700 <= code < 0xE780:
-            return "navigation"
-        elif 0xE780 <= code < 0xE800:
-            return "actions"
-        elif 0xE800 <= code < 0xE880:
-            return "media"
-        elif 0xE880 <= code < 0xE900:
-            return "communication"
-        elif 0xE900 <= code < 0xE980:
-            return "files"
-        elif 0xE980 <= code < 0xEA00:
-            return "status"
-        elif 0xEA00 <= code < 0xEA80:
-            return "ui"
-        elif 0xEA80 <= code < 0xEB00:
-            return "development"
-        elif 0xEB00 <= code < 0xEC00:
-            return "security"
-        else:
-            return "uncategorized"
+            return self.categorizer.default
+        return self.categorizer.categorize(code, self.guess_icon_name_from_glyph(glyph_name))
 
     def guess_icon_name_from_glyph(self, glyph_name: str) -> str:
         """
@@ -195,56 +179,58 @@ class IconMetadataExtractor:
                 skipped += 1
                 continue
 
-            # Build icon metadata
+            # Build icon metadata (category and keywords are filled in below, in one batch each)
+            name = self.guess_icon_name_from_glyph(glyph_name)
             icon = {
                 "glyph": glyph_name,
                 "unicode": unicode_hex,
                 "unicode_string": f"\\u{unicode_hex.lower()}",
-                "name": self.guess_icon_name_from_glyph(glyph_name),
-                "category": self.estimate_category_from_glyph_name(glyph_name, unicode_hex),
-                "keywords": self._generate_keywords(glyph_name, unicode_hex),
+                "name": name,
+                "category": "",
+                "keywords": [],
                 "i18n": {
-                    "en": self.guess_icon_name_from_glyph(glyph_name),
+                    "en": name,
                     "zh": ""  # To be filled manually
-                }
+                },
+                "metrics": self.font.get_glyph_metrics(glyph_name)
             }
 
             icons.append(icon)
 
+        categories = self.categorizer.categorize_all([int(icon["unicode"], 16) for icon in icons],
+                                                     [icon["name"] for icon in icons])
+        for icon, category in zip(icons, categories):
+            icon["category"] = category
+
+        self.keyword_engine.fit(icon["name"] for icon in icons)
+        all_keywords = self.keyword_engine.generate_all(
+            (icon["name"], icon["unicode"], icon["category"], [icon["glyph"]]) for icon in icons)
+        for icon, keywords in zip(icons, all_keywords):
+            icon["keywords"] = keywords
+
         print(f"Extracted {len(icons)} icons (skipped {skipped})")
         return icons
 
-    def _generate_keywords(self, glyph_name: str, unicode_hex: str) -> List[str]:
+    def build_metadata(self, icons: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
-        Generate search keywords for an icon.
+        Wrap extracted icons in the IconMetadata.json document structure.
 
         Args:
-            glyph_name: The glyph name
-            unicode_hex: Unicode code point
+            icons: List of icon metadata
 
         Returns:
-            List of keywords
+            Metadata document
         """
-        keywords = []
-
-        # Add the glyph name
-        keywords.append(glyph_name.lower())
-
-        # Add Unicode
-        keywords.append(unicode_hex.lower())
-        keywords.append(f"u{unicode_hex.lower()}")
-
-        # Add guessed name variations
-        name = self.guess_icon_name_from_glyph(glyph_name)
-        # Split PascalCase into words
-        words = re.findall(r'[A-Z]?[a-z]+|[A-Z]+(?=[A-Z]|$)', name)
-        keywords.extend([w.lower() for w in words])
-
-        # Add category as keyword
-        category = self.estimate_category_from_glyph_name(glyph_name, unicode_hex)
-        keywords.append(category.lower())
-
-        return list(set(keywords))  # Remove duplicates
+        return {
+            "$schema": "./IconMetadata.schema.json",
+            "font": {
+                "name": self.font.get_best_full_name() if self.font else "Unknown",
+                "version": str(self.font.font_revision) if self.font else "1.0",
+                "copyright": self.font.get_debug_name(0) if self.font else ""
+            },
+            "categories": self.categorizer.categories,
+            "icons": icons
+        }
 
     def save_to_json(self, output_path: str, icons: List[Dict[str, Any]]) -> None:
         """
@@ -255,34 +241,24 @@ class IconMetadataExtractor:
             icons: List of icon metadata
         """
         output = Path(output_path)
-        output.parent.mkdir(parents=True, exist_ok=True)
+        header = {key: value for key, value in self.build_metadata([]).items() if key != "icons"}
 
-        metadata = {
-            "$schema": "./IconMetadata.schema.json",
-            "font": {
-                "name": self.font['name'].getBestFullName() if self.font else "Unknown",
-                "version": str(float(self.font['head'].fontRevision)) if self.font else "1.0",
-                "copyright": self.font['name'].getDebugName(0) if self.font else ""
-            },
-            "categories": [
-                {"key": "navigation", "name": "Navigation", "name_zh": "导航", "priority": 1},
-                {"key": "actions", "name": "Actions", "name_zh": "操作", "priority": 2},
-                {"key": "media", "name": "Media", "name_zh": "媒体", "priority": 3},
-                {"key": "communication", "name": "Communication", "name_zh": "通信", "priority": 4},
-                {"key": "files", "name": "Files", "name_zh": "文件", "priority": 5},
-                {"key": "status", "name": "Status", "name_zh": "状态", "priority": 6},
-                {"key": "ui", "name": "UI Elements", "name_zh": "界面", "priority": 7},
-                {"key": "development", "name": "Development", "name_zh": "开发", "priority": 8},
-                {"key": "security", "name": "Security", "name_zh": "安全", "priority": 9},
-                {"key": "uncategorized", "name": "Uncategorized", "name_zh": "未分类", "priority": 999}
-            ],
-            "icons": icons
-        }
+        # Records are serialized one at a time (see metadata_stream.py)
+        if write_metadata_stream(output, header, icons):
+            print(f"Saved {len(icons)} icons to: {output}")
+        else:
+            print(f"Unchanged, not rewritten: {output}")
 
-        with open(output, 'w', encoding='utf-8') as f:
-            json.dump(metadata, f, indent=2, ensure_ascii=False)
+    def save_shards(self, directory: str, icons: List[Dict[str, Any]]) -> None:
+        """
+        Save icons as sharded output (core, keywords, i18n per locale; see metadata_shards.py).
 
-        print(f"Saved {len(icons)} icons to: {output}")
+        Args:
+            directory: Output directory
+            icons: List of icon metadata
+        """
+        manifest = write_shards(Path(directory), self.build_metadata(icons))
+        print(f"Saved {len(manifest['shards'])} shards to: {directory}")
 
     def close(self) -> None:
         """Close the font file."""
@@ -292,21 +268,42 @@ class IconMetadataExtractor:
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Extract icon metadata from Segoe Fluent Icons.ttf")
+    parser.add_argument("--no-cache", action="store_true", help="Always parse the font, bypassing the font cache")
+    parser.add_argument("--clear-cache", action="store_true", help="Invalidate the font cache before running")
+    parser.add_argument("--font", type=Path, default=None, help="Font file (default: Segoe Fluent Icons.ttf)")
+    parser.add_argument("--output", type=Path, default=None, help="Output file (default: IconMetadata.json here)")
+    parser.add_argument("--categories", default=DEFAULT_RULES,
+                        help="Category rules in data/categories/ or a TSV path")
+    parser.add_argument("--binary", type=Path, default=None,
+                        help="Also write a packed binary catalog (see binary_catalog.py)")
+    parser.add_argument("--shards", type=Path, default=None,
+                        help="Also write sharded output (core/keywords/i18n) to this directory")
+    args = parser.parse_args()
+
     # Paths
     project_root = Path(__file__).parent.parent.parent
-    font_path = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
-    output_path = Path(__file__).parent / "IconMetadata.json"
+    font_path = args.font or project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+    output_path = args.output or Path(__file__).parent / "IconMetadata.json"
 
     print("=" * 60)
     print("Segoe Fluent Icons Font Parser")
     print("=" * 60)
 
+    if args.clear_cache:
+        FontCache().clear()
+
     # Extract metadata
-    extractor = IconMetadataExtractor(str(font_path))
+    extractor = IconMetadataExtractor(str(font_path), use_cache=not args.no_cache,
+                                      category_rules=args.categories)
 
     try:
         icons = extractor.extract_all_icons()
         extractor.save_to_json(str(output_path), icons)
+        if args.binary:
+            write_catalog(args.binary, extractor.build_metadata(icons), source=output_path)
+        if args.shards:
+            extractor.save_shards(str(args.shards), icons)
 
         print("\n" + "=" * 60)
         print("✓ Extraction complete!")
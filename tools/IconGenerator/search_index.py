@@ -0,0 +1,542 @@
+#!/usr/bin/env python3
+"""
+Icon Search Index
+
+Builds a character n-gram inverted index over the strings an icon is found
+by (name, category, keywords and i18n names) and answers substring queries
+from it. The icon browser filters with Contains() on every keystroke; the
+index gives the same result set without scanning every icon.
+
+The index has two levels:
+
+    grams      n-gram (1 to MAX_GRAM characters) -> sorted term ids
+    postings   term id -> sorted document ids
+
+Terms are the distinct normalized search strings (NFKC, lower-cased; see
+cjk_text.py), documents are the icons in IconMetadata.json order. A query of up to MAX_GRAM characters is a
+single gram lookup. A longer query intersects the posting lists of its
+n-grams, checks the surviving terms with a substring test (n-grams can
+occur in a term without being adjacent) and merges the documents of the
+matching terms. A query spelling a code point ('e72b', '0xe72b', ...)
+also matches the icon with exactly that code point; code points are not
+part of the keywords (see keywords.py).
+
+Chinese text (translations, Chinese keywords) is also tokenized into
+character unigrams and bigrams with posting lists of their own:
+
+    cjk.tokens    sorted unigrams and bigrams
+    cjk.postings  token id -> sorted document ids
+    cjk.texts     document id -> its CJK search strings, '\n'-separated
+
+A query made of CJK characters only is answered from these lists: one or
+two characters are a single lookup, longer queries intersect their bigram
+lists and check the surviving icons' CJK strings.
+
+For ranking, the index also carries precomputed BM25 weights of the
+tokens of every icon (name and its words, keyword words, translations;
+CJK text as unigrams and bigrams), with per-field boosts (BM25F-style term frequencies):
+
+    ranking.tokens    sorted tokens
+    ranking.postings  token id -> sorted document ids
+    ranking.weights   token id -> BM25 weight per posting
+
+SearchIndex.rank() returns the same icons as search() (multi-word queries:
+icons matching every word), best first: a query word contributes the
+weight of a token it equals, or a share of it for a token it is a prefix
+of (the more of the token it covers, the larger the share).
+
+The index is written as a compact JSON sidecar next to the metadata file
+(IconMetadata.search.json); every posting list is a sorted integer array.
+
+Usage:
+    python search_index.py --metadata path/to/IconMetadata.json [--output PATH]
+    python search_index.py --metadata path/to/IconMetadata.json --query arrow
+
+    from search_index import SearchIndex
+    index = SearchIndex.load("IconMetadata.search.json")
+    for doc_id in index.search("arrow"):
+        name, unicode = index.documents[doc_id]
+    index.rank("arrow left", limit=10)     # [(doc_id, score), ...]
+"""
+
+import argparse
+import json
+import math
+from bisect import bisect_left
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple
+
+from cjk_text import cjk_query_tokens, cjk_tokens, is_cjk_text, normalize_text
+from icon_text import split_name
+from json_output import write_json
+from keywords import codepoint_query
+from metadata_stream import iter_icons
+
+
+# Bump when the index layout changes
+SEARCH_INDEX_FORMAT_VERSION = 3
+
+# Longest n-gram stored; shorter queries are answered by one lookup
+MAX_GRAM = 3
+
+# BM25 parameters of the ranking weights
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Term frequency multiplier per field
+FIELD_BOOSTS = {"name": 3.0, "keywords": 1.0, "translations": 1.5}
+
+# Share of a token's weight a query word earns when it is only a prefix of the
+# token, further scaled by the share of the token the word covers
+PREFIX_MATCH_FACTOR = 0.6
+
+# Score of an exact code point match; ranks it above any text match
+CODEPOINT_MATCH_SCORE = 100.0
+
+
+def icon_search_texts(icon: Dict[str, Any]) -> List[str]:
+    """
+    Get the normalized strings an icon is found by.
+
+    Args:
+        icon: Icon metadata
+
+    Returns:
+        Distinct search strings, sorted
+    """
+    texts = [icon.get("name", ""), icon.get("category", "")]
+    texts.extend(icon.get("keywords", []))
+    texts.extend(icon.get("i18n", {}).values())
+    return sorted({normalize_text(text) for text in texts if text})
+
+
+def icon_ranking_tokens(icon: Dict[str, Any]) -> Dict[str, List[str]]:
+    """
+    Get the ranking tokens of an icon per field.
+
+    Args:
+        icon: Icon metadata
+
+    Returns:
+        Field ('name', 'keywords', 'translations') -> lowercased tokens
+    """
+    name = icon.get("name", "")
+    translations = []
+    for _, text in sorted(icon.get("i18n", {}).items()):
+        # The English translation is the name itself for most icons
+        if text and text.lower() != name.lower():
+            translations.extend(text_tokens(text))
+    return {
+        "name": [name.lower()] + [word for word in split_name(name) if word != name.lower()],
+        "keywords": [token for keyword in icon.get("keywords", []) for token in text_tokens(keyword)],
+        "translations": translations,
+    }
+
+
+def text_tokens(text: str) -> List[str]:
+    """
+    Split a keyword or translation into ranking tokens.
+
+    Args:
+        text: Keyword or translation
+
+    Returns:
+        Whitespace-separated words without CJK characters, plus the CJK
+        unigrams and bigrams
+    """
+    text = normalize_text(text)
+    tokens = [word for word in text.split() if not cjk_tokens(word)]
+    tokens.extend(cjk_tokens(text))
+    return tokens
+
+
+def build_ranking(icon_tokens: List[Dict[str, List[str]]]) -> Dict[str, Any]:
+    """
+    Compute BM25 weights for the tokens of every icon.
+
+    Term frequencies and document lengths count each token occurrence
+    with the boost of its field.
+
+    Args:
+        icon_tokens: Output of icon_ranking_tokens() per icon, in metadata order
+
+    Returns:
+        Ranking section of the index document
+    """
+    frequencies = []
+    lengths = []
+    for fields in icon_tokens:
+        counts: Counter = Counter()
+        for field, tokens in fields.items():
+            for token in tokens:
+                counts[token] += FIELD_BOOSTS[field]
+        frequencies.append(counts)
+        lengths.append(sum(counts.values()))
+
+    count = len(frequencies)
+    average_length = sum(lengths) / count if count else 0.0
+    document_frequencies = Counter(token for counts in frequencies for token in counts)
+
+    postings: Dict[str, List[int]] = {}
+    weights: Dict[str, List[float]] = {}
+    for doc_id, counts in enumerate(frequencies):
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[doc_id] / average_length)
+        for token, frequency in counts.items():
+            df = document_frequencies[token]
+            idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+            postings.setdefault(token, []).append(doc_id)
+            weights.setdefault(token, []).append(round(idf * frequency * (BM25_K1 + 1) / (frequency + norm), 4))
+
+    tokens = sorted(postings)
+    return {
+        "k1": BM25_K1,
+        "b": BM25_B,
+        "field_boosts": FIELD_BOOSTS,
+        "tokens": tokens,
+        "postings": [postings[token] for token in tokens],
+        "weights": [weights[token] for token in tokens],
+    }
+
+
+def text_grams(text: str) -> set:
+    """
+    Get all n-grams of 1 to MAX_GRAM characters of a string.
+
+    Args:
+        text: Search string
+
+    Returns:
+        Set of n-grams
+    """
+    return {text[i:i + n] for n in range(1, MAX_GRAM + 1) for i in range(len(text) - n + 1)}
+
+
+def intersect_sorted(a: Sequence[int], b: Sequence[int]) -> List[int]:
+    """
+    Intersect two sorted integer arrays.
+
+    Walks the shorter array and binary-searches the longer one from the
+    last match on, so the cost follows the shorter list.
+
+    Args:
+        a: Sorted integers
+        b: Sorted integers
+
+    Returns:
+        Sorted integers present in both
+    """
+    if len(a) > len(b):
+        a, b = b, a
+    result = []
+    lo, end = 0, len(b)
+    for value in a:
+        lo = bisect_left(b, value, lo)
+        if lo == end:
+            break
+        if b[lo] == value:
+            result.append(value)
+            lo += 1
+    return result
+
+
+def build_search_index(icons: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the search index of a set of icons.
+
+    Args:
+        icons: Icon records in metadata order
+
+    Returns:
+        Index document (see the module docstring)
+    """
+    documents = []
+    term_documents: Dict[str, List[int]] = {}
+    cjk_documents: Dict[str, List[int]] = {}
+    cjk_texts = []
+    ranking_tokens = []
+    for doc_id, icon in enumerate(icons):
+        documents.append([icon["name"], icon["unicode"]])
+        texts = icon_search_texts(icon)
+        for text in texts:
+            term_documents.setdefault(text, []).append(doc_id)
+        tokens = {token for text in texts for token in cjk_tokens(text)}
+        for token in tokens:
+            cjk_documents.setdefault(token, []).append(doc_id)
+        cjk_texts.append("\n".join(text for text in texts if cjk_tokens(text)))
+        ranking_tokens.append(icon_ranking_tokens(icon))
+
+    terms = sorted(term_documents)
+    grams: Dict[str, List[int]] = {}
+    for term_id, term in enumerate(terms):
+        for gram in text_grams(term):
+            grams.setdefault(gram, []).append(term_id)
+
+    return {
+        "version": SEARCH_INDEX_FORMAT_VERSION,
+        "max_gram": MAX_GRAM,
+        "documents": documents,
+        "terms": terms,
+        "postings": [term_documents[term] for term in terms],
+        "grams": grams,
+        "cjk": {
+            "tokens": sorted(cjk_documents),
+            "postings": [cjk_documents[token] for token in sorted(cjk_documents)],
+            "texts": cjk_texts,
+        },
+        "ranking": build_ranking(ranking_tokens),
+    }
+
+
+class SearchIndex:
+    """Substring search over a prebuilt n-gram index."""
+
+    def __init__(self, index: Dict[str, Any]):
+        """
+        Initialize the index.
+
+        Args:
+            index: Index document from build_search_index() or the sidecar file
+
+        Raises:
+            ValueError: If the index was written by an incompatible version
+        """
+        if index.get("version") != SEARCH_INDEX_FORMAT_VERSION or index.get("max_gram") != MAX_GRAM:
+            raise ValueError(f"Unsupported search index format: {index.get('version')}")
+        self.documents: List[List[str]] = index["documents"]
+        self.terms: List[str] = index["terms"]
+        self.postings: List[List[int]] = index["postings"]
+        self.grams: Dict[str, List[int]] = index["grams"]
+        self.codepoints: Dict[str, List[int]] = {}
+        for doc_id, (_, unicode) in enumerate(self.documents):
+            self.codepoints.setdefault(unicode, []).append(doc_id)
+        cjk = index["cjk"]
+        self.cjk_postings: Dict[str, List[int]] = dict(zip(cjk["tokens"], cjk["postings"]))
+        self.cjk_texts: List[str] = cjk["texts"]
+        ranking = index["ranking"]
+        self.rank_tokens: List[str] = ranking["tokens"]
+        self.rank_postings: List[List[int]] = ranking["postings"]
+        self.rank_weights: List[List[float]] = ranking["weights"]
+
+    @classmethod
+    def load(cls, path: Path) -> "SearchIndex":
+        """
+        Load an index sidecar file.
+
+        Args:
+            path: IconMetadata.search.json
+
+        Returns:
+            SearchIndex
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    @classmethod
+    def from_metadata(cls, metadata_path: Path) -> "SearchIndex":
+        """
+        Build an index in memory from a metadata file.
+
+        Args:
+            metadata_path: IconMetadata.json
+
+        Returns:
+            SearchIndex
+        """
+        return cls(build_search_index(iter_icons(metadata_path)))
+
+    def matching_terms(self, query: str) -> List[int]:
+        """
+        Find the terms containing a query.
+
+        Args:
+            query: Search text (case-insensitive)
+
+        Returns:
+            Sorted term ids
+        """
+        query = normalize_text(query).strip()
+        if not query:
+            return []
+        if len(query) <= MAX_GRAM:
+            return self.grams.get(query, [])
+
+        lists = []
+        for i in range(len(query) - MAX_GRAM + 1):
+            posting = self.grams.get(query[i:i + MAX_GRAM])
+            if posting is None:
+                return []
+            lists.append(posting)
+        lists.sort(key=len)
+
+        candidates = lists[0]
+        for posting in lists[1:]:
+            candidates = intersect_sorted(candidates, posting)
+            if not candidates:
+                return []
+        return [term_id for term_id in candidates if query in self.terms[term_id]]
+
+    def search(self, query: str) -> List[int]:
+        """
+        Find the icons matching a query, like the browser's Contains() filter.
+
+        Args:
+            query: Search text (case-insensitive)
+
+        Returns:
+            Sorted document ids (positions in IconMetadata.json)
+        """
+        normalized = normalize_text(query).strip()
+        if is_cjk_text(normalized):
+            return self.search_cjk(normalized)
+        term_ids = self.matching_terms(query)
+        codepoint_doc_ids = self.codepoints.get(codepoint_query(query), [])
+        if len(term_ids) == 1 and not codepoint_doc_ids:
+            return list(self.postings[term_ids[0]])
+        doc_ids = set(codepoint_doc_ids)
+        for term_id in term_ids:
+            doc_ids.update(self.postings[term_id])
+        return sorted(doc_ids)
+
+    def search_cjk(self, query: str) -> List[int]:
+        """
+        Find the icons whose search strings contain a CJK query.
+
+        Args:
+            query: Normalized CJK text
+
+        Returns:
+            Sorted document ids
+        """
+        lists = []
+        for token in cjk_query_tokens(query):
+            posting = self.cjk_postings.get(token)
+            if posting is None:
+                return []
+            lists.append(posting)
+        lists.sort(key=len)
+
+        candidates = list(lists[0])
+        for posting in lists[1:]:
+            candidates = intersect_sorted(candidates, posting)
+        if len(query) <= 2:
+            return candidates
+        # Bigrams may occur in different places; check the strings themselves
+        return [doc_id for doc_id in candidates if query in self.cjk_texts[doc_id]]
+
+    def word_scores(self, word: str) -> Dict[int, float]:
+        """
+        Score the icons whose ranking tokens start with a query word.
+
+        A CJK word scores the mean weight of its unigram or bigram tokens.
+
+        Args:
+            word: Normalized query word
+
+        Returns:
+            Document id -> best weight of a matching token
+        """
+        scores: Dict[int, float] = {}
+        if is_cjk_text(word):
+            tokens = cjk_query_tokens(word)
+            for token in tokens:
+                token_id = bisect_left(self.rank_tokens, token)
+                if token_id < len(self.rank_tokens) and self.rank_tokens[token_id] == token:
+                    for doc_id, weight in zip(self.rank_postings[token_id], self.rank_weights[token_id]):
+                        scores[doc_id] = scores.get(doc_id, 0.0) + weight / len(tokens)
+            return scores
+        for token_id in range(bisect_left(self.rank_tokens, word), len(self.rank_tokens)):
+            token = self.rank_tokens[token_id]
+            if not token.startswith(word):
+                break
+            factor = 1.0 if token == word else PREFIX_MATCH_FACTOR * len(word) / len(token)
+            for doc_id, weight in zip(self.rank_postings[token_id], self.rank_weights[token_id]):
+                if weight * factor > scores.get(doc_id, 0.0):
+                    scores[doc_id] = weight * factor
+        for doc_id in self.codepoints.get(codepoint_query(word), []):
+            scores[doc_id] = CODEPOINT_MATCH_SCORE
+        return scores
+
+    def rank(self, query: str, limit: int = 0) -> List[Tuple[int, float]]:
+        """
+        Find and rank the icons matching a query.
+
+        Every word of the query must match (search() applied per word and
+        intersected); the score is the sum of the word scores. Ties go to
+        shorter names, then to metadata order. For a multi-word query this
+        is a different result set than search(), which matches the whole
+        text as one substring ('zoom in' finds nothing there).
+
+        Args:
+            query: Search text (case-insensitive)
+            limit: Maximum number of results (0: all)
+
+        Returns:
+            (document id, score) tuples, best first
+        """
+        words = normalize_text(query).split()
+        if not words:
+            return []
+        candidates = self.search(words[0])
+        for word in words[1:]:
+            candidates = intersect_sorted(candidates, self.search(word))
+
+        scores: Dict[int, float] = {}
+        for word in words:
+            for doc_id, score in self.word_scores(word).items():
+                scores[doc_id] = scores.get(doc_id, 0.0) + score
+        ranked = sorted(candidates, key=lambda doc_id: (-scores.get(doc_id, 0.0),
+                                                        len(self.documents[doc_id][0]), doc_id))
+        if limit:
+            ranked = ranked[:limit]
+        return [(doc_id, scores.get(doc_id, 0.0)) for doc_id in ranked]
+
+
+def write_search_index(path: Path, icons: Iterable[Dict[str, Any]]) -> bool:
+    """
+    Build the search index and write it as a compact sidecar.
+
+    Args:
+        path: Output file
+        icons: Icon records in metadata order
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    return write_json(path, build_search_index(icons), compact=True)
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description="Build or query the icon search index")
+    parser.add_argument("--metadata", type=Path, required=True, help="IconMetadata.json")
+    parser.add_argument("--output", type=Path, default=None,
+                        help="Index file (default: IconMetadata.search.json next to the metadata)")
+    parser.add_argument("--query", help="Search the index instead of building it")
+    parser.add_argument("--rank", action="store_true", help="Rank the results of --query")
+    parser.add_argument("--limit", type=int, default=0, help="Maximum number of ranked results")
+    args = parser.parse_args()
+
+    output_path = args.output or args.metadata.with_suffix(".search.json")
+
+    if args.query is not None:
+        index = SearchIndex.load(output_path) if output_path.exists() else SearchIndex.from_metadata(args.metadata)
+        if args.rank:
+            results = index.rank(args.query, args.limit)
+        else:
+            results = [(doc_id, None) for doc_id in index.search(args.query)]
+        for doc_id, score in results:
+            name, unicode = index.documents[doc_id]
+            print(f"  {unicode:6s} {name:40s} {score:8.3f}" if score is not None else f"  {unicode:6s} {name}")
+        print(f"✓ {len(results)} icons match '{args.query}'")
+        return 0
+
+    changed = write_search_index(output_path, iter_icons(args.metadata))
+    index = SearchIndex.load(output_path)
+    print(f"✓ {len(index.documents)} icons, {len(index.terms)} terms, {len(index.grams)} n-grams")
+    print(f"✓ {'Saved' if changed else 'Unchanged'}: {output_path} ({output_path.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
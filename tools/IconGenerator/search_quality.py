@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Search Latency and Quality Harness
+
+Replays a recorded query log (data/search/query_log.tsv: query, picked
+icon) against three searches and compares them:
+
+    linear   the browser's current filter: the whole query as one substring
+             of name, category, keywords or translations, results in
+             registry (metadata) order
+    words    the same filter applied to every word of the query (all must
+             match), registry order -- the matching rule of rank()
+    ranked   SearchIndex.rank(): index lookup, BM25-ranked
+
+rank() changes two things at once: multi-word queries match per word, and
+the results are ordered. 'linear' vs 'words' shows the effect of the
+matching rule alone, 'words' vs 'ranked' the effect of ranking alone
+(both return the same icons; the harness checks this).
+
+For each it reports the p50/p99 latency per query and the top-k quality:
+how often the picked icon is the first result (hit@1), among the first k
+(hit@k), and the mean reciprocal rank of the picked icon within the first
+k (MRR@k). Ranking can be tuned offline (search_index.py FIELD_BOOSTS,
+BM25_K1, BM25_B, PREFIX_MATCH_FACTOR) and checked here without touching the
+WPF app.
+
+Usage:
+    python search_quality.py [--log PATH] [--metadata PATH] [--top-k 10] [--runs N] [--misses]
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from benchmark_search import linear_search
+from metadata_stream import iter_icons
+from search_index import SearchIndex, build_search_index, icon_search_texts
+
+
+DEFAULT_LOG_PATH = Path(__file__).parent / "data" / "search" / "query_log.tsv"
+
+
+def load_query_log(path: Path) -> List[Tuple[str, str]]:
+    """
+    Load a query log.
+
+    Args:
+        path: TSV with 'query<TAB>picked icon' lines ('#' starts a comment line)
+
+    Returns:
+        (query, picked icon name) per logged search
+    """
+    entries = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.rstrip('\n')
+            if not line.strip() or line.startswith('#'):
+                continue
+            query, sep, icon = line.partition('\t')
+            if not sep:
+                raise ValueError(f"{path}:{line_number}: expected 'query<TAB>icon'")
+            entries.append((query, icon.strip()))
+    return entries
+
+
+def percentile(values: List[float], share: float) -> float:
+    """
+    Get a percentile by the nearest-rank method.
+
+    Args:
+        values: Samples
+        share: Percentile as a fraction (0.99 for p99)
+
+    Returns:
+        The sample at that rank
+    """
+    ordered = sorted(values)
+    return ordered[max(0, min(len(ordered) - 1, round(share * len(ordered)) - 1))]
+
+
+def replay(search: Callable[[str], List[int]], log: List[Tuple[str, str]], names: List[str],
+           top_k: int, runs: int) -> Dict[str, object]:
+    """
+    Replay a query log against one search function.
+
+    Args:
+        search: Query -> document ids, best first
+        log: (query, picked icon name) entries
+        names: Icon name per document id
+        top_k: Results considered for quality
+        runs: Repetitions per query; the fastest is kept
+
+    Returns:
+        Latencies (ms), ranks of the picked icons (None: not in the top k) and result counts
+    """
+    latencies, ranks, counts = [], [], []
+    for query, picked in log:
+        best = None
+        for _ in range(runs):
+            start = time.perf_counter()
+            results = search(query)
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        latencies.append(best)
+        top = [names[doc_id] for doc_id in results[:top_k]]
+        ranks.append(top.index(picked) + 1 if picked in top else None)
+        counts.append(len(results))
+    return {"latencies": latencies, "ranks": ranks, "counts": counts}
+
+
+def word_search(icon_texts: List[List[str]], icon_codes: List[str], query: str) -> List[int]:
+    """
+    Apply the linear filter to every word of a query.
+
+    Args:
+        icon_texts: Normalized search strings per icon
+        icon_codes: Code point ("unicode") per icon
+        query: Search text
+
+    Returns:
+        Positions matching every word, in metadata order
+    """
+    words = query.split()
+    if not words:
+        return []
+    matches = set(linear_search(icon_texts, icon_codes, words[0]))
+    for word in words[1:]:
+        matches &= set(linear_search(icon_texts, icon_codes, word))
+    return sorted(matches)
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    default_metadata = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons" / "IconMetadata.json"
+
+    parser = argparse.ArgumentParser(description="Replay a query log against linear and ranked search")
+    parser.add_argument("--log", type=Path, default=DEFAULT_LOG_PATH, help="Query log TSV")
+    parser.add_argument("--metadata", type=Path, default=default_metadata, help="IconMetadata.json")
+    parser.add_argument("--top-k", type=int, default=10, help="Results considered for quality")
+    parser.add_argument("--runs", type=int, default=10, help="Repetitions per query")
+    parser.add_argument("--misses", action="store_true", help="List queries whose pick is not ranked first")
+    args = parser.parse_args()
+
+    log = load_query_log(args.log)
+    icons = list(iter_icons(args.metadata))
+    names = [icon["name"] for icon in icons]
+    icon_texts = [icon_search_texts(icon) for icon in icons]
+    icon_codes = [icon["unicode"] for icon in icons]
+    # Built from the metadata, so ranking changes are measured without regenerating the sidecar
+    index = SearchIndex(build_search_index(icons))
+
+    searches = {
+        "linear": lambda query: linear_search(icon_texts, icon_codes, query),
+        "words": lambda query: word_search(icon_texts, icon_codes, query),
+        "ranked": lambda query: [doc_id for doc_id, _ in index.rank(query)],
+    }
+
+    print("=" * 60)
+    print("Search Latency and Quality")
+    print("=" * 60)
+    print(f"Log: {args.log} ({len(log)} searches, {len({query for query, _ in log})} distinct)")
+    print(f"Icons: {len(icons)}, top-k: {args.top_k}")
+    print("-" * 60)
+    print(f"{'Search':<8} {'p50 ms':>8} {'p99 ms':>8} {'hit@1':>7} {'hit@k':>7} {'MRR@k':>7} {'Results':>8}")
+    print("-" * 60)
+
+    results = {}
+    for label, search in searches.items():
+        result = replay(search, log, names, args.top_k, args.runs)
+        results[label] = result
+        ranks = result["ranks"]
+        print(f"{label:<8} {percentile(result['latencies'], 0.5):>8.3f} {percentile(result['latencies'], 0.99):>8.3f} "
+              f"{sum(rank == 1 for rank in ranks) / len(ranks):>7.1%} "
+              f"{sum(rank is not None for rank in ranks) / len(ranks):>7.1%} "
+              f"{sum(1 / rank for rank in ranks if rank) / len(ranks):>7.3f} "
+              f"{statistics.mean(result['counts']):>8.1f}")
+
+    # Matching rule vs ranking: which searches return a different set of icons
+    print("-" * 60)
+    distinct = sorted({query for query, _ in log})
+    rule_changes = [query for query in distinct
+                    if set(searches["linear"](query)) != set(searches["words"](query))]
+    rank_changes = [query for query in distinct
+                    if set(searches["words"](query)) != set(searches["ranked"](query))]
+    print(f"Matching rule: {len(rule_changes)} of {len(distinct)} distinct queries match different icons "
+          f"per word than as one substring" + (f" ({', '.join(rule_changes)})" if rule_changes else ""))
+    if rank_changes:
+        print(f"✗ rank() and the per-word filter disagree on: {', '.join(rank_changes)}")
+        return 1
+    print("✓ rank() returns the same icons as the per-word filter; 'words' vs 'ranked' is the ranking gain")
+
+    if args.misses:
+        print("-" * 60)
+        print(f"{'Query':<16} {'Picked':<20} {'Linear':>7} {'Words':>7} {'Ranked':>7}")
+        for i, (query, picked) in enumerate(log):
+            ranks = [results[label]["ranks"][i] for label in ("linear", "words", "ranked")]
+            if ranks[2] != 1:
+                print(f"{query:<16} {picked:<20} " + " ".join(f"{rank or '-':>7}" for rank in ranks))
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
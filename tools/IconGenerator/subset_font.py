@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Usage-driven Font Subsetting
+
+Builds a trimmed copy of Segoe Fluent Icons.ttf that only contains the icons
+an application actually uses, as TTF and (if brotli is installed) WOFF2.
+Hinting and tables the WPF host never reads are dropped, and the before/after
+byte sizes are reported.
+
+Requirements:
+    pip install fonttools
+    pip install brotli        # optional, for WOFF2 output
+
+Usage:
+    python subset_font.py --names Back Forward Search
+    python subset_font.py --codepoints E72B,E72A,E721
+    python subset_font.py --names-file used_icons.txt --output-dir build/fonts
+"""
+
+import argparse
+import json
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, Set
+
+
+# Tables that carry nothing the WPF text stack needs for icon rendering
+DROP_TABLES = ["DSIG", "meta"]
+
+
+def parse_codepoints(values: Iterable[str]) -> Set[int]:
+    """
+    Parse code points given as hex strings.
+
+    Accepts 'E72B', 'uE72B', 'U+E72B' and '0xE72B', separated by commas or
+    whitespace.
+
+    Args:
+        values: Raw command-line or file values
+
+    Returns:
+        Set of code points
+    """
+    codepoints = set()
+    for value in values:
+        for token in re.split(r'[,\s]+', value.strip()):
+            if not token:
+                continue
+            match = re.fullmatch(r'(?:0x|u\+?|U\+?)?([0-9A-Fa-f]{4,6})', token)
+            if not match:
+                raise ValueError(f"Invalid code point: {token}")
+            codepoints.add(int(match.group(1), 16))
+    return codepoints
+
+
+def resolve_icon_names(names: Iterable[str], metadata_path: Path) -> Set[int]:
+    """
+    Resolve icon names to code points through IconMetadata.json.
+
+    Args:
+        names: Icon names (case-insensitive)
+        metadata_path: Path to IconMetadata.json
+
+    Returns:
+        Set of code points
+    """
+    with open(metadata_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    by_name: Dict[str, int] = {icon['name'].lower(): int(icon['unicode'], 16) for icon in data['icons']}
+
+    codepoints = set()
+    missing = []
+    for name in names:
+        code = by_name.get(name.lower())
+        if code is None:
+            missing.append(name)
+        else:
+            codepoints.add(code)
+
+    if missing:
+        raise ValueError(f"Unknown icon names: {', '.join(missing)}")
+    return codepoints
+
+
+def read_list_file(path: Path) -> List[str]:
+    """Read one entry per line, ignoring blank lines and '#' comments."""
+    with open(path, 'r', encoding='utf-8') as f:
+        return [line.split('#', 1)[0].strip() for line in f if line.split('#', 1)[0].strip()]
+
+
+def subset_font(font_path: Path, codepoints: Set[int], output_dir: Path) -> Dict[str, int]:
+    """
+    Subset the font to the given code points.
+
+    Args:
+        font_path: Source TTF
+        codepoints: Code points to keep
+        output_dir: Directory for the trimmed fonts
+
+    Returns:
+        Mapping of output path to byte size
+    """
+    from fontTools import subset
+    from fontTools.ttLib import TTFont
+
+    options = subset.Options()
+    options.hinting = False
+    options.drop_tables = options.drop_tables + DROP_TABLES
+    options.name_IDs = [0, 1, 2, 3, 4, 5, 6]
+    options.notdef_outline = True
+    options.recalc_bounds = True
+    options.recalc_timestamp = False
+
+    font = TTFont(str(font_path))
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = font_path.stem
+    outputs: Dict[str, int] = {}
+
+    ttf_path = output_dir / f"{stem}.subset.ttf"
+    font.flavor = None
+    font.save(str(ttf_path))
+    outputs[str(ttf_path)] = ttf_path.stat().st_size
+
+    try:
+        import brotli  # noqa: F401  (required by fontTools for WOFF2)
+    except ImportError:
+        print("Note: brotli not installed, skipping WOFF2 output (pip install brotli)")
+    else:
+        woff2_path = output_dir / f"{stem}.subset.woff2"
+        font.flavor = "woff2"
+        font.save(str(woff2_path))
+        outputs[str(woff2_path)] = woff2_path.stat().st_size
+
+    font.close()
+    return outputs
+
+
+def main():
+    """Main entry point."""
+    project_root = Path(__file__).parent.parent.parent
+    default_font = project_root / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+    default_metadata = project_root / "src" / "UI" / "Lemoo.UI" / "Models" / "Icons" / "IconMetadata.json"
+    default_output = Path(__file__).parent / "build" / "subset"
+
+    parser = argparse.ArgumentParser(description="Build a trimmed icon font from the icons in use")
+    parser.add_argument("--font", type=Path, default=default_font, help="Source font file")
+    parser.add_argument("--metadata", type=Path, default=default_metadata, help="IconMetadata.json for name lookup")
+    parser.add_argument("--names", nargs="*", default=[], help="Icon names to keep")
+    parser.add_argument("--names-file", type=Path, help="File with one icon name per line")
+    parser.add_argument("--codepoints", nargs="*", default=[], help="Hex code points to keep (e.g. E72B,E72A)")
+    parser.add_argument("--codepoints-file", type=Path, help="File with hex code points")
+    parser.add_argument("--output-dir", type=Path, default=default_output, help="Output directory")
+    args = parser.parse_args()
+
+    print("=" * 60)
+    print("Icon Font Subsetter")
+    print("=" * 60)
+
+    try:
+        names = list(args.names)
+        if args.names_file:
+            names.extend(read_list_file(args.names_file))
+
+        raw_codepoints = list(args.codepoints)
+        if args.codepoints_file:
+            raw_codepoints.extend(read_list_file(args.codepoints_file))
+
+        codepoints = parse_codepoints(raw_codepoints)
+        if names:
+            codepoints |= resolve_icon_names(names, args.metadata)
+
+        if not codepoints:
+            print("✗ Error: no icons selected (use --names, --names-file, --codepoints or --codepoints-file)")
+            return 1
+
+        print(f"Font: {args.font}")
+        print(f"Keeping {len(codepoints)} code points")
+
+        original_size = args.font.stat().st_size
+        outputs = subset_font(args.font, codepoints, args.output_dir)
+
+    except (ValueError, OSError) as e:
+        print(f"\n✗ Error: {e}")
+        return 1
+
+    print("\n" + "-" * 60)
+    print(f"{'File':<40} {'Bytes':>10} {'Of original':>10}")
+    print("-" * 60)
+    print(f"{args.font.name:<40} {original_size:>10} {'100.0%':>10}")
+    for path, size in outputs.items():
+        print(f"{Path(path).name:<40} {size:>10} {size / original_size:>10.1%}")
+    print("=" * 60)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
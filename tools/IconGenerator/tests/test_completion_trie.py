@@ -0,0 +1,15 @@
+"""Tests for completion_trie.py."""
+
+from completion_trie import CompletionTrie, build_completion_trie
+
+
+def test_aliases_list_completes_to_canonical_icon():
+    icons = [
+        {"name": "Wifi", "unicode": "E701", "category": "communication", "verified": True,
+         "aliases": ["MobWifi4"], "i18n": {"zh": "无线网络"}},
+        {"name": "MobWifi3", "unicode": "EC3E", "category": "communication"},
+    ]
+    trie = CompletionTrie(build_completion_trie(icons))
+    assert trie.complete("MobWifi4") == [("Wifi", "E701", "MobWifi4")]
+    assert trie.complete("mobwifi") == [("Wifi", "E701", "MobWifi4"), ("MobWifi3", "EC3E", "MobWifi3")]
+    assert trie.complete("Wi") == [("Wifi", "E701", "Wifi")]
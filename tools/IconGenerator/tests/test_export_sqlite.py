@@ -0,0 +1,36 @@
+"""Tests for export_sqlite.py."""
+
+import sqlite3
+
+from export_sqlite import SqliteExporter, search
+
+
+def icons_with_aliases(aliases):
+    return [
+        {"name": "Wifi", "unicode": "E701", "category": "communication", "aliases": aliases,
+         "keywords": ["wireless"], "i18n": {"zh": "无线网络"}},
+        {"name": "Back", "unicode": "E72B", "category": "navigation", "keywords": ["previous"]},
+    ]
+
+
+def alias_rows(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT a.alias, i.name FROM aliases a JOIN icons i ON i.id = a.icon_id "
+                            "ORDER BY a.alias").fetchall()
+
+
+def test_aliases_list_is_exported_and_updated(tmp_path):
+    path = tmp_path / "icons.sqlite"
+    with SqliteExporter(path) as exporter:
+        assert exporter.export({}, icons_with_aliases(["MobWifi4"]))["added"] == 2
+    assert alias_rows(path) == [("MobWifi4", "Wifi")]
+    with sqlite3.connect(path) as conn:
+        assert [name for name, _, _ in search(conn, "mobwifi4")] == ["Wifi"]
+
+    with SqliteExporter(path) as exporter:
+        stats = exporter.export({}, icons_with_aliases(["MobWifi3"]))
+    assert (stats["updated"], stats["unchanged"]) == (1, 1)
+    assert alias_rows(path) == [("MobWifi3", "Wifi")]
+    with sqlite3.connect(path) as conn:
+        assert search(conn, "mobwifi4") == []
+        assert [name for name, _, _ in search(conn, "mobwifi3")] == ["Wifi"]
@@ -0,0 +1,22 @@
+"""Tests for font_reader.py."""
+
+from pathlib import Path
+
+from font_reader import FontToolsFontReader, RawFontReader
+
+FONT_PATH = Path(__file__).parents[3] / "src" / "UI" / "Lemoo.UI" / "Resources" / "Fonts" / "Segoe Fluent Icons.ttf"
+
+
+def test_out_of_range_read_falls_back_to_fonttools(monkeypatch):
+    def truncated(gid, depth):
+        return b""[gid]
+
+    reader = RawFontReader(str(FONT_PATH))
+    reference = FontToolsFontReader(str(FONT_PATH))
+    try:
+        name = reader.get_glyph_order()[10]
+        monkeypatch.setattr(reader, "_decode_glyph", truncated)
+        assert reader.get_glyph_contours(name) == reference.get_glyph_contours(name)
+    finally:
+        reader.close()
+        reference.close()
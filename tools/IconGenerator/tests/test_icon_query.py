@@ -0,0 +1,43 @@
+"""Tests for icon_query.py."""
+
+import json
+
+from find_duplicates import apply_report, build_report
+from icon_query import QueryIndex, build_query_index
+
+
+def make_metadata():
+    icon = {"name": "Wifi", "unicode": "E701", "category": "communication", "verified": True,
+            "keywords": ["wireless"], "i18n": {"en": "Wifi", "zh": "无线网络"}}
+    duplicate = {"name": "MobWifi4", "unicode": "EC3F", "category": "communication",
+                 "keywords": ["signal"], "i18n": {"en": "MobWifi4"}}
+    other = {"name": "Back", "unicode": "E72B", "category": "navigation", "keywords": ["previous"]}
+    categories = [{"key": "communication", "name": "Communication", "name_zh": "通信", "priority": 4},
+                  {"key": "navigation", "name": "Navigation", "name_zh": "导航", "priority": 1}]
+    return {"categories": categories, "icons": [icon, duplicate, other]}
+
+
+def test_lookup_alias_after_deduplication():
+    metadata = make_metadata()
+    report = build_report({"hash": [0xE701, 0xEC3F]}, metadata["icons"])
+    assert apply_report(metadata, report) == 1
+    assert metadata["icons"][0]["aliases"] == ["MobWifi4"]
+
+    index = QueryIndex(build_query_index(metadata))
+    for key in ("MobWifi4", "mobwifi4", "Wifi"):
+        assert [index.documents[doc_id][1] for doc_id in index.lookup(key)] == ["Wifi"]
+    assert [index.documents[doc_id][1] for doc_id in index.find("name:mobw")] == ["Wifi"]
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    metadata_path = tmp_path / "IconMetadata.json"
+    metadata_path.write_text(json.dumps(make_metadata()), encoding='utf-8')
+    cache_dir = tmp_path / "cache"
+    QueryIndex.open(metadata_path, cache_dir)
+    (cache_file,) = cache_dir.iterdir()
+
+    for content in (cache_file.read_text(encoding='utf-8')[:100], "[]", '{"version": 2, "source": null}'):
+        cache_file.write_text(content, encoding='utf-8')
+        index = QueryIndex.open(metadata_path, cache_dir)
+        assert [index.documents[doc_id][1] for doc_id in index.lookup("E72B")] == ["Back"]
+        json.loads(cache_file.read_text(encoding='utf-8'))
@@ -0,0 +1,18 @@
+"""Tests for keywords.py."""
+
+from keywords import codepoint_query
+
+
+def test_codepoint_spellings():
+    for text in ("e72b", "E72B", "ue72b", "u+e72b", "\\ue72b", "0xE72B", " e72b "):
+        assert codepoint_query(text) == "E72B"
+
+
+def test_prefixed_codepoint_outside_private_use_area():
+    assert codepoint_query("0xface") == "FACE"
+    assert codepoint_query("u+1f600") == "1F600"
+
+
+def test_hex_words_are_not_codepoints():
+    for word in ("face", "feed", "decade", "added", "cafe", "beef", "e7", "back"):
+        assert codepoint_query(word) is None
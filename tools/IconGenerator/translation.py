@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Icon Name Translation
+
+Translates icon names with phrase dictionaries stored as TSV files in
+data/translations/ ('Name<TAB>翻译' per line, '#' comments). The
+dictionaries are compiled once into a token trie (see icon_text.py):
+
+1. An exact dictionary entry for the full name wins.
+2. Otherwise the longest dictionary phrase found in the name's tokens is
+   used, the leftmost one on ties ('ChevronLeftSmall' -> 'ChevronLeft').
+3. Otherwise the same, with plural tokens folded to the singular
+   ('Speakers' -> 'Speaker', 'DisableUpdates' -> 'Update').
+4. Names without any match translate to an empty string.
+
+Lookup cost depends on the length of the name, not the dictionary size,
+so large external dictionaries can be layered on top of the built-in one.
+
+Usage:
+    from translation import NameTranslator
+
+    translator = NameTranslator.load("zh", extra_dictionaries=["my_terms.tsv"])
+    translator.translate_all(["Back", "ChevronLeftSmall"])   # ['后退', '左箭头']
+"""
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from icon_text import TokenTrie, read_dictionary, split_name
+
+
+TRANSLATIONS_DIR = Path(__file__).parent / "data" / "translations"
+
+
+def fold_plural(token: str) -> str:
+    """
+    Fold a regular English plural token to its singular.
+
+    Only trailing 's' / 'es' are removed ('speakers' -> 'speaker',
+    'switches' -> 'switch'); 'ss' endings ('glass') and short tokens are
+    kept.
+
+    Args:
+        token: Lower-case name token
+
+    Returns:
+        Singular token (the token itself if it is not a regular plural)
+    """
+    if len(token) <= 3 or not token.endswith("s") or token.endswith("ss"):
+        return token
+    if token.endswith("es") and token[:-2].endswith(("s", "x", "z", "ch", "sh")):
+        return token[:-2]
+    return token[:-1]
+
+
+class NameTranslator:
+    """Compiled phrase dictionary for one language."""
+
+    def __init__(self, entries: Optional[Dict[str, str]] = None):
+        """
+        Initialize the translator.
+
+        Args:
+            entries: Name -> translation
+        """
+        self._exact: Dict[str, str] = {}
+        self._trie = TokenTrie()
+        self._memo: Dict[str, str] = {}
+        if entries:
+            self.update(entries)
+
+    @classmethod
+    def load(cls, language: str, extra_dictionaries: Iterable[Path] = ()) -> "NameTranslator":
+        """
+        Load the built-in dictionary for a language plus extra dictionaries.
+
+        Args:
+            language: Language code (data/translations/<language>.tsv)
+            extra_dictionaries: Further TSV files; their entries override earlier ones
+
+        Returns:
+            NameTranslator
+        """
+        translator = cls(read_dictionary(TRANSLATIONS_DIR / f"{language}.tsv"))
+        for path in extra_dictionaries:
+            translator.update(read_dictionary(Path(path)))
+        return translator
+
+    def update(self, entries: Dict[str, str]) -> None:
+        """
+        Add or replace dictionary entries.
+
+        Args:
+            entries: Name -> translation
+        """
+        for name, text in entries.items():
+            self._exact[name] = text
+            self._trie.add(split_name(name), text)
+        self._memo.clear()
+
+    def __len__(self) -> int:
+        return len(self._exact)
+
+    def translate(self, name: str) -> str:
+        """
+        Translate one icon name.
+
+        Args:
+            name: Icon name
+
+        Returns:
+            Translation, or an empty string if nothing matches
+        """
+        text = self._memo.get(name)
+        if text is None:
+            text = self._exact.get(name)
+            if text is None:
+                tokens = split_name(name)
+                # Plural folding is a fallback, so it never changes a translation found without it
+                match = (self._trie.longest_match(tokens)
+                         or self._trie.longest_match([fold_plural(token) for token in tokens]))
+                text = match[2] if match else ""
+            self._memo[name] = text
+        return text
+
+    def rule_fingerprint(self, name: str) -> str:
+        """
+        Describe the dictionary entries that apply to a name.
+
+        The translation of a name can only change when this value changes
+        (see metadata_manifest.py).
+
+        Args:
+            name: Icon name
+
+        Returns:
+            Exact entry and all phrase matches (with and without plural folding), as text
+        """
+        tokens = split_name(name)
+        return repr((self._exact.get(name), self._trie.find_all(tokens),
+                     self._trie.find_all([fold_plural(token) for token in tokens])))
+
+    def translate_all(self, names: Iterable[str]) -> List[str]:
+        """
+        Translate a batch of icon names.
+
+        Args:
+            names: Icon names
+
+        Returns:
+            Translations in input order
+        """
+        return [self.translate(name) for name in names]